@@ -24,6 +24,8 @@ from app.models import (
     Log,    
     Reminder
 )
+from app.models.note_search import is_note_search_object
+from app.models.tag import TAG_NAME_LOWER_INDEX
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -48,6 +50,16 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    # Created at startup, outside the metadata (see app.models.note_search)
+    if is_note_search_object(name, type_):
+        return False
+    # Expression index alembic cannot autogenerate on SQLite, also created at startup
+    if type_ == "index" and name == TAG_NAME_LOWER_INDEX.name:
+        return False
+    return True
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -73,6 +85,7 @@ def run_migrations_offline() -> None:
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         render_as_batch=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -95,6 +108,7 @@ async def run_migrations_online() -> None:
                 connection=sync_conn,
                 target_metadata=target_metadata,
                 render_as_batch=True,
+                include_object=include_object,
             )
         )
         await conn.run_sync(lambda sync_conn: context.run_migrations())
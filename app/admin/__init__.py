@@ -1,10 +1,11 @@
 from sqladmin import Admin
 from app.core.db_config import engine
-from app.admin.models import EmailSettingAdmin, UserAdmin,ProfileAdmin
+from app.admin.models import EmailSettingAdmin, UserAdmin,ProfileAdmin, TagAdmin
 
 
 def setup_admin(app):
     admin = Admin(app, engine)
     admin.add_view(UserAdmin)
     admin.add_view(ProfileAdmin)
-    admin.add_view(EmailSettingAdmin)
\ No newline at end of file
+    admin.add_view(EmailSettingAdmin)
+    admin.add_view(TagAdmin)
\ No newline at end of file
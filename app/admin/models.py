@@ -1,12 +1,34 @@
 from sqladmin import ModelView
-from app.models import User, Profile, EmailSetting
+from app.core.cache import tag_cache, user_cache
+from app.models import User, Profile, EmailSetting, Tag
 
 class UserAdmin(ModelView, model=User):
     column_list = [User.id, User.first_name, User.last_name, User.email, User.is_superuser]
 
+    async def after_model_change(self, data, model, is_created, request):
+        user_cache.invalidate(model.id)
+
+    async def after_model_delete(self, model, request):
+        user_cache.invalidate(model.id)
+
 class ProfileAdmin(ModelView, model=Profile):
     column_list = [Profile.id, Profile.bio, Profile.profile_picture_url, Profile.user]
 
+    async def after_model_change(self, data, model, is_created, request):
+        user_cache.invalidate(model.user_id)
+
+    async def after_model_delete(self, model, request):
+        user_cache.invalidate(model.user_id)
+
 class EmailSettingAdmin(ModelView, model=EmailSetting):
     column_list = [EmailSetting.id, EmailSetting.email, EmailSetting.password, EmailSetting.email_type, EmailSetting.port, EmailSetting.is_active, EmailSetting.user, EmailSetting.is_admin_mail]
 
+class TagAdmin(ModelView, model=Tag):
+    column_list = [Tag.id, Tag.name]
+
+    async def after_model_change(self, data, model, is_created, request):
+        # The old name of a renamed tag is gone by now
+        tag_cache.clear()
+
+    async def after_model_delete(self, model, request):
+        tag_cache.invalidate(model.name)
\ No newline at end of file
@@ -0,0 +1,38 @@
+import asyncio
+import typer
+from typing import Optional
+from sqlalchemy import select
+from app.core.db_config import get_db
+from app.models import Habit, HabitLog
+from app.repositories import HabitProgressRepository
+from app.repositories.habit_progress_repository import period_deltas
+
+
+def run(
+    habit_id: Optional[int] = typer.Option(None, help="Only rebuild this habit"),
+    batch_size: int = typer.Option(200, help="Habits per transaction"),
+):
+    """Rebuild the habit progress rollups from habit logs."""
+
+    async def backfill():
+        last_id, total = 0, 0
+        while True:
+            async for session in get_db():
+                query = select(Habit.id).where(Habit.id > last_id).order_by(Habit.id).limit(batch_size)
+                if habit_id is not None:
+                    query = query.where(Habit.id == habit_id)
+                habit_ids = (await session.execute(query)).scalars().all()
+                if habit_ids:
+                    logs = await session.execute(
+                        select(HabitLog.habit_id, HabitLog.completed_date).where(HabitLog.habit_id.in_(habit_ids))
+                    )
+                    repository = HabitProgressRepository(session)
+                    await repository.clear(habit_ids)
+                    await repository.apply(period_deltas(logs.all()))
+            if not habit_ids:
+                break
+            last_id = habit_ids[-1]
+            total += len(habit_ids)
+            typer.echo(f"Rebuilt progress rollups for {total} habit(s)")
+
+    asyncio.run(backfill())
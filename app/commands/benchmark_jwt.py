@@ -0,0 +1,50 @@
+import asyncio
+import time
+from datetime import timedelta
+import jwt
+import typer
+from app.core.cache import token_cache
+from app.core.settings import setting
+from app.core.security import create_access_token, decode_token
+
+
+def run(
+    iterations: int = typer.Option(20000, help="Verifications per mode"),
+    concurrency: int = typer.Option(50, help="Verifications awaited together"),
+):
+    """Compare inline, to_thread and cached verification of one access token."""
+
+    def decode(token: str) -> dict:
+        return jwt.decode(token, setting.SECRET_KEY, algorithms=[setting.ALGORITHM])
+
+    async def inline(token: str) -> dict:
+        return decode(token)
+
+    async def to_thread(token: str) -> dict:
+        return await asyncio.to_thread(decode, token)
+
+    async def cached(token: str) -> dict:
+        return decode_token(token)
+
+    async def measure(verify, token: str) -> float:
+        started = time.perf_counter()
+        for offset in range(0, iterations, concurrency):
+            batch = min(concurrency, iterations - offset)
+            await asyncio.gather(*(verify(token) for _ in range(batch)))
+        return time.perf_counter() - started
+
+    async def benchmark():
+        token = await create_access_token(
+            {"user_id": 1, "role": "user", "is_superuser": False, "is_active": True},
+            expires_delta=timedelta(minutes=10),
+        )
+        token_cache.clear()
+        typer.echo(f"{iterations} verifications, {concurrency} concurrent")
+        for name, verify in (("inline", inline), ("to_thread", to_thread), ("cached", cached)):
+            elapsed = await measure(verify, token)
+            typer.echo(
+                f"{name:<10} {elapsed:8.3f}s  {elapsed / iterations * 1e6:8.2f} us/op"
+                f"  {iterations / elapsed:10.0f} ops/s"
+            )
+
+    asyncio.run(benchmark())
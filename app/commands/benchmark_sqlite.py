@@ -0,0 +1,73 @@
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+import typer
+from sqlalchemy import Column, Integer, MetaData, String, Table, event, func, insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.db_config import sqlite_pragma_listener, sqlite_pragmas
+
+metadata = MetaData()
+bench_table = Table(
+    "bench_rows",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("payload", String(100), nullable=False),
+)
+
+
+def run(
+    seconds: float = typer.Option(5.0, help="Duration of each run"),
+    writers: int = typer.Option(4, help="Concurrent writer tasks"),
+    readers: int = typer.Option(16, help="Concurrent reader tasks"),
+):
+    """Concurrent read/write throughput with default vs tuned SQLite settings."""
+
+    async def workload(path: Path, pragmas: list[str]) -> tuple[int, int, int]:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{path}", pool_size=writers + readers, max_overflow=0
+        )
+        if pragmas:
+            event.listen(engine.sync_engine, "connect", sqlite_pragma_listener(pragmas))
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+
+        counts = {"writes": 0, "reads": 0, "errors": 0}
+        deadline = time.monotonic() + seconds
+
+        async def writer():
+            while time.monotonic() < deadline:
+                try:
+                    async with engine.begin() as conn:
+                        await conn.execute(insert(bench_table).values(payload="x" * 64))
+                    counts["writes"] += 1
+                except Exception:
+                    counts["errors"] += 1
+
+        async def reader():
+            while time.monotonic() < deadline:
+                try:
+                    async with engine.connect() as conn:
+                        await conn.execute(select(func.count()).select_from(bench_table))
+                    counts["reads"] += 1
+                except Exception:
+                    counts["errors"] += 1
+
+        await asyncio.gather(
+            *(writer() for _ in range(writers)), *(reader() for _ in range(readers))
+        )
+        await engine.dispose()
+        return counts["writes"], counts["reads"], counts["errors"]
+
+    async def benchmark():
+        typer.echo(f"{seconds}s per run, {writers} writers, {readers} readers")
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, pragmas in (("default", []), ("tuned", sqlite_pragmas())):
+                writes, reads, errors = await workload(Path(tmp) / f"{name}.db", pragmas)
+                typer.echo(
+                    f"{name:<8} writes/s {writes / seconds:9.0f}  reads/s {reads / seconds:9.0f}"
+                    f"  errors {errors}"
+                )
+
+    asyncio.run(benchmark())
@@ -0,0 +1,15 @@
+import asyncio
+import typer
+from app.core.db_config import engine
+from app.models.note_search import rebuild_note_search
+
+
+def run():
+    """Create the notes full-text index if missing and rebuild it from the notes table."""
+
+    async def rebuild():
+        async with engine.begin() as conn:
+            await conn.run_sync(rebuild_note_search)
+        typer.echo("Note search index rebuilt")
+
+    asyncio.run(rebuild())
@@ -0,0 +1,15 @@
+import asyncio
+import typer
+from app.core.db_config import get_db
+from app.repositories import TagRepository
+
+
+def run():
+    """Recount per-user tag usage (used to rank tag suggestions) from notes."""
+
+    async def rebuild():
+        async for session in get_db():
+            await TagRepository.rebuild_usage(session)
+        typer.echo("Tag usage rebuilt")
+
+    asyncio.run(rebuild())
@@ -0,0 +1,33 @@
+import asyncio
+import typer
+from typing import Optional
+from sqlalchemy import select
+from app.core.db_config import get_db
+from app.models import Habit
+from app.services.streak_service import StreakService
+
+
+def run(
+    habit_id: Optional[int] = typer.Option(None, help="Only recompute this habit"),
+    batch_size: int = typer.Option(500, help="Habits per transaction"),
+):
+    """Rebuild the stored habit streaks from habit logs."""
+
+    async def recompute():
+        last_id, total = 0, 0
+        while True:
+            async for session in get_db():
+                query = select(Habit).where(Habit.id > last_id).order_by(Habit.id).limit(batch_size)
+                if habit_id is not None:
+                    query = query.where(Habit.id == habit_id)
+                habits = (await session.execute(query)).scalars().all()
+                streaks = StreakService(session)
+                for habit in habits:
+                    await streaks.recompute(habit)
+            if not habits:
+                break
+            last_id = habits[-1].id
+            total += len(habits)
+            typer.echo(f"Recomputed streaks for {total} habit(s)")
+
+    asyncio.run(recompute())
@@ -0,0 +1,128 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Mapping, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db_config import on_commit
+from app.core.settings import setting
+
+
+class TTLCache:
+    """In-process LRU cache whose entries also expire after a TTL.
+
+    Meant to be used from the event loop only, so no locking is done.
+    A ``max_size`` or ``ttl`` of 0 disables the cache entirely.
+    """
+
+    def __init__(self, max_size: int, ttl: float, name: str = "cache"):
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        if not self.enabled:
+            return
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def invalidate_on_commit(session: AsyncSession, cache: TTLCache, key: Hashable) -> None:
+    """Drop ``key`` now and again once ``session`` commits.
+
+    The second pass stops a concurrent request from re-caching the old row
+    between the write and the end of the unit of work.
+    """
+    cache.invalidate(key)
+    event.listen(
+        session.sync_session, "after_commit", lambda _session: cache.invalidate(key), once=True
+    )
+
+
+def cache_on_commit(session: AsyncSession, cache: TTLCache, items: Mapping[Hashable, Any]) -> None:
+    """Cache ``items`` once ``session`` commits, for rows written in its transaction.
+
+    Nothing is cached if the transaction rolls back instead.
+    """
+    if not items or not cache.enabled:
+        return
+    items = dict(items)
+
+    def fill():
+        for key, value in items.items():
+            cache.set(key, value)
+
+    on_commit(session, fill)
+
+
+# Authenticated users keyed by user id, see verify_token_get_user
+user_cache = TTLCache(
+    max_size=setting.USER_CACHE_MAX_SIZE,
+    ttl=setting.USER_CACHE_TTL_SECONDS,
+    name="user",
+)
+
+# Verified JWT claims keyed by token digest, see app.core.security.decode_token
+token_cache = TTLCache(
+    max_size=setting.TOKEN_CACHE_MAX_SIZE,
+    ttl=setting.TOKEN_CACHE_TTL_SECONDS,
+    name="token",
+)
+
+# Tag ids keyed by tag name, see TagRepository.resolve_names
+tag_cache = TTLCache(
+    max_size=setting.TAG_CACHE_MAX_SIZE,
+    ttl=setting.TAG_CACHE_TTL_SECONDS,
+    name="tag",
+)
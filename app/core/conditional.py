@@ -0,0 +1,110 @@
+"""Conditional GET support: weak ETag and Last-Modified validators.
+
+Validators come from one aggregate query (row count and newest
+``updated_at``) over the rows a response is built from, plus the newest
+``updated_at`` of the rows it embeds, so a matching request is answered with
+a 304 before any data is loaded or serialized.
+"""
+import hashlib
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Iterable, Optional
+
+from fastapi import Request, Response, status
+from sqlalchemy import DateTime, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import Profile, User
+
+# updated_at only has one-second resolution on SQLite (CURRENT_TIMESTAMP), so
+# no validator is issued for rows changed within the last second
+SETTLE_TIME = timedelta(seconds=1)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # Weak comparison, see RFC 9110 section 13.1.2
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def newest(column, *criteria):
+    """Newest ``column`` value among the rows matching ``criteria``, for ``related``."""
+    return select(func.max(column)).where(*criteria).correlate(None).scalar_subquery()
+
+
+def user_validators(user_ids) -> list:
+    """``related`` entries for embedded users (UserBasicSchema, with the profile).
+
+    ``user_ids`` is a list or a SELECT of user ids.
+    """
+    return [
+        newest(User.updated_at, User.id.in_(user_ids)),
+        newest(Profile.updated_at, Profile.user_id.in_(user_ids)),
+    ]
+
+
+async def not_modified(
+    request: Request,
+    response: Response,
+    db: AsyncSession,
+    model,
+    *criteria,
+    vary: Iterable[Any] = (),
+    related: Iterable[Any] = (),
+    check_modified_since: bool = False,
+) -> Optional[Response]:
+    """Set the validators of the ``model`` rows matching ``criteria`` on ``response``.
+
+    Returns a 304 response when the request's If-None-Match (or, with
+    ``check_modified_since``, If-Modified-Since) shows the client's copy is
+    current; the route returns it instead of its body. ``vary`` lists
+    anything else the body depends on; ``related`` holds ``newest`` scalar
+    subqueries over the rows the body embeds (other users, categories, ...),
+    or other scalars such as counts, evaluated in the same query. If-Modified-Since misses deletions, so it is
+    only worth checking for single rows.
+    """
+    now = func.now() if db.get_bind().dialect.name == "sqlite" else cast(func.now(), DateTime)
+    result = await db.execute(select(func.count(), func.max(model.updated_at), now, *related).where(*criteria))
+    count, base_modified, db_now, *related_modified = result.one()
+    if count == 0:
+        # Nothing to validate; If-None-Match: * must not turn a 404 into a 304
+        return None
+    modified = [value for value in (base_modified, *related_modified) if isinstance(value, datetime)]
+    last_modified = max(modified, default=None)
+    if last_modified is not None and db_now - last_modified < SETTLE_TIME:
+        return None
+
+    key = (
+        model.__tablename__, request.url.path, request.url.query,
+        count, base_modified, *related_modified, *vary,
+    )
+    etag = f'W/"{hashlib.blake2b(repr(key).encode(), digest_size=12).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if last_modified is not None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        current = _etag_matches(if_none_match, etag)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        current = (
+            check_modified_since
+            and if_modified_since is not None
+            and last_modified is not None
+            and _not_modified_since(if_modified_since, last_modified)
+        )
+    if current:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
@@ -1,15 +1,99 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Callable, Optional
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine, AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import MetaData
+from sqlalchemy import MetaData, event
 
 from app.core.settings import setting
+from app.core.db_pool import InstrumentedAsyncQueuePool
+from app.core.db_instrumentation import instrument_engine
 
-engine : AsyncEngine = create_async_engine(setting.DATABASE_URL, echo=True if setting.ENV == "development" else False)
+
+def engine_options(name: str) -> dict:
+    return {
+        "echo": True if setting.ENV == "development" else False,
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_logging_name": name,
+        "pool_size": setting.DB_POOL_SIZE,
+        "max_overflow": setting.DB_MAX_OVERFLOW,
+        "pool_pre_ping": setting.DB_POOL_PRE_PING,
+        "pool_recycle": setting.DB_POOL_RECYCLE,
+        "pool_timeout": setting.DB_POOL_TIMEOUT,
+    }
+
+
+def sqlite_pragmas(read_only: bool = False) -> list[str]:
+    journal_mode = setting.SQLITE_JOURNAL_MODE.upper()
+    synchronous = setting.SQLITE_SYNCHRONOUS.upper()
+    temp_store = setting.SQLITE_TEMP_STORE.upper()
+    if journal_mode not in ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"):
+        raise ValueError(f"Invalid SQLITE_JOURNAL_MODE: {journal_mode}")
+    if synchronous not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+        raise ValueError(f"Invalid SQLITE_SYNCHRONOUS: {synchronous}")
+    if temp_store not in ("DEFAULT", "FILE", "MEMORY"):
+        raise ValueError(f"Invalid SQLITE_TEMP_STORE: {temp_store}")
+
+    # journal_mode and synchronous are owned by the writer connections
+    writer_pragmas = [] if read_only else [
+        f"PRAGMA journal_mode={journal_mode}",
+        f"PRAGMA synchronous={synchronous}",
+    ]
+    return writer_pragmas + [
+        f"PRAGMA busy_timeout={int(setting.SQLITE_BUSY_TIMEOUT_MS)}",
+        f"PRAGMA mmap_size={int(setting.SQLITE_MMAP_SIZE)}",
+        f"PRAGMA cache_size={int(setting.SQLITE_CACHE_SIZE)}",
+        f"PRAGMA temp_store={temp_store}",
+    ]
+
+
+def sqlite_pragma_listener(pragmas: list[str]) -> Callable:
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+    return apply_pragmas
+
+
+def tune_sqlite(async_engine: AsyncEngine, read_only: bool = False) -> None:
+    if async_engine.dialect.name == "sqlite" and setting.SQLITE_TUNING:
+        event.listen(
+            async_engine.sync_engine,
+            "connect",
+            sqlite_pragma_listener(sqlite_pragmas(read_only=read_only)),
+        )
+
+
+engine : AsyncEngine = create_async_engine(setting.DATABASE_URL, **engine_options("primary"))
+tune_sqlite(engine)
+instrument_engine(engine)
+
+
+def read_database_url() -> Optional[str]:
+    if setting.READ_DATABASE_URL:
+        return setting.READ_DATABASE_URL
+    if setting.SQLITE_READ_POOL and engine.dialect.name == "sqlite":
+        # Second, read-only pool on the same file; with WAL readers never block the writer
+        return f"{engine.url.drivername}:///file:{engine.url.database}?mode=ro&uri=true"
+    return None
+
+
+_read_url = read_database_url()
+if _read_url:
+    read_engine: AsyncEngine = create_async_engine(_read_url, **engine_options("read"))
+    tune_sqlite(read_engine, read_only=True)
+    instrument_engine(read_engine)
+else:
+    read_engine = engine
 
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+ReadSessionLocal = async_sessionmaker(read_engine, expire_on_commit=False, class_=AsyncSession)
 
 class Base(AsyncAttrs, DeclarativeBase):
+    # Fetch SQL generated columns (created_at, updated_at, ...) with
+    # INSERT/UPDATE ... RETURNING instead of a refresh() round trip
+    __mapper_args__ = {"eager_defaults": True}
+
     metadata = MetaData(
         naming_convention={
             "ix": "ix_%(column_0_label)s",
@@ -21,6 +105,56 @@ class Base(AsyncAttrs, DeclarativeBase):
         }
     )
 
+
+def insert_for(session: AsyncSession, model):
+    """Dialect specific INSERT, which adds ON CONFLICT support.
+
+    Upserts and RETURNING writes across the repositories go through this, so
+    SQLite (3.35+) and PostgreSQL are the only supported databases.
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Only SQLite and PostgreSQL are supported, not {dialect}")
+    return insert(model)
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Request-scoped unit of work.
+
+    Repositories only flush; the request commits once here when the handler
+    succeeds and rolls back when it raises. Depend on it with
+    ``Depends(get_db, scope="function")`` so the commit happens before the
+    response is sent.
+    """
     async with AsyncSessionLocal() as session:
-        yield session
\ No newline at end of file
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
+async def commit_early(session: AsyncSession) -> None:
+    """Opt-in commit for work that must persist even if the request fails later."""
+    await session.commit()
+
+
+def on_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run ``callback`` once ``session`` commits; it is dropped if the session rolls back first."""
+    rolled_back = False
+
+    def after_commit(_session):
+        if not rolled_back:
+            callback()
+
+    def after_rollback(_session):
+        nonlocal rolled_back
+        rolled_back = True
+
+    event.listen(session.sync_session, "after_commit", after_commit, once=True)
+    event.listen(session.sync_session, "after_rollback", after_rollback, once=True)
@@ -0,0 +1,67 @@
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.logger_config import logger
+from app.core.settings import setting
+
+
+class QueryStats:
+    """Statements executed while serving one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.statements: Counter[str] = Counter()
+
+    def observe(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.statements[statement] += 1
+
+    @property
+    def total_ms(self) -> float:
+        return round(self.total * 1000, 3)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Identical statements run at least ``threshold`` times, most frequent first."""
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= threshold]
+
+
+# Set by the query stats middleware; None outside of a request (CLI, admin, ...)
+request_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+
+    stats = request_query_stats.get()
+    if stats is not None:
+        stats.observe(statement, elapsed)
+
+    if elapsed * 1000 >= setting.SLOW_QUERY_MS:
+        logger.warning(f"Slow query ({elapsed * 1000:.1f} ms): {' '.join(statement.split())}")
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute is skipped for failed statements, keep the stack balanced
+    started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def instrument_engine(async_engine: AsyncEngine) -> None:
+    if not setting.SQL_INSTRUMENTATION:
+        return
+    sync_engine = async_engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
@@ -0,0 +1,57 @@
+import time
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.logger_config import logger
+from app.core.metrics import DurationStats
+
+
+class PoolMetrics:
+    def __init__(self):
+        self.wait = DurationStats()
+        self.timeouts = 0
+
+    def stats(self) -> dict:
+        return {"checkout_wait": self.wait.stats(), "timeouts": self.timeouts}
+
+
+# Keyed by the engine's pool_logging_name, so they survive pool.recreate()
+pool_metrics: dict[str, PoolMetrics] = {}
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait time and timeouts."""
+
+    @property
+    def metrics(self) -> PoolMetrics:
+        name = self._orig_logging_name or "default"
+        return pool_metrics.setdefault(name, PoolMetrics())
+
+    def _do_get(self):
+        started = time.monotonic()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            logger.warning(f"Database pool exhausted ({self._orig_logging_name}): {self.status()}")
+            raise
+        finally:
+            self.metrics.wait.observe(time.monotonic() - started)
+
+
+def pool_status(engine: AsyncEngine) -> dict:
+    pool = engine.pool
+    data = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        data.update(
+            size=pool.size(),
+            max_overflow=pool._max_overflow,
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            timeout_seconds=pool.timeout(),
+        )
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        data.update(pool.metrics.stats())
+    return data
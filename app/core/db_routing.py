@@ -0,0 +1,49 @@
+from typing import AsyncGenerator, Optional
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.db_config import AsyncSessionLocal, ReadSessionLocal, engine, read_engine
+from app.core.security import decode_token
+from app.core.settings import setting
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# User ids that wrote recently; their reads stay on the primary until the entry expires
+recent_writers = TTLCache(
+    max_size=100_000,
+    ttl=setting.READ_YOUR_WRITES_SECONDS,
+    name="recent_writers",
+)
+
+
+def has_read_replica() -> bool:
+    return read_engine is not engine
+
+
+def request_user_id(request: Request) -> Optional[int]:
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return decode_token(token).get("user_id")
+    except Exception:
+        return None
+
+
+def mark_recent_write(request: Request) -> None:
+    user_id = request_user_id(request)
+    if user_id is not None:
+        recent_writers.set(user_id, True)
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only endpoints, served by the read replica when configured."""
+    session_factory = ReadSessionLocal
+    if has_read_replica():
+        user_id = request_user_id(request)
+        if user_id is not None and recent_writers.get(user_id):
+            session_factory = AsyncSessionLocal
+
+    async with session_factory() as session:
+        yield session
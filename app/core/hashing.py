@@ -0,0 +1,114 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from passlib.context import CryptContext
+from starlette import status
+
+from app.core.metrics import DurationStats
+from app.core.settings import setting
+from app.utils.common import CustomException
+
+pwd_content = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+THREAD_EXECUTOR = "thread"
+PROCESS_EXECUTOR = "process"
+
+
+def _run_timed(operation: str, *args) -> tuple[float, float, object]:
+    # Runs inside the worker. time.monotonic is system wide on the platforms we
+    # deploy to, so the start time is comparable with the submit time even
+    # when the worker is another process.
+    started = time.monotonic()
+    if operation == "hash":
+        result = pwd_content.hash(*args)
+    else:
+        result = pwd_content.verify(*args)
+    return started, time.monotonic(), result
+
+
+class PasswordHasher:
+    """Runs bcrypt on a dedicated pool with a bounded number of pending jobs.
+
+    bcrypt is deliberately slow, so it must not share the default executor
+    used by asyncio.to_thread. When ``workers + max_queue`` jobs are already
+    in flight new requests fail fast with 503 instead of queueing up.
+    """
+
+    def __init__(self, mode: str, workers: int, max_queue: int):
+        if mode not in (THREAD_EXECUTOR, PROCESS_EXECUTOR):
+            raise ValueError(f"Unknown password hash executor: {mode}")
+        self.mode = mode
+        self.workers = workers
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.rejected = 0
+        self.queue_wait = DurationStats()
+        self.hash_duration = DurationStats()
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == PROCESS_EXECUTOR:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    async def _submit(self, operation: str, *args):
+        if self.in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise CustomException(
+                "Server is busy, please try again shortly",
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+
+        self.in_flight += 1
+        submitted = time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+            started, finished, result = await loop.run_in_executor(
+                self._get_executor(), _run_timed, operation, *args
+            )
+        finally:
+            self.in_flight -= 1
+
+        self.queue_wait.observe(started - submitted)
+        self.hash_duration.observe(finished - started)
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._submit("hash", password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit("verify", plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "rejected": self.rejected,
+            "queue_wait": self.queue_wait.stats(),
+            "hash_duration": self.hash_duration.stats(),
+        }
+
+
+password_hasher = PasswordHasher(
+    mode=setting.PASSWORD_HASH_EXECUTOR,
+    workers=setting.PASSWORD_HASH_WORKERS,
+    max_queue=setting.PASSWORD_HASH_MAX_QUEUE,
+)
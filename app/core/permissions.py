@@ -1,20 +1,55 @@
 from fastapi import Depends
-from app.core.security import verify_token_get_user
+from app.core.security import (
+    TokenPrincipal,
+    verify_token_get_principal,
+    verify_token_get_user,
+)
 from app.models import User
 from app.models.enums import UserRole
 from app.utils.common import CustomException
 
 
+def _is_admin(subject: User | TokenPrincipal) -> bool:
+    return subject.is_superuser or subject.role == UserRole.ADMIN
+
+
+# Principal based permissions: built from token claims, no database access.
+
+async def only_admin_principal(
+    principal: TokenPrincipal = Depends(verify_token_get_principal),
+) -> TokenPrincipal:
+    if _is_admin(principal):
+        return principal
+
+    raise CustomException("You are not allowed to perform this action", status_code=403)
+
+async def only_user_principal(
+    principal: TokenPrincipal = Depends(verify_token_get_principal),
+) -> TokenPrincipal:
+    if principal.role == UserRole.USER:
+        return principal
+
+    raise CustomException("You are not allowed to perform this action", status_code=403)
+
+
+async def any_principal(
+    principal: TokenPrincipal = Depends(verify_token_get_principal),
+) -> TokenPrincipal:
+    return principal
+
+
+# ORM based permissions: for handlers that need the full user row.
+
 async def only_admin(user: User = Depends(verify_token_get_user)):
-    if user.is_superuser or user.role == UserRole.ADMIN:
+    if _is_admin(user):
         return user
-    
+
     raise CustomException("You are not allowed to perform this action", status_code=403)
 
 async def only_user(user: User = Depends(verify_token_get_user)):
     if user.role == UserRole.USER:
         return user
-    
+
     raise CustomException("You are not allowed to perform this action", status_code=403)
 
 
@@ -1,5 +1,6 @@
-from passlib.context import CryptContext
 import asyncio
+import hashlib
+import time
 from fastapi.security import OAuth2PasswordBearer
 from fastapi import Depends
 from typing import Optional, Annotated
@@ -9,20 +10,68 @@ import jwt
 from app.core.settings import setting
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.db_config import get_db
+from app.core.cache import token_cache, user_cache
+from app.core.hashing import password_hasher
 from app.models import User
+from app.models.enums import UserRole
 from app.repositories import UserRepository
 
 
-pwd_content = CryptContext(schemes=["bcrypt"], deprecated="auto")
+PRINCIPAL_CLAIMS = ("user_id", "role", "is_superuser", "is_active")
+
+
+class TokenPrincipal:
+    """Authenticated caller built from verified access token claims."""
+
+    __slots__ = ("id", "role", "is_superuser", "is_active")
+
+    def __init__(self, id: int, role: UserRole, is_superuser: bool, is_active: bool):
+        self.id = id
+        self.role = role
+        self.is_superuser = is_superuser
+        self.is_active = is_active
+
+    @classmethod
+    def from_claims(cls, payload: dict) -> "TokenPrincipal":
+        return cls(
+            id=payload["user_id"],
+            role=UserRole(payload["role"]),
+            is_superuser=bool(payload["is_superuser"]),
+            is_active=bool(payload["is_active"]),
+        )
+
+    @classmethod
+    def from_user(cls, user: User) -> "TokenPrincipal":
+        return cls(
+            id=user.id,
+            role=user.role,
+            is_superuser=bool(user.is_superuser),
+            is_active=bool(user.is_active),
+        )
+
+    def __repr__(self) -> str:
+        return f"<TokenPrincipal(id={self.id}, role={self.role})>"
+
+
+def user_token_claims(user: User) -> dict:
+    """Claims embedded in access tokens so authorization can skip the database."""
+    return {
+        "user_id": user.id,
+        "role": user.role.value,
+        "is_superuser": bool(user.is_superuser),
+        "is_active": bool(user.is_active),
+    }
+
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 
 
 async def hash_password(password: str) -> str:
-    return await asyncio.to_thread(pwd_content.hash, password)
+    return await password_hasher.hash(password)
 
 
 async def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return await asyncio.to_thread(pwd_content.verify, plain_password, hashed_password)
+    return await password_hasher.verify(plain_password, hashed_password)
 
 
 async def create_access_token(
@@ -52,11 +101,24 @@ async def create_refresh_token(
         jwt.encode, to_encode, setting.SECRET_KEY, algorithm=setting.ALGORITHM
     )
 
+def decode_token(token: str) -> dict:
+    """Verify and decode a JWT, reusing claims of tokens verified before.
+
+    HS256 verification of a short token is cheaper than a thread hop, so
+    misses decode inline. Cached claims expire no later than the token.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is None:
+        payload = jwt.decode(token, setting.SECRET_KEY, algorithms=[setting.ALGORITHM])
+        exp = payload.get("exp")
+        token_cache.set(key, payload, ttl=exp - time.time() if exp is not None else None)
+    return dict(payload)
+
+
 async def verify_refresh_token(token: str) -> dict:
     try:
-        payload = await asyncio.to_thread(
-            jwt.decode, token, setting.SECRET_KEY, algorithms=[setting.ALGORITHM]
-        )
+        payload = decode_token(token)
         if payload.get("token_type") != "refresh":
             raise CustomException("Invalid token type", status_code=401)
         user_id: int = payload.get("user_id")
@@ -69,23 +131,57 @@ async def verify_refresh_token(token: str) -> dict:
         raise CustomException(f"Token is invalid: {e}", status_code=401)
 
 
-async def verify_token_get_user(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    token: str = Depends(oauth2_scheme),
-)->User:
+async def verify_access_token(token: str) -> dict:
     try:
-        payload = await asyncio.to_thread(
-            jwt.decode, token, setting.SECRET_KEY, algorithms=[setting.ALGORITHM]
-        )
+        payload = decode_token(token)
         if payload.get("token_type") != "access":
             raise CustomException("Invalid token type", status_code=401)
         user_id: int = payload.get("user_id")
         if user_id is None:
             raise CustomException("Token is missing user id", status_code=401)
-        
-        return await UserRepository.get_user_by_id(user_id, db)
-    
+        return payload
     except jwt.ExpiredSignatureError:
         raise CustomException("Token has expired", status_code=401)
     except jwt.PyJWTError as e:
-        raise CustomException(f"Token is invalid: {e}", status_code=401)
\ No newline at end of file
+        raise CustomException(f"Token is invalid: {e}", status_code=401)
+
+
+async def get_cached_user(user_id: int, db: AsyncSession) -> Optional[User]:
+    user = user_cache.get(user_id)
+    if user is None:
+        user = await UserRepository.get_user_by_id(user_id, db)
+        if user is not None:
+            # Detach so the cached instance is not bound to this request's session
+            db.expunge(user)
+            user_cache.set(user_id, user)
+    return user
+
+
+async def verify_token_get_user(
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
+    token: str = Depends(oauth2_scheme),
+)->User:
+    payload = await verify_access_token(token)
+    return await get_cached_user(payload["user_id"], db)
+
+
+async def verify_token_get_principal(
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
+    token: str = Depends(oauth2_scheme),
+) -> TokenPrincipal:
+    """Authenticate from the token claims alone, without loading the user row.
+
+    Tokens issued before the claims were embedded fall back to the user lookup.
+    """
+    payload = await verify_access_token(token)
+    if all(claim in payload for claim in PRINCIPAL_CLAIMS):
+        principal = TokenPrincipal.from_claims(payload)
+    else:
+        user = await get_cached_user(payload["user_id"], db)
+        if user is None:
+            raise CustomException("User not found", status_code=401)
+        principal = TokenPrincipal.from_user(user)
+
+    if not principal.is_active:
+        raise CustomException("User is inactive", status_code=401)
+    return principal
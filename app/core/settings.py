@@ -17,8 +17,60 @@ class Settings(BaseSettings):
 
     SQLITE_PATH: Path = BASE_DIR /  "db" / "dev.db"
 
+    # Optional read replica used by get_read_db
+    READ_DATABASE_URL: Optional[str] = None
+    # SQLite stand-in for a replica: a second read-only pool on the same WAL database
+    SQLITE_READ_POOL: bool = False
+    # Reads go to the primary for this long after the caller wrote something
+    READ_YOUR_WRITES_SECONDS: int = 5
+
+    # SQLite tuning applied on every new connection (see db_config.sqlite_pragmas)
+    SQLITE_TUNING: bool = True
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    # Negative values are KiB, positive values are pages
+    SQLITE_CACHE_SIZE: int = -64000
+    SQLITE_TEMP_STORE: str = "MEMORY"
+
+    # Connection pool
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_TIMEOUT: int = 30
+
+    # Per-request SQL statement counts/timings (see db_instrumentation)
+    SQL_INSTRUMENTATION: bool = True
+    SLOW_QUERY_MS: int = 200
+    # Identical statements repeated this often in one request are logged as a likely N+1
+    N_PLUS_ONE_THRESHOLD: int = 5
+
+    # Streaming habit export/import
+    HABIT_EXPORT_YIELD_PER: int = 1000
+    HABIT_IMPORT_BATCH_SIZE: int = 1000
+
+    # Text search configuration of the Postgres notes.search_vector column
+    NOTE_SEARCH_LANGUAGE: str = "english"
+    # Characters of the description returned in note lists, 0 leaves it out
+    NOTE_EXCERPT_LENGTH: int = 200
+    # Every Nth note revision is a full snapshot, the rest are deltas; bounds the
+    # deltas applied to rebuild a version
+    NOTE_REVISION_SNAPSHOT_INTERVAL: int = 20
+
     MEDIA_ROOT: Path = BASE_DIR / "media"
 
+    # Reminder scheduler, see app.services.reminder_scheduler
+    REMINDER_SCHEDULER_ENABLED: bool = True
+    # Pending reminders due within this window are held in memory
+    REMINDER_LOOKAHEAD_SECONDS: int = 300
+    REMINDER_MAX_LOADED: int = 10000
+    # Reminders claimed and notified per transaction
+    REMINDER_BATCH_SIZE: int = 500
+    # Reminders missed by more than this (e.g. while the app was down) are marked, not notified
+    REMINDER_MAX_DELAY_SECONDS: int = 3600
+
     # SMTP settings
     EMAIL_TYPE: Optional[str] = None
     EMAIL_HOST_NAME: Optional[str] = None
@@ -29,6 +81,24 @@ class Settings(BaseSettings):
     CSRF_ORIGINS: List[AnyHttpUrl] = []
     MAX_FILE_MEMORY_SIZE: int = 2 * 1024 * 1024
 
+    # Authenticated user cache (0 disables it)
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 1024
+
+    # Verified JWT claims cache, entries never outlive the token's exp (0 disables it)
+    TOKEN_CACHE_TTL_SECONDS: int = 300
+    TOKEN_CACHE_MAX_SIZE: int = 4096
+
+    # Tag name -> id cache used by note writes (0 disables it)
+    TAG_CACHE_TTL_SECONDS: int = 300
+    TAG_CACHE_MAX_SIZE: int = 4096
+
+    # Dedicated bcrypt pool: "thread" or "process"
+    PASSWORD_HASH_EXECUTOR: str = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    # Jobs allowed to wait for a worker before requests get a 503
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+
     def model_post_init(self, __context) -> None:
         if self.ENV == "development":
             object.__setattr__(self, "DATABASE_URL", f"sqlite+aiosqlite:///{self.SQLITE_PATH}")
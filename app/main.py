@@ -1,18 +1,39 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.admin import setup_admin
 from app.utils.common import CustomException
-from app.middlewares import exception_handler
+from app.middlewares import exception_handler, query_stats, read_your_writes
 from app.routes.v1 import router as v1_router
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.settings import setting
 from starlette.formparsers import MultiPartParser
+from app.core.hashing import password_hasher
+from app.core.db_routing import has_read_replica
+from app.core.db_config import engine
+from app.models.note_search import ensure_note_search
+from app.models.tag import ensure_tag_name_index
+from app.services.reminder_scheduler import reminder_scheduler
 
 MultiPartParser.max_part_size = setting.MAX_FILE_MEMORY_SIZE
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Database objects that alembic migrations do not create
+    async with engine.begin() as conn:
+        await conn.run_sync(ensure_note_search)
+        await conn.run_sync(ensure_tag_name_index)
+    if setting.REMINDER_SCHEDULER_ENABLED:
+        reminder_scheduler.start()
+    yield
+    await reminder_scheduler.stop()
+    password_hasher.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -22,9 +43,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if setting.SQL_INSTRUMENTATION:
+    app.middleware("http")(query_stats.query_stats_middleware)
+
+if has_read_replica():
+    app.middleware("http")(read_your_writes.read_your_writes_middleware)
+
 app.add_exception_handler(CustomException, exception_handler.custom_exception_handler)
 app.add_exception_handler(RequestValidationError, exception_handler.custom_validation_error_handler)
 app.add_exception_handler(HTTPException, exception_handler.http_exception_handler)
+app.add_exception_handler(PoolTimeoutError, exception_handler.pool_timeout_handler)
 app.add_exception_handler(Exception, exception_handler.unhandled_exception_handler)
 
 setup_admin(app)
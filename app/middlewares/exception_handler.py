@@ -7,6 +7,7 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from fastapi.exceptions import RequestValidationError
 from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY
 from fastapi.encoders import jsonable_encoder
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
 
 async def custom_exception_handler(request: Request, exc: CustomException):
@@ -30,6 +31,18 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     )
 
 
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    logger.error(f"{request.method} {request.url} - database pool timeout - {exc}")
+    return JSONResponse(
+        status_code=503,
+        content={
+            "message": "Database is busy, please try again shortly",
+            "error_type": "server_error",
+            "success": False,
+        },
+    )
+
+
 async def unhandled_exception_handler(request: Request, exc: Exception):
     logger.error(f"{request.method} {request.url} - {exc} - unhandled exception")
     return JSONResponse(
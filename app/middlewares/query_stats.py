@@ -0,0 +1,25 @@
+from fastapi import Request
+
+from app.core.db_instrumentation import QueryStats, request_query_stats
+from app.core.logger_config import logger
+from app.core.settings import setting
+
+
+async def query_stats_middleware(request: Request, call_next):
+    stats = QueryStats()
+    token = request_query_stats.set(stats)
+    try:
+        response = await call_next(request)
+    finally:
+        request_query_stats.reset(token)
+
+    for statement, times in stats.repeated(setting.N_PLUS_ONE_THRESHOLD):
+        logger.warning(
+            f"Possible N+1 on {request.method} {request.url.path}: "
+            f"statement ran {times} times: {' '.join(statement.split())}"
+        )
+
+    if setting.ENV == "development":
+        response.headers["X-DB-Query-Count"] = str(stats.count)
+        response.headers["X-DB-Time-ms"] = f"{stats.total_ms:.3f}"
+    return response
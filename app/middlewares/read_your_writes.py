@@ -0,0 +1,10 @@
+from fastapi import Request
+
+from app.core.db_routing import SAFE_METHODS, mark_recent_write
+
+
+async def read_your_writes_middleware(request: Request, call_next):
+    response = await call_next(request)
+    if request.method not in SAFE_METHODS and response.status_code < 400:
+        mark_recent_write(request)
+    return response
@@ -1,9 +1,10 @@
 from app.models.user import User, TempUserOTP, EmailSetting
 from app.models.profile import Profile
-from app.models.note import Note
-from app.models.tag import Tag
+from app.models.note import Note, NoteRevision
+from app.models import note_search  # noqa: F401  registers the full-text index DDL
+from app.models.tag import Tag, UserTagUsage
 from app.models.association import note_tag_table
-from app.models.habit import Habit, HabitLog
+from app.models.habit import Habit, HabitLog, HabitProgressRollup
 from app.models.common import HabitCategory
 from app.models.notification import Notification
 from app.models.log import Log
@@ -15,11 +16,14 @@ __all__ = [
     "TempUserOTP",
     "EmailSetting",
     "Note",
+    "NoteRevision",
     "Tag",
+    "UserTagUsage",
     "note_tag_table",
     "Habit",
     "HabitCategory",
     "HabitLog",
+    "HabitProgressRollup",
     "Notification",
     "Log",
     "Reminder",
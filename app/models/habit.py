@@ -1,9 +1,10 @@
 from datetime import datetime, date
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.db_config import Base
-from sqlalchemy import DateTime, Integer, String, func, ForeignKey, Enum, Date
-from typing import TYPE_CHECKING, List
+from sqlalchemy import DateTime, Integer, String, func, ForeignKey, Enum, Date, Index, UniqueConstraint
+from typing import TYPE_CHECKING, List, Optional
 from app.models.enums import FrequencyType
+from app.utils.habit_periods import period_start, previous_period
 
 if TYPE_CHECKING:
     from app.models.common import HabitCategory
@@ -13,6 +14,10 @@ if TYPE_CHECKING:
 
 class Habit(Base):
     __tablename__ = "habits"
+    __table_args__ = (
+        # Conditional GET validators, see app.core.conditional
+        Index("ix_habits_user_id_updated_at", "user_id", "updated_at"),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(nullable=True)
@@ -32,6 +37,12 @@ class Habit(Base):
     )
     frequency_count: Mapped[int] = mapped_column(Integer, nullable=False)
 
+    # Maintained by StreakService on every habit log write, see app.utils.habit_periods
+    streak_current: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    streak_longest: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    # Start of the latest period that met the target, i.e. where streak_current ends
+    streak_last_period: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=func.now(), index=True
     )
@@ -45,6 +56,26 @@ class Habit(Base):
     system_logs: Mapped[List["Log"]] = relationship(
         "Log", back_populates="habit", cascade="all, delete-orphan"
     )
+    progress_rollups: Mapped[List["HabitProgressRollup"]] = relationship(
+        "HabitProgressRollup", cascade="all, delete-orphan"
+    )
+
+    @property
+    def current_streak(self) -> int:
+        return self.streak_on(date.today())
+
+    def streak_on(self, day: date) -> int:
+        """Stored streak, or 0 once a whole period before ``day`` has passed without meeting the target."""
+        if self.streak_last_period is None:
+            return 0
+        current = period_start(day, self.frequency_type)
+        if self.streak_last_period >= previous_period(current, self.frequency_type):
+            return self.streak_current
+        return 0
+
+    @property
+    def longest_streak(self) -> int:
+        return self.streak_longest
 
     def __repr__(self):
         return f"<Habit(id={self.id}, title={self.title}, category_id={self.category_id}, user_id={self.user_id})>"
@@ -52,6 +83,10 @@ class Habit(Base):
 
 class HabitLog(Base):
     __tablename__ = "habit_logs"
+    __table_args__ = (
+        # One log per habit per day; bulk inserts rely on it for ON CONFLICT DO NOTHING
+        UniqueConstraint("habit_id", "completed_date", name="uq_habit_logs_habit_id_completed_date"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     habit_id: Mapped[int] = mapped_column(
@@ -65,4 +100,26 @@ class HabitLog(Base):
     habit: Mapped["Habit"] = relationship("Habit", back_populates="logs")
 
     def __repr__(self):
-        return f"<HabitLog(id={self.id}, habit_id={self.habit_id}, date={self.date})>"
+        return f"<HabitLog(id={self.id}, habit_id={self.habit_id}, date={self.completed_date})>"
+
+
+class HabitProgressRollup(Base):
+    """Completed log count per habit and period, kept in step with habit_logs.
+
+    Every log counts towards its day, its ISO week and its month
+    (``period_type``), see HabitProgressRepository.apply.
+    """
+    __tablename__ = "habit_progress_rollups"
+
+    habit_id: Mapped[int] = mapped_column(
+        ForeignKey("habits.id", ondelete="CASCADE"), primary_key=True
+    )
+    period_type: Mapped[FrequencyType] = mapped_column(Enum(FrequencyType), primary_key=True)
+    period_start: Mapped[date] = mapped_column(Date, primary_key=True)
+    completed_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<HabitProgressRollup(habit_id={self.habit_id}, period_type={self.period_type}, "
+            f"period_start={self.period_start}, completed_count={self.completed_count})>"
+        )
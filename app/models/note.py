@@ -1,7 +1,7 @@
 from datetime import datetime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.db_config import Base
-from sqlalchemy import DateTime, Integer, String, ForeignKey, func
+from sqlalchemy import Boolean, DateTime, Index, Integer, LargeBinary, String, ForeignKey, UniqueConstraint, func
 from typing import TYPE_CHECKING, List
 from app.models.association import note_tag_table
 
@@ -15,6 +15,10 @@ CASCADE_DELETE_ORPHAN = "all, delete-orphan"
 
 class Note(Base):
     __tablename__ = "notes"
+    __table_args__ = (
+        # Backs the newest-first keyset pagination of a user's notes
+        Index("ix_notes_user_id_updated_at_id", "user_id", "updated_at", "id"),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(nullable=True)
@@ -37,5 +41,35 @@ class Note(Base):
         "Log", back_populates="note", cascade=CASCADE_DELETE_ORPHAN
     )
 
+    @property
+    def tag_ids(self) -> List[int]:
+        return [tag.id for tag in self.tags]
+
+    def __repr__(self):
+        return f"Note(id={self.id!r}, title={self.title!r}, content={self.description!r})"
+
+
+class NoteRevision(Base):
+    """One saved version of a note's title and description.
+
+    ``payload`` is a full snapshot every NOTE_REVISION_SNAPSHOT_INTERVAL
+    versions and a compact delta against the previous version otherwise,
+    see app.utils.note_revisions.
+    """
+    __tablename__ = "note_revisions"
+    __table_args__ = (
+        UniqueConstraint("note_id", "version", name="uq_note_revisions_note_id_version"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    note_id: Mapped[int] = mapped_column(ForeignKey("notes.id", ondelete="CASCADE"), nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    is_snapshot: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+
     def __repr__(self):
-        return f"Note(id={self.id!r}, title={self.title!r}, content={self.description!r})"
\ No newline at end of file
+        return (
+            f"NoteRevision(note_id={self.note_id!r}, version={self.version!r}, "
+            f"is_snapshot={self.is_snapshot!r})"
+        )
@@ -0,0 +1,114 @@
+"""Full-text index over notes.title and notes.description.
+
+SQLite: an FTS5 external-content table (``notes_fts``) kept in sync by triggers.
+PostgreSQL: a generated ``search_vector`` tsvector column with a GIN index.
+
+Neither is part of the metadata. ``ensure_note_search`` creates them with the
+``notes`` table and again on every startup, which covers databases built by
+alembic migrations (see ``python cli.py rebuild-note-search`` to repair them).
+"""
+import re
+
+from sqlalchemy import DDL, event, inspect, text
+from sqlalchemy.engine import Connection
+
+from app.core.settings import setting
+from app.models.note import Note
+
+SQLITE_FTS_TABLE = "notes_fts"
+
+SQLITE_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5(
+        title, description,
+        content='notes', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS notes_fts_ai AFTER INSERT ON notes BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS notes_fts_ad AFTER DELETE ON notes BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS notes_fts_au AFTER UPDATE OF title, description ON notes BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+]
+
+# Postgres text search configuration names, interpolated into the generated column
+SEARCH_LANGUAGE_RE = re.compile(r"[a-z_][a-z0-9_]*")
+
+# Not part of Base.metadata, so alembic must leave them alone (see alembic/env.py)
+SEARCH_TABLE_PREFIX = SQLITE_FTS_TABLE
+SEARCH_COLUMN = "search_vector"
+SEARCH_INDEX = "ix_notes_search_vector"
+
+
+def postgres_ddl() -> list[str]:
+    language = setting.NOTE_SEARCH_LANGUAGE
+    if not SEARCH_LANGUAGE_RE.fullmatch(language):
+        raise ValueError(f"Invalid NOTE_SEARCH_LANGUAGE: {language}")
+    return [
+        f"""ALTER TABLE notes ADD COLUMN {SEARCH_COLUMN} tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('{language}', coalesce(title, '')), 'A')
+                || setweight(to_tsvector('{language}', coalesce(description, '')), 'B')
+            ) STORED""",
+        f"CREATE INDEX {SEARCH_INDEX} ON notes USING GIN ({SEARCH_COLUMN})",
+    ]
+
+
+def is_note_search_object(name: str, type_: str) -> bool:
+    """Whether alembic's ``name``/``type_`` pair is one of the objects managed here."""
+    if type_ == "table":
+        return name.startswith(SEARCH_TABLE_PREFIX)
+    return (type_, name) in {("column", SEARCH_COLUMN), ("index", SEARCH_INDEX)}
+
+
+def ensure_note_search(conn: Connection) -> None:
+    """Create the index objects that are missing (sync, use with ``run_sync``).
+
+    Runs at startup: migrations build the ``notes`` table without firing the
+    ``after_create`` listener. An FTS table created for existing notes is filled
+    from them. Nothing happens until the ``notes`` table exists.
+    """
+    inspector = inspect(conn)
+    if not inspector.has_table("notes"):
+        return
+    if conn.dialect.name == "sqlite":
+        created = not inspector.has_table(SQLITE_FTS_TABLE)
+        for statement in SQLITE_DDL:
+            conn.execute(text(statement))
+        if created:
+            conn.execute(text(f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')"))
+    elif conn.dialect.name == "postgresql":
+        # Checked first, ALTER TABLE locks the table even when there is nothing to add
+        add_column, create_index = postgres_ddl()
+        if SEARCH_COLUMN not in {column["name"] for column in inspector.get_columns("notes")}:
+            conn.execute(text(add_column))
+        if SEARCH_INDEX not in {index["name"] for index in inspector.get_indexes("notes")}:
+            conn.execute(text(create_index))
+    else:
+        raise NotImplementedError(f"Note search is not supported on {conn.dialect.name}")
+
+
+event.listen(Note.__table__, "after_create", lambda target, conn, **kw: ensure_note_search(conn))
+event.listen(
+    Note.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
+
+
+def rebuild_note_search(conn: Connection) -> None:
+    """Recreate missing objects and rebuild the index from the notes table."""
+    ensure_note_search(conn)
+    if conn.dialect.name == "sqlite":
+        conn.execute(text(f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')"))
+    else:
+        # The generated column is always current, only the index can drift (bloat)
+        conn.execute(text(f"REINDEX INDEX {SEARCH_INDEX}"))
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, String, Text, Boolean
+from sqlalchemy import ForeignKey, String, Text, Boolean, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.db_config import Base
 from typing import TYPE_CHECKING
@@ -25,8 +25,10 @@ class Notification(Base):
     is_read: Mapped[bool] = mapped_column(Boolean, default=False)
     sent: Mapped[bool] = mapped_column(Boolean, default=False)
 
-    created_at: Mapped[str] = mapped_column(String(50), nullable=False)
-    updated_at: Mapped[str] = mapped_column(String(50), nullable=False)
+    created_at: Mapped[str] = mapped_column(String(50), nullable=False, default=func.now())
+    updated_at: Mapped[str] = mapped_column(
+        String(50), nullable=False, default=func.now(), onupdate=func.now()
+    )
 
     user: Mapped["User"] = relationship("User", back_populates="notifications")
 
@@ -1,6 +1,8 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.db_config import Base
-from sqlalchemy import Integer, String, ForeignKey
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import DateTime, Integer, String, ForeignKey, func
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -15,6 +17,10 @@ class Profile(Base):
                                                     name='fk_profile_user_id_relation'),unique=True, nullable=False)
     bio: Mapped[str] = mapped_column(String(500), nullable=True)
     profile_picture_url: Mapped[str] = mapped_column(String(255), nullable=True)
+    # Part of the ETag of responses embedding the profile, see app.core.conditional
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=func.now(), onupdate=func.now(), nullable=True
+    )
 
     user: Mapped["User"] = relationship("User", back_populates="profile")
 
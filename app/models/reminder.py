@@ -1,8 +1,8 @@
 from datetime import datetime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.db_config import Base
-from sqlalchemy import DateTime, Integer, String,  func, ForeignKey
-from typing import TYPE_CHECKING
+from sqlalchemy import DateTime, Index, Integer, String,  func, ForeignKey, text
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -11,10 +11,24 @@ if TYPE_CHECKING:
 
 class Reminder(Base):
     __tablename__ = "reminders"
+    __table_args__ = (
+        # Conditional GET validators, see app.core.conditional
+        Index("ix_reminders_user_id_updated_at", "user_id", "updated_at"),
+        # Look-ahead scans of the scheduler only ever touch reminders that have not fired
+        Index(
+            "ix_reminders_pending_reminder_date",
+            "reminder_date",
+            sqlite_where=text("notified_at IS NULL"),
+            postgresql_where=text("notified_at IS NULL"),
+        ),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(nullable=True)
+    # Naive UTC, see app.schemas.reminder
     reminder_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # Set when ReminderScheduler fires the reminder; cleared when reminder_date changes
+    notified_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     user: Mapped["User"] = relationship("User", back_populates="reminders")
     created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), index=True)
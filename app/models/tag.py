@@ -1,9 +1,12 @@
 # app/models/tag.py
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, func, inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateIndex
 from app.core.db_config import Base
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from app.models.association import note_tag_table
 
 from typing import TYPE_CHECKING
@@ -16,9 +19,46 @@ class Tag(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    # Part of the ETag of responses listing tag names, see app.core.conditional
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=func.now(), onupdate=func.now(), nullable=True
+    )
 
     notes: Mapped[List["Note"]] = relationship(
         "Note",
         secondary=note_tag_table,
         back_populates="tags"
     )
+
+
+# Prefix range scans for tag suggestions, see TagRepository.suggest. Alembic
+# skips expression indexes on SQLite, so the app creates it on startup and
+# alembic/env.py leaves it out of autogenerate.
+TAG_NAME_LOWER_INDEX = Index(
+    "ix_tags_name_lower",
+    func.lower(Tag.name).label("name_lower"),
+    postgresql_ops={"name_lower": "text_pattern_ops"},
+)
+
+
+def ensure_tag_name_index(conn: Connection) -> None:
+    """Create ix_tags_name_lower if missing (sync, use with ``run_sync``)."""
+    # Reflection skips expression indexes on SQLite, so let the database check
+    if inspect(conn).has_table(Tag.__tablename__):
+        conn.execute(CreateIndex(TAG_NAME_LOWER_INDEX, if_not_exists=True))
+
+
+class UserTagUsage(Base):
+    """How many of a user's notes carry a tag, kept in step with note_tag.
+
+    Maintained by NoteRepository through TagRepository.apply_usage.
+    """
+    __tablename__ = "user_tag_usage"
+    __table_args__ = (Index("ix_user_tag_usage_tag_id", "tag_id"),)
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    tag_id: Mapped[int] = mapped_column(ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True)
+    use_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f"<UserTagUsage(user_id={self.user_id}, tag_id={self.tag_id}, use_count={self.use_count})>"
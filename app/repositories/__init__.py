@@ -3,8 +3,10 @@ from app.repositories.habit_category_repository import HabitCategoryRepository
 from app.repositories.reminder_repository import ReminderRepository
 from app.repositories.habit_repository import HabitRepository
 from app.repositories.habit_log_repository import HabitLogRepository
+from app.repositories.habit_progress_repository import HabitProgressRepository
 from app.repositories.notification_repository import NotificationRepository
 from app.repositories.log_repository import LogRepository
+from app.repositories.tag_repository import TagRepository
 
 __all__ = [
     "UserRepository",
@@ -12,6 +14,8 @@ __all__ = [
     "ReminderRepository",
     "HabitRepository",
     "HabitLogRepository",
+    "HabitProgressRepository",
     "NotificationRepository",
     "LogRepository",
+    "TagRepository",
 ]
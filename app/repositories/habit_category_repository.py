@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import select, update
 from app.models  import HabitCategory
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas import HabitCategoryModelSchema
@@ -29,26 +29,31 @@ class HabitCategoryRepository:
     async def create_habit_category(self, category_data: HabitCategoryModelSchema)-> HabitCategory:
         category = HabitCategory(**category_data.model_dump())
         self.session.add(category)
-        await self.session.commit()
-        await self.session.refresh(category)
+        await self.session.flush()
         return category
     
     async def update_habit_category_by_id(self, category_id: int, category_data: HabitCategoryPartialRequestSchema)->HabitCategory:
-        category = await self.get_habit_category_by_id(category_id)
+        values = category_data.model_dump(exclude_unset=True)
+        if values:
+            result = await self.session.execute(
+                update(HabitCategory)
+                .where(HabitCategory.id == category_id)
+                .values(**values)
+                .returning(HabitCategory)
+            )
+            category = result.scalar_one_or_none()
+        else:
+            category = await self.get_habit_category_by_id(category_id)
         if not category:
-            raise CustomException(status_code=status.HTTP_404_NOT_FOUND, detail="Habit category not found")
-        for key, value in category_data.model_dump(exclude_unset=True).items():
-            setattr(category, key, value)
-        await self.session.commit()
-        await self.session.refresh(category)
+            raise CustomException("Habit category not found", status_code=status.HTTP_404_NOT_FOUND)
         return category
 
     async def delete_habit_category_by_id(self, category_id: int)->HabitCategory:
         category = await self.get_habit_category_by_id(category_id)
         if not category:
-            raise CustomException(status_code=status.HTTP_404_NOT_FOUND, detail="Habit category not found")
+            raise CustomException("Habit category not found", status_code=status.HTTP_404_NOT_FOUND)
         await self.session.delete(category)
-        await self.session.commit()
+        await self.session.flush()
         return category
     
         
\ No newline at end of file
@@ -1,28 +1,210 @@
 # repositories/habit_log.py
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy import Row, and_, delete, or_, select, update
 from datetime import date
-from app.models import HabitLog
+from typing import Iterable, List, Optional, Tuple
+from app.core.db_config import insert_for
+from app.core.logger_config import logger as default_logger
+from app.models import Habit, HabitLog
 from app.repositories.interface import IHabitLogRepository
 
+# Rows per INSERT statement, keeps bulk inserts well under SQLite's bound parameter limit
+BULK_INSERT_CHUNK_SIZE = 500
+
+
 class HabitLogRepository(IHabitLogRepository):
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, logger=None):
         self.db = db
+        self.logger = logger or default_logger
+
+    async def _owned_habits(self, user_id: int, *criteria, for_update: bool = False) -> dict[int, Habit]:
+        query = select(Habit).where(Habit.user_id == user_id, *criteria).order_by(Habit.id)
+        if for_update:
+            if self.db.get_bind().dialect.name == "sqlite":
+                # No SELECT .. FOR UPDATE; a no-op write takes the database write lock instead
+                await self.db.execute(
+                    update(Habit)
+                    .where(Habit.user_id == user_id, *criteria)
+                    .values(updated_at=Habit.updated_at)
+                    .execution_options(synchronize_session=False)
+                )
+            else:
+                # In id order, so writers locking several habits cannot deadlock
+                query = query.with_for_update()
+            query = query.execution_options(populate_existing=True)
+        result = await self.db.execute(query)
+        return {habit.id: habit for habit in result.scalars().all()}
+
+    async def get_owned_habits(
+        self, user_id: int, habit_ids: Iterable[int], for_update: bool = False
+    ) -> dict[int, Habit]:
+        """The user's habits among ``habit_ids``. Writers that update the streaks pass
+        ``for_update`` so concurrent log writes of a habit apply one after the other."""
+        return await self._owned_habits(user_id, Habit.id.in_(set(habit_ids)), for_update=for_update)
+
+    async def get_log_habit(self, user_id: int, log_id: int, for_update: bool = False) -> Optional[Habit]:
+        """The habit of the user's log ``log_id``, or None."""
+        log_habit = select(HabitLog.habit_id).where(HabitLog.id == log_id).scalar_subquery()
+        habits = await self._owned_habits(user_id, Habit.id == log_habit, for_update=for_update)
+        return next(iter(habits.values()), None)
+
+    async def completed_dates(self, habit_id: int) -> List[date]:
+        result = await self.db.execute(
+            select(HabitLog.completed_date).where(HabitLog.habit_id == habit_id)
+        )
+        return list(result.scalars().all())
+
+    async def add(self, habit_id: int, completed_date: date) -> Tuple[HabitLog, bool]:
+        """Insert a single log, returning ``(log, created)``.
+
+        When the day is already logged the existing row comes back with ``created=False``.
+        """
+        result = await self.db.execute(
+            insert_for(self.db, HabitLog)
+            .values(habit_id=habit_id, completed_date=completed_date)
+            .on_conflict_do_nothing(index_elements=[HabitLog.habit_id, HabitLog.completed_date])
+            .returning(HabitLog)
+        )
+        log = result.scalar_one_or_none()
+        if log is not None:
+            return log, True
+        result = await self.db.execute(
+            select(HabitLog).where(
+                HabitLog.habit_id == habit_id, HabitLog.completed_date == completed_date
+            )
+        )
+        return result.scalar_one(), False
 
-    async def create(self, log: HabitLog) -> HabitLog:
-        self.db.add(log)
-        await self.db.commit()
-        await self.db.refresh(log)
-        return log
+    async def add_many(self, rows: List[dict]) -> List[HabitLog]:
+        """Multi-row INSERT ... ON CONFLICT DO NOTHING, returns only the new rows."""
+        inserted = []
+        for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+            result = await self.db.execute(
+                insert_for(self.db, HabitLog)
+                .values(rows[start:start + BULK_INSERT_CHUNK_SIZE])
+                .on_conflict_do_nothing(index_elements=[HabitLog.habit_id, HabitLog.completed_date])
+                .returning(HabitLog)
+            )
+            inserted.extend(result.scalars().all())
+        return inserted
+
+    async def list_for_user(
+        self,
+        user_id: int,
+        habit_ids: Optional[Iterable[int]] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        after: Optional[Tuple[int, date]] = None,
+        limit: int = 50,
+    ) -> List[HabitLog]:
+        """Logs grouped by habit, highest habit id first and newest day first
+        within a habit, keyset paginated on the unique (habit_id, completed_date) pair.
+
+        That order is the one of uq_habit_logs_habit_id_completed_date, so a
+        page is read straight off the index without sorting the user's
+        history. ``after`` is the sort key of the last row of the previous page.
+        """
+        owned = select(Habit.id).where(Habit.user_id == user_id)
+        if habit_ids is not None:
+            owned = owned.where(Habit.id.in_(set(habit_ids)))
+        query = (
+            select(HabitLog)
+            .where(HabitLog.habit_id.in_(owned))
+            .order_by(HabitLog.habit_id.desc(), HabitLog.completed_date.desc())
+            .limit(limit)
+        )
+        if date_from is not None:
+            query = query.where(HabitLog.completed_date >= date_from)
+        if date_to is not None:
+            query = query.where(HabitLog.completed_date <= date_to)
+        if after is not None:
+            after_habit_id, after_date = after
+            query = query.where(
+                or_(
+                    HabitLog.habit_id < after_habit_id,
+                    and_(HabitLog.habit_id == after_habit_id, HabitLog.completed_date < after_date),
+                )
+            )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def stream_for_user(
+        self,
+        user_id: int,
+        habit_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        yield_per: int = 1000,
+    ) -> AsyncResult:
+        """Server-side cursor of (habit_id, completed_date) rows, ordered by habit then day."""
+        query = (
+            select(HabitLog.habit_id, HabitLog.completed_date)
+            .join(Habit, Habit.id == HabitLog.habit_id)
+            .where(Habit.user_id == user_id)
+            .order_by(HabitLog.habit_id, HabitLog.completed_date)
+            .execution_options(yield_per=yield_per)
+        )
+        if habit_id is not None:
+            query = query.where(HabitLog.habit_id == habit_id)
+        if date_from is not None:
+            query = query.where(HabitLog.completed_date >= date_from)
+        if date_to is not None:
+            query = query.where(HabitLog.completed_date <= date_to)
+        return await self.db.stream(query)
+
+    async def completed_dates_for_user(
+        self, user_id: int, start: date, end: date, habit_id: Optional[int] = None
+    ) -> List[Row]:
+        """(habit_id, completed_date) for the user's habits in [start, end].
+
+        Habits without logs in the range come back once with a NULL date.
+        """
+        query = (
+            select(Habit.id, HabitLog.completed_date)
+            .outerjoin(
+                HabitLog,
+                and_(
+                    HabitLog.habit_id == Habit.id,
+                    HabitLog.completed_date >= start,
+                    HabitLog.completed_date <= end,
+                ),
+            )
+            .where(Habit.user_id == user_id)
+            .order_by(Habit.id, HabitLog.completed_date)
+        )
+        if habit_id is not None:
+            query = query.where(Habit.id == habit_id)
+        result = await self.db.execute(query)
+        return list(result.all())
+
+    async def delete_by_id(self, log_id: int, user_id: int) -> Optional[Row]:
+        """Delete one of the user's logs, returning its (habit_id, completed_date)."""
+        result = await self.db.execute(
+            delete(HabitLog)
+            .where(
+                HabitLog.id == log_id,
+                HabitLog.habit_id.in_(select(Habit.id).where(Habit.user_id == user_id)),
+            )
+            .returning(HabitLog.habit_id, HabitLog.completed_date)
+        )
+        return result.one_or_none()
 
-    async def delete_by_id(self, log_id: int) -> None:
-        await self.db.execute(delete(HabitLog).where(HabitLog.id == log_id))
-        await self.db.commit()
 
+    async def clear_range(
+        self, user_id: int, habit_ids: Iterable[int], date_from: date, date_to: date
+    ) -> List[Row]:
+        """One DELETE over the user's habits and an inclusive date range.
 
-    async def clear_by_date(self, habit_id: int, log_date: date) -> None:
-        await self.db.execute(
+        Returns the (habit_id, completed_date) of every removed log.
+        """
+        result = await self.db.execute(
             delete(HabitLog)
-            .where(HabitLog.habit_id == habit_id, HabitLog.completed_date == log_date)
+            .where(
+                HabitLog.habit_id.in_(set(habit_ids)),
+                HabitLog.habit_id.in_(select(Habit.id).where(Habit.user_id == user_id)),
+                HabitLog.completed_date >= date_from,
+                HabitLog.completed_date <= date_to,
+            )
+            .returning(HabitLog.habit_id, HabitLog.completed_date)
         )
-        await self.db.commit()
+        return list(result.all())
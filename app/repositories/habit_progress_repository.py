@@ -0,0 +1,109 @@
+from collections import Counter
+from datetime import date
+from typing import Iterable, List, Optional, Tuple
+from sqlalchemy import Row, and_, delete, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.db_config import insert_for
+from app.core.logger_config import logger as default_logger
+from app.models import Habit, HabitProgressRollup
+from app.models.enums import FrequencyType
+from app.utils.habit_periods import period_start
+
+# Rows per upsert statement, keeps bulk writes well under SQLite's bound parameter limit
+UPSERT_CHUNK_SIZE = 500
+
+RollupKey = Tuple[int, FrequencyType, date]
+
+
+def period_deltas(logs: Iterable[Tuple[int, date]], sign: int = 1) -> Counter:
+    """Rollup changes for (habit_id, completed_date) pairs being added (+1) or removed (-1)."""
+    deltas: Counter = Counter()
+    for habit_id, completed_date in logs:
+        for period_type in FrequencyType:
+            deltas[(habit_id, period_type, period_start(completed_date, period_type))] += sign
+    return deltas
+
+
+def current_period_join(rollup, on_date: date):
+    """Join condition matching each habit to its rollup row for the period containing ``on_date``."""
+    return and_(
+        rollup.habit_id == Habit.id,
+        rollup.period_type == Habit.frequency_type,
+        or_(
+            *(
+                and_(rollup.period_type == period_type, rollup.period_start == period_start(on_date, period_type))
+                for period_type in FrequencyType
+            )
+        ),
+    )
+
+
+class HabitProgressRepository:
+    def __init__(self, session: AsyncSession, logger=None):
+        self.session = session
+        self.logger = logger or default_logger
+
+    async def apply(self, deltas: Counter) -> None:
+        """Add ``deltas`` to the rollups with INSERT ... ON CONFLICT DO UPDATE."""
+        rows = [
+            {"habit_id": habit_id, "period_type": period_type, "period_start": start, "completed_count": delta}
+            for (habit_id, period_type, start), delta in deltas.items()
+            if delta
+        ]
+        for chunk_start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            stmt = insert_for(self.session, HabitProgressRollup).values(
+                rows[chunk_start:chunk_start + UPSERT_CHUNK_SIZE]
+            )
+            await self.session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[
+                        HabitProgressRollup.habit_id,
+                        HabitProgressRollup.period_type,
+                        HabitProgressRollup.period_start,
+                    ],
+                    set_={
+                        "completed_count": HabitProgressRollup.completed_count
+                        + stmt.excluded.completed_count
+                    },
+                )
+            )
+
+        emptied = {row["habit_id"] for row in rows if row["completed_count"] < 0}
+        if emptied:
+            await self.session.execute(
+                delete(HabitProgressRollup).where(
+                    HabitProgressRollup.habit_id.in_(emptied),
+                    HabitProgressRollup.completed_count <= 0,
+                )
+            )
+
+    async def get_count(self, habit_id: int, period_type: FrequencyType, start: date) -> int:
+        result = await self.session.execute(
+            select(HabitProgressRollup.completed_count).where(
+                HabitProgressRollup.habit_id == habit_id,
+                HabitProgressRollup.period_type == period_type,
+                HabitProgressRollup.period_start == start,
+            )
+        )
+        return result.scalar_one_or_none() or 0
+
+    async def get_current_progress(
+        self, user_id: int, on_date: date, habit_id: Optional[int] = None
+    ) -> List[Row]:
+        """(Habit, completed_count) for the period each habit is in on ``on_date``."""
+        query = (
+            select(Habit, func.coalesce(HabitProgressRollup.completed_count, 0))
+            .outerjoin(HabitProgressRollup, current_period_join(HabitProgressRollup, on_date))
+            .where(Habit.user_id == user_id)
+            .order_by(Habit.id)
+        )
+        if habit_id is not None:
+            query = query.where(Habit.id == habit_id)
+        result = await self.session.execute(query)
+        return list(result.all())
+
+    async def clear(self, habit_ids: Optional[Iterable[int]] = None) -> None:
+        query = delete(HabitProgressRollup)
+        if habit_ids is not None:
+            query = query.where(HabitProgressRollup.habit_id.in_(set(habit_ids)))
+        await self.session.execute(query)
@@ -1,10 +1,22 @@
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.models import Habit
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession
+from app.models import Habit, HabitCategory, HabitProgressRollup, User
+from app.models.enums import FrequencyType
+from app.repositories.habit_progress_repository import current_period_join
+from datetime import date
+from typing import Optional
+from sqlalchemy import and_, func, select, update
+from sqlalchemy.orm import aliased, joinedload
 from app.schemas import HabitModelSchema, HabitPartialRequestSchema
 from app.utils.common import CustomException
 
 
+# Relationships nested in HabitResponseSchema; loaded up front since lazy loads fail under asyncio
+HABIT_RESPONSE_OPTIONS = (
+    joinedload(Habit.user).joinedload(User.profile),
+    joinedload(Habit.category).joinedload(HabitCategory.user).joinedload(User.profile),
+)
+
+
 class HabitRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -12,12 +24,13 @@ class HabitRepository:
     async def create_habit(self, habit_data: HabitModelSchema):
         habit = Habit(**habit_data.model_dump())
         self.session.add(habit)
-        await self.session.commit()
-        await self.session.refresh(habit)
-        return habit
+        await self.session.flush()
+        return await self.get_habit_by_id(habit.id)
 
     async def get_habit_by_id(self, habit_id: int):
-        result = await self.session.execute(select(Habit).where(Habit.id == habit_id))
+        result = await self.session.execute(
+            select(Habit).where(Habit.id == habit_id).options(*HABIT_RESPONSE_OPTIONS)
+        )
         habit = result.scalar_one_or_none()
         if habit:
             return habit
@@ -28,19 +41,68 @@ class HabitRepository:
 
     async def get_all_habits(self, user_id: int):
         result = await self.session.execute(
-            select(Habit).where(Habit.user_id == user_id)
+            select(Habit).where(Habit.user_id == user_id).options(*HABIT_RESPONSE_OPTIONS)
         )
         return result.scalars().all()
 
+    async def stream_for_user(
+        self, user_id: int, habit_id: Optional[int] = None, yield_per: int = 1000
+    ) -> AsyncScalarResult:
+        """Server-side cursor over the user's habits, fetched ``yield_per`` rows at a time."""
+        query = (
+            select(Habit)
+            .where(Habit.user_id == user_id)
+            .order_by(Habit.id)
+            .execution_options(yield_per=yield_per)
+        )
+        if habit_id is not None:
+            query = query.where(Habit.id == habit_id)
+        return await self.session.stream_scalars(query)
+
+    async def get_dashboard(self, user_id: int, on_date: date):
+        """(Habit, period_count, logged_on_date) rows in one statement.
+
+        The category is joined eagerly; counts come from the progress rollups.
+        """
+        current = aliased(HabitProgressRollup)
+        day = aliased(HabitProgressRollup)
+        result = await self.session.execute(
+            select(
+                Habit,
+                func.coalesce(current.completed_count, 0),
+                func.coalesce(day.completed_count, 0) > 0,
+            )
+            .outerjoin(current, current_period_join(current, on_date))
+            .outerjoin(
+                day,
+                and_(
+                    day.habit_id == Habit.id,
+                    day.period_type == FrequencyType.DAILY,
+                    day.period_start == on_date,
+                ),
+            )
+            .where(Habit.user_id == user_id)
+            .options(joinedload(Habit.category))
+            .order_by(Habit.id)
+        )
+        return result.all()
+
     async def update_habit_by_id(self, habit_id: int, data: HabitPartialRequestSchema):
-        habit = await self.get_habit_by_id(habit_id)
-        for key, value in data.model_dump(exclude_unset=True).items():
-            setattr(habit, key, value)
-        await self.session.commit()
-        await self.session.refresh(habit)
-        return habit
+        values = data.model_dump(exclude_unset=True)
+        if not values:
+            return await self.get_habit_by_id(habit_id)
+        result = await self.session.execute(
+            update(Habit).where(Habit.id == habit_id).values(**values).returning(Habit)
+        )
+        habit = result.scalar_one_or_none()
+        if habit:
+            return await self.get_habit_by_id(habit.id)
+        raise CustomException(
+            message="Habit does not found",
+            status_code=404,
+        )
 
     async def delete_habit_by_id(self, habit_id: int):
         habit = await self.get_habit_by_id(habit_id)
         await self.session.delete(habit)
-        await self.session.commit()
+        await self.session.flush()
@@ -1,18 +1,59 @@
 # repositories/interfaces/habit_log.py
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable, List, Optional, Tuple
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncResult
 from datetime import date
-from app.models import HabitLog
+from app.models import Habit, HabitLog
 
 class IHabitLogRepository(ABC):
     @abstractmethod
-    async def add(self, log: HabitLog) -> HabitLog: ...
+    async def get_owned_habits(
+        self, user_id: int, habit_ids: Iterable[int], for_update: bool = False
+    ) -> dict[int, Habit]: ...
+
+    @abstractmethod
+    async def get_log_habit(self, user_id: int, log_id: int, for_update: bool = False) -> Optional[Habit]: ...
+
+    @abstractmethod
+    async def completed_dates(self, habit_id: int) -> List[date]: ...
+
+    @abstractmethod
+    async def add(self, habit_id: int, completed_date: date) -> Tuple[HabitLog, bool]: ...
     
     @abstractmethod
-    async def delete_by_id(self, log_id: int) -> None: ...
+    async def list_for_user(
+        self,
+        user_id: int,
+        habit_ids: Optional[Iterable[int]] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        after: Optional[Tuple[int, date]] = None,
+        limit: int = 50,
+    ) -> List[HabitLog]: ...
+
+    @abstractmethod
+    async def stream_for_user(
+        self,
+        user_id: int,
+        habit_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        yield_per: int = 1000,
+    ) -> AsyncResult: ...
+
+    @abstractmethod
+    async def completed_dates_for_user(
+        self, user_id: int, start: date, end: date, habit_id: Optional[int] = None
+    ) -> List[Row]: ...
+
+    @abstractmethod
+    async def delete_by_id(self, log_id: int, user_id: int) -> Optional[Row]: ...
     
     @abstractmethod
-    async def add_many(self, logs: List[HabitLog]) -> None: ...
+    async def add_many(self, rows: List[dict]) -> List[HabitLog]: ...
     
     @abstractmethod
-    async def clear_by_date(self, habit_ids: List[int], log_date: date) -> None: ...
+    async def clear_range(
+        self, user_id: int, habit_ids: Iterable[int], date_from: date, date_to: date
+    ) -> List[Row]: ...
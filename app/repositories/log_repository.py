@@ -12,8 +12,7 @@ class LogRepository:
     async def create_log(self, log_data: LogCreate):
         log = Log(**log_data)
         self.session.add(log)
-        await self.session.commit()
-        await self.session.refresh(log)
+        await self.session.flush()
         return log
 
     async def get_user_logs(self, user_id: int):
@@ -1,45 +1,252 @@
+import re
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import DateTime, String, and_, delete, func, literal, null, or_, text, tuple_, type_coerce, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from app.core.db_config import insert_for
+from app.core.settings import setting
 from sqlalchemy.future import select
+from app.models.association import note_tag_table
 from app.models.note import Note
+from app.models.note_search import SQLITE_FTS_TABLE
 from app.models.tag import Tag
-from app.schemas.note_schema import NoteCreate, NoteUpdate
+from app.models.user import User
+from app.repositories.note_revision_repository import NoteRevisionRepository
+from app.repositories.tag_repository import TagRepository
+from app.schemas.note_schema import NoteCreate, NoteUpdate, NoteWrite
+from app.utils.note_revisions import NoteContent
+
+# Everything NoteRead touches, loaded up front (lazy loads fail under asyncio)
+NOTE_READ_OPTIONS = (
+    selectinload(Note.tags),
+    joinedload(Note.user).joinedload(User.profile),
+)
+
 
 class NoteRepository:
     @staticmethod
-    async def get_all(db: AsyncSession, user_id: int):
-        result = await db.execute(select(Note).filter(Note.user_id == user_id))
-        return result.scalars().all()
+    async def list_summaries(
+        db: AsyncSession,
+        user_id: int,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 20,
+        excerpt_length: int = 200,
+    ):
+        """Newest first, keyset paginated on (updated_at, id); see ix_notes_user_id_updated_at_id.
+
+        Selects only the list columns, with the description cut to
+        ``excerpt_length`` characters in the database (0 leaves it out).
+        """
+        excerpt = func.substr(Note.description, 1, excerpt_length) if excerpt_length > 0 else null()
+        query = (
+            select(Note.id, Note.title, excerpt.label("excerpt"), Note.created_at, Note.updated_at)
+            .where(Note.user_id == user_id)
+            .order_by(Note.updated_at.desc(), Note.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            after_updated_at, after_id = after
+            if db.get_bind().dialect.name == "sqlite":
+                # func.now() is stored as 'YYYY-MM-DD HH:MM:SS' text, which compares lower
+                # than the bound '... HH:MM:SS.000000' of the same second; bind the same layout
+                after_updated_at = type_coerce(after_updated_at.isoformat(sep=" "), String)
+            query = query.where(
+                or_(
+                    Note.updated_at < after_updated_at,
+                    and_(Note.updated_at == after_updated_at, Note.id < after_id),
+                )
+            )
+        result = await db.execute(query)
+        return result.mappings().all()
+
+    @staticmethod
+    async def get_tags_for_notes(db: AsyncSession, note_ids: Iterable[int]) -> Dict[int, List[dict]]:
+        """Tags of several notes in one query, keyed by note id."""
+        note_ids = set(note_ids)
+        if not note_ids:
+            return {}
+        result = await db.execute(
+            select(note_tag_table.c.note_id, Tag.id, Tag.name)
+            .join(Tag, Tag.id == note_tag_table.c.tag_id)
+            .where(note_tag_table.c.note_id.in_(note_ids))
+            .order_by(Tag.name)
+        )
+        tags = defaultdict(list)
+        for note_id, tag_id, name in result:
+            tags[note_id].append({"id": tag_id, "name": name})
+        return tags
 
     @staticmethod
-    async def get(db: AsyncSession, note_id: int, user_id: int):
-        result = await db.execute(select(Note).filter(Note.id == note_id, Note.user_id == user_id))
+    async def search(db: AsyncSession, user_id: int, query: str, limit: int = 20, offset: int = 0):
+        """Ranked full-text search over the user's notes, see app.models.note_search.
+
+        Every word of ``query`` must match, as a prefix; returns
+        (id, title, snippet, rank, updated_at) rows, most relevant first.
+        """
+        terms = re.findall(r"\w+", query)
+        if not terms:
+            return []
+        params = {"user_id": user_id, "limit": limit, "offset": offset}
+
+        if db.get_bind().dialect.name == "postgresql":
+            params["query"] = " & ".join(f"{term}:*" for term in terms)
+            params["language"] = setting.NOTE_SEARCH_LANGUAGE
+            statement = text(
+                """
+                SELECT hit.id, hit.title,
+                       ts_headline(CAST(:language AS regconfig), coalesce(hit.description, hit.title), hit.query,
+                                   'StartSel=[, StopSel=], MaxWords=24, MinWords=8') AS snippet,
+                       hit.rank, hit.updated_at
+                FROM (
+                    SELECT notes.id, notes.title, notes.description, notes.updated_at, q.query,
+                           ts_rank_cd(notes.search_vector, q.query) AS rank
+                    FROM notes, to_tsquery(CAST(:language AS regconfig), :query) AS q(query)
+                    WHERE notes.user_id = :user_id AND notes.search_vector @@ q.query
+                    ORDER BY rank DESC, notes.id DESC
+                    LIMIT :limit OFFSET :offset
+                ) AS hit
+                ORDER BY hit.rank DESC, hit.id DESC
+                """
+            )
+        else:
+            params["query"] = " ".join('"{}"*'.format(term) for term in terms)
+            # bm25 is lower-is-better; title hits weigh 10x description hits
+            statement = text(
+                f"""
+                SELECT notes.id, notes.title,
+                       snippet({SQLITE_FTS_TABLE}, -1, '[', ']', '…', 12) AS snippet,
+                       -bm25({SQLITE_FTS_TABLE}, 10.0, 1.0) AS rank,
+                       notes.updated_at
+                FROM {SQLITE_FTS_TABLE}
+                JOIN notes ON notes.id = {SQLITE_FTS_TABLE}.rowid
+                WHERE {SQLITE_FTS_TABLE} MATCH :query AND notes.user_id = :user_id
+                ORDER BY rank DESC, notes.id DESC
+                LIMIT :limit OFFSET :offset
+                """
+            )
+        result = await db.execute(statement.columns(updated_at=DateTime), params)
+        return result.mappings().all()
+
+    @staticmethod
+    async def get(db: AsyncSession, note_id: int, user_id: int, for_update: bool = False):
+        """The note, or None. ``for_update`` holds its row lock until the transaction ends,
+        so the content a write starts from is the latest committed one."""
+        query = select(Note).filter(Note.id == note_id, Note.user_id == user_id).options(*NOTE_READ_OPTIONS)
+        if for_update:
+            if db.get_bind().dialect.name == "sqlite":
+                # No SELECT .. FOR UPDATE; a no-op write takes the database write lock instead
+                await db.execute(
+                    update(Note)
+                    .where(Note.id == note_id, Note.user_id == user_id)
+                    .values(updated_at=Note.updated_at)
+                    .execution_options(synchronize_session=False)
+                )
+            else:
+                query = query.with_for_update(of=Note)
+            query = query.execution_options(populate_existing=True)
+        result = await db.execute(query)
         return result.scalar_one_or_none()
 
     @staticmethod
-    async def create(db: AsyncSession, note_data: NoteCreate, user_id: int):
-        tags = []
-        if note_data.tag_ids:
-            tags = await db.execute(select(Tag).filter(Tag.id.in_(note_data.tag_ids)))
-            tags = tags.scalars().all()
+    def _content(note: Note) -> NoteContent:
+        return NoteContent(title=note.title, description=note.description)
 
-        note = Note(title=note_data.title, description=note_data.description, user_id=user_id, tags=tags)
+    @staticmethod
+    async def exists(db: AsyncSession, note_id: int, user_id: int) -> bool:
+        result = await db.execute(select(Note.id).where(Note.id == note_id, Note.user_id == user_id))
+        return result.scalar_one_or_none() is not None
+
+    @staticmethod
+    async def write_tags(db: AsyncSession, note: Note, note_data: NoteWrite, replace: bool = True) -> bool:
+        """Set the note's tags from ``tag_ids`` and ``tag_names``; returns whether they changed.
+
+        A name resolved from tag_cache can point at a tag deleted or renamed
+        through another worker. Such names are looked up again, bypassing the
+        cache, instead of being dropped or attached to the renamed tag.
+        """
+        tag_ids = set(note_data.tag_ids or [])
+        names = await TagRepository.resolve_names(db, note_data.tag_names) if note_data.tag_names else {}
+        changed, stale = await NoteRepository.set_tags(db, note, tag_ids, replace, names)
+        if stale:
+            names.update(await TagRepository.resolve_names(db, stale, use_cache=False))
+            # Again in full, so a replace also drops a renamed tag that was on the note
+            changed_again, _ = await NoteRepository.set_tags(db, note, tag_ids, replace, names)
+            changed = changed or changed_again
+        return changed
+
+    @staticmethod
+    async def set_tags(
+        db: AsyncSession,
+        note: Note,
+        tag_ids: Set[int],
+        replace: bool = True,
+        names: Optional[Dict[str, int]] = None,
+    ) -> Tuple[bool, Set[str]]:
+        """Write the note_tag rows directly; ids of tags that do not exist are skipped.
+
+        ``names`` (name -> id) are only added where the tag still has that
+        name. The user's tag usage counts follow the rows actually added and
+        removed. Returns whether the note's tags changed and the names whose
+        id no longer matches.
+        """
+        names = names or {}
+        named = {(tag_id, name) for name, tag_id in names.items()}
+        wanted = tag_ids | {tag_id for tag_id, _ in named}
+        usage = Counter()
+        stale: Set[str] = set()
+        if replace:
+            removed = await db.execute(
+                delete(note_tag_table)
+                .where(note_tag_table.c.note_id == note.id, note_tag_table.c.tag_id.not_in(wanted))
+                .returning(note_tag_table.c.tag_id)
+            )
+            usage.subtract(removed.scalars().all())
+        if wanted:
+            match = or_(Tag.id.in_(tag_ids), tuple_(Tag.id, Tag.name).in_(named)) if named else Tag.id.in_(tag_ids)
+            added = await db.execute(
+                insert_for(db, note_tag_table)
+                .from_select(["note_id", "tag_id"], select(literal(note.id), Tag.id).where(match))
+                .on_conflict_do_nothing()
+                .returning(note_tag_table.c.tag_id)
+            )
+            added_ids = added.scalars().all()
+            usage.update(added_ids)
+            if named and len(added_ids) < len(wanted):
+                # Either already on the note or no longer a tag of that name
+                found = await db.execute(select(Tag.id, Tag.name).where(tuple_(Tag.id, Tag.name).in_(named)))
+                stale = {name for _, name in named - {tuple(row) for row in found}}
+        await TagRepository.apply_usage(db, note.user_id, usage)
+        return any(usage.values()), stale
+
+    @staticmethod
+    async def create(db: AsyncSession, note_data: NoteCreate, user_id: int):
+        note = Note(title=note_data.title, description=note_data.description, user_id=user_id)
         db.add(note)
-        await db.commit()
-        await db.refresh(note)
-        return note
+        await db.flush()
+        await NoteRevisionRepository.record(db, note.id, None, NoteRepository._content(note))
+        if note_data.tag_ids or note_data.tag_names:
+            await NoteRepository.write_tags(db, note, note_data, replace=False)
+        return await NoteRepository.get(db, note.id, user_id)
 
     @staticmethod
     async def update(db: AsyncSession, note: Note, note_data: NoteUpdate):
+        previous = NoteRepository._content(note)
         note.title = note_data.title
         note.description = note_data.description
-        if note_data.tag_ids is not None:
-            tags = await db.execute(select(Tag).filter(Tag.id.in_(note_data.tag_ids)))
-            note.tags = tags.scalars().all()
-        await db.commit()
-        await db.refresh(note)
-        return note
+        await db.flush()
+        await NoteRevisionRepository.record(db, note.id, previous, NoteRepository._content(note))
+        if note_data.tag_ids is not None or note_data.tag_names is not None:
+            if await NoteRepository.write_tags(db, note, note_data):
+                # Tags are part of the note's representation (and its ETag)
+                note.updated_at = func.now()
+            db.expire(note, ["tags"])
+        return await NoteRepository.get(db, note.id, note.user_id)
 
     @staticmethod
     async def delete(db: AsyncSession, note: Note):
+        await TagRepository.apply_usage(db, note.user_id, {tag_id: -1 for tag_id in note.tag_ids})
+        await NoteRevisionRepository.delete_for_note(db, note.id)
         await db.delete(note)
-        await db.commit()
\ No newline at end of file
+        await db.flush()
\ No newline at end of file
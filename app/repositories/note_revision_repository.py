@@ -0,0 +1,103 @@
+from typing import Optional
+from sqlalchemy import case, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.core.settings import setting
+from app.models.note import NoteRevision
+from app.utils import note_revisions
+from app.utils.note_revisions import NoteContent
+
+
+class NoteRevisionRepository:
+    @staticmethod
+    async def record(
+        db: AsyncSession, note_id: int, previous: Optional[NoteContent], current: NoteContent
+    ) -> Optional[int]:
+        """Store ``current`` as the next version of the note.
+
+        ``previous`` is the note's content before this write, None for a new
+        note. Notes saved before revisions existed get it as version 1 first.
+        Returns the new version, None if the content did not change.
+        """
+        if previous == current:
+            return None
+        result = await db.execute(
+            select(
+                func.max(NoteRevision.version),
+                func.max(case((NoteRevision.is_snapshot, NoteRevision.version))),
+            ).where(NoteRevision.note_id == note_id)
+        )
+        last, last_snapshot = result.one()
+        if last is None and previous is not None:
+            db.add(NoteRevision(note_id=note_id, version=1, is_snapshot=True, payload=note_revisions.encode(previous)))
+            last = last_snapshot = 1
+
+        version = (last or 0) + 1
+        payload, is_snapshot = note_revisions.encode(current), True
+        if last is not None and version - last_snapshot < setting.NOTE_REVISION_SNAPSHOT_INTERVAL:
+            delta = note_revisions.encode(note_revisions.diff(previous, current))
+            # A rewrite can make the delta bigger than the content itself
+            if len(delta) < len(payload):
+                payload, is_snapshot = delta, False
+
+        db.add(NoteRevision(note_id=note_id, version=version, is_snapshot=is_snapshot, payload=payload))
+        await db.flush()
+        return version
+
+    @staticmethod
+    async def list_for_note(db: AsyncSession, note_id: int, before: Optional[int] = None, limit: int = 20):
+        """Newest first (version, is_snapshot, size, created_at) rows, without payloads."""
+        query = (
+            select(
+                NoteRevision.version,
+                NoteRevision.is_snapshot,
+                func.length(NoteRevision.payload).label("size"),
+                NoteRevision.created_at,
+            )
+            .where(NoteRevision.note_id == note_id)
+            .order_by(NoteRevision.version.desc())
+            .limit(limit)
+        )
+        if before is not None:
+            query = query.where(NoteRevision.version < before)
+        result = await db.execute(query)
+        return result.mappings().all()
+
+    @staticmethod
+    async def reconstruct(db: AsyncSession, note_id: int, version: int):
+        """Content of ``version`` and when it was saved, or None if there is no such version.
+
+        Reads the closest snapshot at or below ``version`` and the deltas
+        after it, at most NOTE_REVISION_SNAPSHOT_INTERVAL rows, in one query.
+        """
+        snapshot = (
+            select(func.max(NoteRevision.version))
+            .where(
+                NoteRevision.note_id == note_id,
+                NoteRevision.is_snapshot.is_(True),
+                NoteRevision.version <= version,
+            )
+            .scalar_subquery()
+        )
+        result = await db.execute(
+            select(NoteRevision.version, NoteRevision.is_snapshot, NoteRevision.payload, NoteRevision.created_at)
+            .where(
+                NoteRevision.note_id == note_id,
+                NoteRevision.version >= snapshot,
+                NoteRevision.version <= version,
+            )
+            .order_by(NoteRevision.version)
+        )
+        rows = result.all()
+        if not rows or rows[-1].version != version:
+            return None
+
+        content = None
+        for row in rows:
+            value = note_revisions.decode(row.payload)
+            content = NoteContent(**value) if row.is_snapshot else note_revisions.apply(content, value)
+        return content, rows[-1].created_at
+
+    @staticmethod
+    async def delete_for_note(db: AsyncSession, note_id: int) -> None:
+        await db.execute(delete(NoteRevision).where(NoteRevision.note_id == note_id))
@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, update
+from sqlalchemy import select, delete, insert, update
 from app.models.notification import Notification
 from typing import List, Optional
 
@@ -8,10 +8,15 @@ class NotificationRepository:
     @staticmethod
     async def create(db: AsyncSession, notification: Notification) -> Notification:
         db.add(notification)
-        await db.commit()
-        await db.refresh(notification)
+        await db.flush()
         return notification
 
+    @staticmethod
+    async def create_many(db: AsyncSession, rows: List[dict]) -> None:
+        """Insert notification rows (column -> value dicts) in one executemany."""
+        if rows:
+            await db.execute(insert(Notification), rows)
+
     @staticmethod
     async def get_by_user(
         db: AsyncSession, user_id: int, is_read: Optional[bool] = None
@@ -42,9 +47,9 @@ class NotificationRepository:
             .where(Notification.id == notification_id, Notification.user_id == user_id)
             .values(is_read=True)
         )
-        await db.commit()
+        await db.flush()
 
     @staticmethod
     async def clear_all(db: AsyncSession, user_id: int) -> None:
         await db.execute(delete(Notification).where(Notification.user_id == user_id))
-        await db.commit()
+        await db.flush()
@@ -1,6 +1,8 @@
 import logging
+from datetime import datetime
+from typing import Iterable
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Row, select, update
 from app.models.reminder import Reminder
 from app.schemas.reminder import ReminderCreate, ReminderUpdate
 
@@ -33,7 +35,11 @@ class ReminderRepository:
         return reminders
 
     async def update_remainder(self, reminder: Reminder, data: ReminderUpdate) -> Reminder:
-        for key, value in data.model_dump(exclude_unset=True).items():
+        values = data.model_dump(exclude_unset=True)
+        if "reminder_date" in values and values["reminder_date"] != reminder.reminder_date:
+            # Rescheduled, fire again
+            reminder.notified_at = None
+        for key, value in values.items():
             setattr(reminder, key, value)
         await self.db.flush()
         self.logger.info(f"Updated reminder {reminder.id}")
@@ -43,3 +49,32 @@ class ReminderRepository:
         await self.db.delete(reminder)
         await self.db.flush()
         self.logger.info(f"Deleted reminder {reminder.id}")
+
+    async def get_pending(self, until: datetime, limit: int) -> list[Row]:
+        """(id, reminder_date) of reminders not fired yet and due by ``until``, soonest first."""
+        result = await self.db.execute(
+            select(Reminder.id, Reminder.reminder_date)
+            .where(Reminder.notified_at.is_(None), Reminder.reminder_date <= until)
+            .order_by(Reminder.reminder_date)
+            .limit(limit)
+        )
+        return result.all()
+
+    async def claim_due(self, reminder_ids: Iterable[int], now: datetime) -> list[Row]:
+        """Mark the given reminders fired and return the ones this call claimed.
+
+        A reminder is only claimed while it is due and not fired yet, so when
+        several workers race for it exactly one gets it back.
+        """
+        result = await self.db.execute(
+            update(Reminder)
+            .where(
+                Reminder.id.in_(set(reminder_ids)),
+                Reminder.notified_at.is_(None),
+                Reminder.reminder_date <= now,
+            )
+            .values(notified_at=now)
+            .returning(Reminder.id, Reminder.user_id, Reminder.title, Reminder.description, Reminder.reminder_date)
+            .execution_options(synchronize_session=False)
+        )
+        return result.all()
@@ -0,0 +1,144 @@
+import string
+from typing import Dict, Iterable, Mapping
+from sqlalchemy import and_, delete, func, literal, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from app.core.cache import cache_on_commit, tag_cache
+from app.core.db_config import insert_for
+from app.models.association import note_tag_table
+from app.models.note import Note
+from app.models.tag import Tag, UserTagUsage
+
+ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def name_prefix_filter(db: AsyncSession, prefix: str):
+    """Case-insensitive ``Tag.name`` prefix match as a range scan on ix_tags_name_lower."""
+    if not prefix:
+        return true()
+    name = func.lower(Tag.name)
+    if db.get_bind().dialect.name == "postgresql":
+        # Byte-wise operators of text_pattern_ops, usable whatever the database collation
+        low = prefix.lower()
+        ge, lt = name.op("~>=~", is_comparison=True), name.op("~<~", is_comparison=True)
+    else:
+        # SQLite's lower() only folds ASCII letters
+        low = prefix.translate(ASCII_LOWER)
+        ge, lt = name.__ge__, name.__lt__
+    high = low[:-1] + chr(ord(low[-1]) + 1)
+    return and_(ge(low), lt(high))
+
+
+class TagRepository:
+    @staticmethod
+    async def suggest(db: AsyncSession, user_id: int, prefix: str, limit: int = 10):
+        """Up to ``limit`` (id, name, use_count) rows for tags starting with ``prefix``.
+
+        Tags the user has used come first, most used first; the rest are
+        filled in by name. Both queries stop after ``limit`` rows of an index
+        range scan, so the cost does not depend on the size of the tags table.
+        """
+        match = name_prefix_filter(db, prefix)
+        result = await db.execute(
+            select(Tag.id, Tag.name, UserTagUsage.use_count)
+            .join(UserTagUsage, UserTagUsage.tag_id == Tag.id)
+            .where(UserTagUsage.user_id == user_id, match)
+            .order_by(UserTagUsage.use_count.desc(), Tag.name)
+            .limit(limit)
+        )
+        rows = list(result.mappings().all())
+        if len(rows) < limit:
+            result = await db.execute(
+                select(Tag.id, Tag.name, literal(0).label("use_count"))
+                .where(match, Tag.id.not_in([row["id"] for row in rows]))
+                .order_by(func.lower(Tag.name))
+                .limit(limit - len(rows))
+            )
+            rows.extend(result.mappings().all())
+        return rows
+
+    @staticmethod
+    async def apply_usage(db: AsyncSession, user_id: int, deltas: Mapping[int, int]) -> None:
+        """Add ``deltas`` (tag_id -> change) to the user's tag usage counts."""
+        rows = [
+            {"user_id": user_id, "tag_id": tag_id, "use_count": delta}
+            for tag_id, delta in deltas.items()
+            if delta
+        ]
+        if not rows:
+            return
+        stmt = insert_for(db, UserTagUsage).values(rows)
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[UserTagUsage.user_id, UserTagUsage.tag_id],
+                set_={"use_count": UserTagUsage.use_count + stmt.excluded.use_count},
+            )
+        )
+        emptied = [row["tag_id"] for row in rows if row["use_count"] < 0]
+        if emptied:
+            await db.execute(
+                delete(UserTagUsage).where(
+                    UserTagUsage.user_id == user_id,
+                    UserTagUsage.tag_id.in_(emptied),
+                    UserTagUsage.use_count <= 0,
+                )
+            )
+
+    @staticmethod
+    async def rebuild_usage(db: AsyncSession) -> None:
+        """Recount every user's tag usage from note_tag."""
+        await db.execute(delete(UserTagUsage))
+        await db.execute(
+            insert_for(db, UserTagUsage).from_select(
+                ["user_id", "tag_id", "use_count"],
+                select(Note.user_id, note_tag_table.c.tag_id, func.count())
+                .join(note_tag_table, note_tag_table.c.note_id == Note.id)
+                .group_by(Note.user_id, note_tag_table.c.tag_id),
+            )
+        )
+
+    @staticmethod
+    async def resolve_names(db: AsyncSession, names: Iterable[str], use_cache: bool = True) -> Dict[str, int]:
+        """Ids of the tags called ``names``, creating the missing ones.
+
+        Names found in tag_cache cost nothing; the rest take one SELECT and,
+        if some do not exist yet, one INSERT .. ON CONFLICT DO NOTHING in the
+        caller's transaction. Created tags are cached only once it commits.
+        ``use_cache=False`` drops the cached ids of ``names`` first.
+        """
+        ids: Dict[str, int] = {}
+        missing = []
+        for name in dict.fromkeys(names):
+            if not use_cache:
+                tag_cache.invalidate(name)
+            tag_id = tag_cache.get(name)
+            if tag_id is None:
+                missing.append(name)
+            else:
+                ids[name] = tag_id
+        if not missing:
+            return ids
+
+        result = await db.execute(select(Tag.name, Tag.id).where(Tag.name.in_(missing)))
+        found = dict(result.all())
+        new = [name for name in missing if name not in found]
+        if new:
+            result = await db.execute(
+                insert_for(db, Tag)
+                .values([{"name": name} for name in new])
+                .on_conflict_do_nothing(index_elements=[Tag.name])
+                .returning(Tag.name, Tag.id)
+            )
+            created = dict(result.all())
+            cache_on_commit(db, tag_cache, created)
+            ids.update(created)
+            raced = [name for name in new if name not in created]
+            if raced:
+                # Committed by a concurrent transaction since the SELECT
+                result = await db.execute(select(Tag.name, Tag.id).where(Tag.name.in_(raced)))
+                found.update(result.all())
+
+        for name, tag_id in found.items():
+            tag_cache.set(name, tag_id)
+        ids.update(found)
+        return ids
@@ -1,9 +1,12 @@
 from app.models.profile import Profile
 from app.models.user import TempUserOTP, User
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func
 from sqlalchemy.future import select
 from sqlalchemy.orm import joinedload
 
+from app.core.cache import invalidate_on_commit, user_cache
+from app.core.db_config import insert_for
 from app.utils.common import generate_otp
 
 class UserRepository:
@@ -44,8 +47,7 @@ class UserRepository:
             await db.flush()
         user_otp = TempUserOTP(email=email, otp=otp)
         db.add(user_otp)
-        await db.commit()
-        await db.refresh(user_otp)
+        await db.flush()
         return user_otp
     
     @staticmethod
@@ -55,20 +57,29 @@ class UserRepository:
         profile_picture_url: str | None,
         db: AsyncSession,
     ) -> Profile:
-        profile = await UserRepository.get_user_profile_by_id(user_id, db)
-
-        if not profile:
-            profile = Profile(user_id=user_id)
-
+        changes = {}
         if bio is not None:
-            profile.bio = bio
-
+            changes["bio"] = bio
         if profile_picture_url is not None:
-            profile.profile_picture_url = profile_picture_url
+            changes["profile_picture_url"] = profile_picture_url
+
+        # Single upsert instead of select + insert/update
+        stmt = insert_for(db, Profile).values(user_id=user_id, **changes)
+        if changes:
+            # set_ does not apply onupdate defaults
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Profile.user_id], set_={**changes, "updated_at": func.now()}
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[Profile.user_id])
+        result = await db.execute(
+            stmt.returning(Profile), execution_options={"populate_existing": True}
+        )
+        profile = result.scalar_one_or_none()
+        if profile is None:
+            profile = await UserRepository.get_user_profile_by_id(user_id, db)
 
-        db.add(profile)
-        await db.commit()
-        await db.refresh(profile)
+        invalidate_on_commit(db, user_cache, user_id)
         return profile
     
 
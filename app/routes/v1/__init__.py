@@ -5,8 +5,11 @@ from app.routes.v1 import (
     reminder_routes,
     habit_routes,
     habit_category_routes,
+    habit_log_routes,
     note_routes,
+    tag_routes,
     notification_routes,
+    metrics_routes,
 )
 
 router = APIRouter()
@@ -15,5 +18,8 @@ router.include_router(user_routes.router)
 router.include_router(reminder_routes.router)
 router.include_router(habit_routes.router)
 router.include_router(habit_category_routes.router)
+router.include_router(habit_log_routes.router)
 router.include_router(note_routes.router)
+router.include_router(tag_routes.router)
 router.include_router(notification_routes.router)
+router.include_router(metrics_routes.router)
@@ -19,7 +19,7 @@ router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
 def get_user_service(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     email_service: EmailService = Depends(EmailService),
 ) -> UserService:
     return UserService(email_service=email_service, db=db)
@@ -60,7 +60,7 @@ async def login(
     token_data = await user_service.login_user(data)
     return BaseResponse(
         message="User logged in successfully",
-        data=TokenResponse(**token_data),
+        data=token_data,
     )
 
 
@@ -72,7 +72,7 @@ async def token(
     token_data = await user_service.login_user(
         LoginEmailSchema(email=data.username, password=data.password)
     )
-    return TokenResponse(**token_data)
+    return token_data
 
 
 @router.post("/refresh")
@@ -81,4 +81,4 @@ async def refresh(
     data: RefreshTokenBody,
 ) -> TokenResponse:
     token_data = await user_service.refresh_to_access_token(data)
-    return TokenResponse(**token_data)
+    return token_data
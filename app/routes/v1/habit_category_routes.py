@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends
 from typing import Annotated
 from app.core.db_config import get_db
-from app.models.user import User
-from app.core.permissions import any_user_role, only_admin
+from app.core.db_routing import get_read_db
+from app.core.security import TokenPrincipal
+from app.core.permissions import any_principal, only_admin_principal
 from app.schemas import (
     HabitCategoryRequestSchema,
     BaseResponse,
@@ -14,14 +15,18 @@ from app.services import HabitCategoryService
 router = APIRouter(prefix="/habit-category", tags=["Habit Category"])
 
 
-def get_habit_category_service(db: AsyncSession = Depends(get_db)):
+def get_habit_category_service(db: AsyncSession = Depends(get_db, scope="function")):
+    return HabitCategoryService(db)
+
+
+def get_read_habit_category_service(db: AsyncSession = Depends(get_read_db)):
     return HabitCategoryService(db)
 
 
 @router.post("/")
 async def create_habit_category(
     data: HabitCategoryRequestSchema,
-    admin: Annotated[User, Depends(only_admin)],
+    admin: Annotated[TokenPrincipal, Depends(only_admin_principal)],
     habit_service: Annotated[HabitCategoryService, Depends(get_habit_category_service)],
 ) -> BaseResponse[HabitCategoryResponseSchema]:
     data = await habit_service.create_habit_category(data, admin)
@@ -30,8 +35,8 @@ async def create_habit_category(
 
 @router.get("/")
 async def get_all_habit_categories(
-    habit_service: Annotated[HabitCategoryService, Depends(get_habit_category_service)],
-    user: Annotated[User, Depends(any_user_role)],
+    habit_service: Annotated[HabitCategoryService, Depends(get_read_habit_category_service)],
+    user: Annotated[TokenPrincipal, Depends(any_principal)],
     name: str = None,
     search: str = None,
 ) -> BaseResponse[HabitCategoryResponseSchema]:
@@ -43,7 +48,7 @@ async def get_all_habit_categories(
 async def get_habit_category_by_id(
     category_id: int,
     habit_service: Annotated[HabitCategoryService, Depends(get_habit_category_service)],
-    user: Annotated[User, Depends(any_user_role)],
+    user: Annotated[TokenPrincipal, Depends(any_principal)],
 ) -> BaseResponse[HabitCategoryResponseSchema]:
     data = await habit_service.get_habit_category_by_id(category_id)
     return BaseResponse(message="Habit category fetched successfully", data=data)
@@ -53,7 +58,7 @@ async def get_habit_category_by_id(
 async def delete_habit_category_by_id(
     category_id: int,
     habit_service: Annotated[HabitCategoryService, Depends(get_habit_category_service)],
-    admin: Annotated[User, Depends(only_admin)],
+    admin: Annotated[TokenPrincipal, Depends(only_admin_principal)],
 ) -> BaseResponse[HabitCategoryResponseSchema]:
     data = await habit_service.delete_habit_category_by_id(category_id)
     return BaseResponse(message="Habit category deleted successfully", data=data)
@@ -63,7 +68,7 @@ async def delete_habit_category_by_id(
 async def update_habit_category_by_id(
     category_id: int,
     data: HabitCategoryRequestSchema,
-    _admin: Annotated[User, Depends(only_admin)],
+    _admin: Annotated[TokenPrincipal, Depends(only_admin_principal)],
     habit_service: Annotated[HabitCategoryService, Depends(get_habit_category_service)],
 ) -> BaseResponse[HabitCategoryResponseSchema]:
     data = await habit_service.update_habit_category_by_id(category_id, data)
@@ -74,7 +79,7 @@ async def update_habit_category_by_id(
 async def partial_update_habit_category_by_id(
     category_id: int,
     data: HabitCategoryRequestSchema,
-    _admin: Annotated[User, Depends(only_admin)],
+    _admin: Annotated[TokenPrincipal, Depends(only_admin_principal)],
     habit_service: Annotated[HabitCategoryService, Depends(get_habit_category_service)],
 ) -> BaseResponse[HabitCategoryResponseSchema]:
     data = await habit_service.update_habit_category_by_id(category_id, data)
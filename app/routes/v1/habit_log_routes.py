@@ -1,59 +1,117 @@
 # routes/habit_log.py
-from fastapi import APIRouter, Depends
-from typing import List
+from datetime import date
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from app.schemas.habit_log_schema import (
+    HabitHeatmap,
+    HeatmapEncoding,
+    HabitLogBulkResult,
+    HabitLogClear,
+    HabitLogClearResult,
     HabitLogCreate,
-    HabitLogResponse,
     HabitLogMultipleCreate,
-    HabitLogClear,
+    HabitLogResponse,
 )
-from app.services.habit_log_service import HabitLogService
-from app.repositories import HabitLogRepository
 from app.services import HabitLogService
+from app.services.habit_transfer_service import HabitTransferService
+from app.schemas.habit_transfer_schema import EXPORT_MEDIA_TYPES, ExportFormat
 from app.services.interface import IHabitLogService
 from app.core.db_config import get_db
+from app.core.db_routing import get_read_db
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models.user import User
-from app.schemas.common_schema import BaseResponse
-from app.schemas.habit_log_schema import HabitLogResponse
-from app.core.permissions import any_user_role
+from app.core.security import TokenPrincipal
+from app.schemas.common_schema import BaseResponse, CursorPage
+from app.core.permissions import any_principal
 from starlette import status
 
 
 router = APIRouter(prefix="/habit-logs", tags=["Habit Logs"])
 
 
-def get_habit_log_service(db: AsyncSession = Depends(get_db)) -> IHabitLogService:
+def get_habit_log_service(db: AsyncSession = Depends(get_db, scope="function")) -> IHabitLogService:
+    return HabitLogService(db)
+
+def get_read_habit_log_service(db: AsyncSession = Depends(get_read_db)) -> IHabitLogService:
     return HabitLogService(db)
 
-@router.post("/", response_model=HabitLogResponse, status_code=status.HTTP_201_CREATED)
+@router.get("/", response_model=BaseResponse[CursorPage[HabitLogResponse]])
+async def list_logs(
+    habit_id: Optional[int] = None,
+    habit_ids: Optional[List[int]] = Query(None),
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    user: TokenPrincipal = Depends(any_principal),
+    service: IHabitLogService = Depends(get_read_habit_log_service),
+):
+    ids = list(habit_ids or [])
+    if habit_id is not None:
+        ids.append(habit_id)
+    page = await service.list_logs(user.id, ids, date_from, date_to, cursor, limit)
+    return BaseResponse(message="Habit logs fetched successfully", data=page)
+
+@router.get("/export")
+async def export_logs(
+    format: ExportFormat = "ndjson",
+    habit_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    user: TokenPrincipal = Depends(any_principal),
+    db: AsyncSession = Depends(get_read_db),
+) -> StreamingResponse:
+    records = HabitTransferService(db).export(
+        user.id, format, include_habits=False, habit_id=habit_id, date_from=date_from, date_to=date_to
+    )
+    return StreamingResponse(
+        records,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="habit-logs.{format}"'},
+    )
+
+@router.get("/heatmap", response_model=BaseResponse[List[HabitHeatmap]], response_model_exclude_none=True)
+async def get_heatmap(
+    year: int = Query(default_factory=lambda: date.today().year, ge=1970, le=9999),
+    habit_id: Optional[int] = None,
+    encoding: HeatmapEncoding = "bitmap",
+    user: TokenPrincipal = Depends(any_principal),
+    service: IHabitLogService = Depends(get_read_habit_log_service),
+):
+    heatmaps = await service.get_heatmap(user.id, year, habit_id, encoding)
+    return BaseResponse(message="Habit heatmap fetched successfully", data=heatmaps)
+
+@router.post("/", response_model=BaseResponse[HabitLogResponse], status_code=status.HTTP_201_CREATED)
 async def create_log(
     data: HabitLogCreate,
-    user: User = Depends(any_user_role),
+    user: TokenPrincipal = Depends(any_principal),
     service: IHabitLogService = Depends(get_habit_log_service),
 ):
-    return await service.create_log(user.id, data)
+    log = await service.create_log(user.id, data)
+    return BaseResponse(message="Habit log created successfully", data=log)
 
 @router.delete("/{log_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_log(
     log_id: int,
-    user: User = Depends(any_user_role),
+    user: TokenPrincipal = Depends(any_principal),
     service: IHabitLogService = Depends(get_habit_log_service),
 ):
-    await service.delete_log(log_id)
+    await service.delete_log(user.id, log_id)
 
-@router.post("/bulk", status_code=status.HTTP_201_CREATED)
+@router.post("/bulk", response_model=BaseResponse[HabitLogBulkResult], status_code=status.HTTP_201_CREATED)
 async def create_multiple_logs(
     data: HabitLogMultipleCreate,
-    user: User = Depends(any_user_role),
+    user: TokenPrincipal = Depends(any_principal),
     service: IHabitLogService = Depends(get_habit_log_service),
 ):
-    await service.add_multiple_logs(data)
+    result = await service.add_multiple_logs(user.id, data)
+    return BaseResponse(message="Habit logs created successfully", data=result)
 
-@router.post("/clear", status_code=status.HTTP_200_OK)
+@router.post("/clear", response_model=BaseResponse[HabitLogClearResult], status_code=status.HTTP_200_OK)
 async def clear_logs(
     data: HabitLogClear,
-    user: User = Depends(any_user_role),
+    user: TokenPrincipal = Depends(any_principal),
     service: IHabitLogService = Depends(get_habit_log_service),
 ):
-    await service.clear_logs(data)
+    result = await service.clear_logs(user.id, data)
+    return BaseResponse(message="Habit logs cleared successfully", data=result)
@@ -1,14 +1,25 @@
-from fastapi import APIRouter, Depends
-from typing import Annotated
+from datetime import date
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import Annotated, Optional
+from sqlalchemy import literal, select, union
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.db_config import get_db
-from app.models.user import User
-from app.core.permissions import any_user_role
+from app.core.conditional import newest, not_modified, user_validators
+from app.core.db_routing import get_read_db
+from app.core.security import TokenPrincipal
+from app.core.permissions import any_principal
+from app.core.settings import setting
+from app.models import Habit, HabitCategory
 from app.services.habit_service import HabitService
+from app.services.habit_transfer_service import HabitTransferService
+from app.schemas.habit_transfer_schema import EXPORT_MEDIA_TYPES, ExportFormat, HabitImportResult
 from app.schemas import (
     HabitRequestSchema,
     HabitPartialRequestSchema,
     HabitResponseSchema,
+    HabitProgressSchema,
+    HabitDashboardSchema,
     BaseResponse,
 )
 
@@ -16,11 +27,21 @@ router = APIRouter(prefix="/habits", tags=["Habits"])
 habit_service = HabitService()
 
 
+def habit_validators(user_id: int, *criteria) -> list:
+    """``related`` validators of HabitResponseSchema: its user and its category with the category's owner."""
+    categories = select(Habit.category_id).where(*criteria).correlate(None)
+    owners = select(HabitCategory.user_id).where(HabitCategory.id.in_(categories)).correlate(None)
+    return [
+        *user_validators(union(select(literal(user_id)), owners)),
+        newest(HabitCategory.updated_at, HabitCategory.id.in_(categories)),
+    ]
+
+
 @router.post("/")
 async def create_habit(
     data: HabitRequestSchema,
-    user: Annotated[User, Depends(any_user_role)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    user: Annotated[TokenPrincipal, Depends(any_principal)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
 ) -> BaseResponse[HabitResponseSchema]:
     habit = await habit_service.create_habit(data, db, user)
     return BaseResponse(message="Habit created successfully", data=habit)
@@ -28,19 +49,86 @@ async def create_habit(
 
 @router.get("/")
 async def get_all_habits(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    user: Annotated[User, Depends(any_user_role)],
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    user: Annotated[TokenPrincipal, Depends(any_principal)],
 ) -> BaseResponse[list[HabitResponseSchema]]:
+    # current_streak depends on today's date as well
+    cached = await not_modified(
+        request, response, db, Habit, Habit.user_id == user.id,
+        vary=[date.today()], related=habit_validators(user.id, Habit.user_id == user.id),
+    )
+    if cached:
+        return cached
     habits = await habit_service.get_all_habits(db, user)
     return BaseResponse(message="Habits fetched successfully", data=habits)
 
 
+@router.get("/dashboard")
+async def get_habits_dashboard(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    user: Annotated[TokenPrincipal, Depends(any_principal)],
+    on_date: Annotated[Optional[date], Query(alias="date")] = None,
+) -> BaseResponse[list[HabitDashboardSchema]]:
+    habits = await habit_service.get_dashboard(db, user, on_date or date.today())
+    return BaseResponse(message="Habit dashboard fetched successfully", data=habits)
+
+
+@router.get("/export")
+async def export_habits(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    user: Annotated[TokenPrincipal, Depends(any_principal)],
+    format: ExportFormat = "ndjson",
+    include_logs: bool = True,
+) -> StreamingResponse:
+    # get_read_db is request scoped, so the session outlives the handler while the body streams
+    records = HabitTransferService(db).export(user.id, format, include_logs=include_logs)
+    return StreamingResponse(
+        records,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="habits.{format}"'},
+    )
+
+
+@router.post("/import")
+async def import_habits(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
+    user: Annotated[TokenPrincipal, Depends(any_principal)],
+    format: ExportFormat = "ndjson",
+    batch_size: Annotated[int, Query(ge=1, le=10_000)] = setting.HABIT_IMPORT_BATCH_SIZE,
+) -> BaseResponse[HabitImportResult]:
+    """Import an export of either format, sent as the raw request body."""
+    result = await HabitTransferService(db).import_records(user.id, request.stream(), format, batch_size)
+    return BaseResponse(message="Habits imported successfully", data=result)
+
+
+@router.get("/progress")
+async def get_habits_progress(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    user: Annotated[TokenPrincipal, Depends(any_principal)],
+    on_date: Annotated[Optional[date], Query(alias="date")] = None,
+) -> BaseResponse[list[HabitProgressSchema]]:
+    habits = await habit_service.get_progress(db, user, on_date or date.today())
+    return BaseResponse(message="Habit progress fetched successfully", data=habits)
+
+
 @router.get("/{habit_id}")
 async def get_habit_by_id(
     habit_id: int,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    user: Annotated[User, Depends(any_user_role)],
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
+    user: Annotated[TokenPrincipal, Depends(any_principal)],
 ) -> BaseResponse[HabitResponseSchema]:
+    criteria = (Habit.id == habit_id, Habit.user_id == user.id)
+    cached = await not_modified(
+        request, response, db, Habit, *criteria,
+        vary=[date.today()], related=habit_validators(user.id, *criteria),
+    )
+    if cached:
+        return cached
     habit = await habit_service.get_habit_by_id(habit_id, db)
     return BaseResponse(message="Habit fetched successfully", data=habit)
 
@@ -49,8 +137,8 @@ async def get_habit_by_id(
 async def update_habit(
     habit_id: int,
     data: HabitRequestSchema,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    user: Annotated[User, Depends(any_user_role)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
+    user: Annotated[TokenPrincipal, Depends(any_principal)],
 ) -> BaseResponse[HabitResponseSchema]:
     habit = await habit_service.update_habit_by_id(habit_id, data, db)
     return BaseResponse(message="Habit updated successfully", data=habit)
@@ -60,8 +148,8 @@ async def update_habit(
 async def partial_update_habit(
     habit_id: int,
     data: HabitPartialRequestSchema,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    user: Annotated[User, Depends(any_user_role)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
+    user: Annotated[TokenPrincipal, Depends(any_principal)],
 ) -> BaseResponse[HabitResponseSchema]:
     habit = await habit_service.update_habit_by_id(habit_id, data, db)
     return BaseResponse(message="Habit updated successfully", data=habit)
@@ -70,8 +158,8 @@ async def partial_update_habit(
 @router.delete("/{habit_id}")
 async def delete_habit(
     habit_id: int,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    user: Annotated[User, Depends(any_user_role)],
+    db: Annotated[AsyncSession, Depends(get_db, scope="function")],
+    user: Annotated[TokenPrincipal, Depends(any_principal)],
 ) -> BaseResponse[HabitResponseSchema]:
     await habit_service.delete_habit_by_id(habit_id, db)
     return BaseResponse(message="Habit deleted successfully", data=None)
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.db_config import get_db
-from app.core.permissions import any_user_role
-from app.models.user import User
+from app.core.permissions import any_principal
+from app.core.security import TokenPrincipal
 from app.services.log_service import LogService
 from app.schemas.common_schema import BaseResponse
 from app.schemas.log_schema import LogCreate, LogRead
@@ -10,13 +10,13 @@ from app.schemas.log_schema import LogCreate, LogRead
 
 router = APIRouter(prefix="/logs", tags=["Logs"])
 
-def get_log_service(db: AsyncSession = Depends(get_db)):
+def get_log_service(db: AsyncSession = Depends(get_db, scope="function")):
     return LogService(db)
 
 @router.post("/", response_model=BaseResponse[LogRead])
 async def create_log(
     log_data: LogCreate,
-    current_user: User = Depends(any_user_role),
+    current_user: TokenPrincipal = Depends(any_principal),
     service: LogService = Depends(get_log_service)
 ):
     log_data['user_id'] = current_user.id
@@ -26,7 +26,7 @@ async def create_log(
 
 @router.get("/", response_model=BaseResponse[list[LogRead]])
 async def get_user_logs(
-    current_user: User = Depends(any_user_role),
+    current_user: TokenPrincipal = Depends(any_principal),
     service: LogService = Depends(get_log_service)
 ):
     logs = await service.get_user_logs(current_user.id)
@@ -0,0 +1,44 @@
+from typing import Annotated
+from fastapi import APIRouter, Depends
+from app.core.cache import tag_cache, token_cache, user_cache
+from app.core.db_config import engine, read_engine
+from app.core.db_pool import pool_status
+from app.core.hashing import password_hasher
+from app.core.permissions import only_admin_principal
+from app.core.security import TokenPrincipal
+from app.schemas.common_schema import BaseResponse
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("/cache")
+async def get_cache_metrics(
+    _admin: Annotated[TokenPrincipal, Depends(only_admin_principal)],
+) -> BaseResponse[dict]:
+    return BaseResponse(
+        message="Cache metrics fetched successfully",
+        data={"user": user_cache.stats(), "token": token_cache.stats(), "tag": tag_cache.stats()},
+    )
+
+
+@router.get("/password-hashing")
+async def get_password_hashing_metrics(
+    _admin: Annotated[TokenPrincipal, Depends(only_admin_principal)],
+) -> BaseResponse[dict]:
+    return BaseResponse(
+        message="Password hashing metrics fetched successfully",
+        data=password_hasher.stats(),
+    )
+
+
+@router.get("/db-pool")
+async def get_db_pool_metrics(
+    _admin: Annotated[TokenPrincipal, Depends(only_admin_principal)],
+) -> BaseResponse[dict]:
+    return BaseResponse(
+        message="Database pool metrics fetched successfully",
+        data={
+            "primary": pool_status(engine),
+            "read": pool_status(read_engine) if read_engine is not engine else None,
+        },
+    )
@@ -1,31 +1,85 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
-from app.core.permissions import any_user_role
-from app.schemas.common_schema import BaseResponse
-from app.schemas.note_schema import NoteCreate, NoteRead, NoteUpdate
+from typing import List, Optional
+from app.core.conditional import newest, not_modified, user_validators
+from app.core.permissions import any_principal
+from app.models.association import note_tag_table
+from app.models.note import Note
+from app.models.tag import Tag
+from app.schemas.common_schema import BaseResponse, CursorPage
+from app.schemas.note_schema import (
+    NoteCreate,
+    NoteRead,
+    NoteRevisionRead,
+    NoteRevisionSummary,
+    NoteSearchResult,
+    NoteSummary,
+    NoteUpdate,
+)
 from app.services.note_service import NoteService
-from app.models.user import User
+from app.core.security import TokenPrincipal
 from app.core.db_config import get_db
+from app.core.db_routing import get_read_db
 
 
-def get_note_service(db: AsyncSession = Depends(get_db)) -> NoteService:
+def get_note_service(db: AsyncSession = Depends(get_db, scope="function")) -> NoteService:
+    return NoteService(db)
+
+
+def get_read_note_service(db: AsyncSession = Depends(get_read_db)) -> NoteService:
     return NoteService(db)
 
 router = APIRouter(prefix="/notes", tags=["Notes"])
 
+
+def note_tag_validators(user_id: int) -> list:
+    """``related`` validators of NoteSummary tags: renamed tags and links dropped with a deleted tag."""
+    links = (
+        select(note_tag_table.c.tag_id)
+        .join(Note, Note.id == note_tag_table.c.note_id)
+        .where(Note.user_id == user_id)
+        .correlate(None)
+    )
+    return [
+        newest(Tag.updated_at, Tag.id.in_(links)),
+        select(func.count()).select_from(links.subquery()).scalar_subquery(),
+    ]
+
+
 @router.get("/")
 async def list_notes(
-    current_user: User = Depends(any_user_role),
-    service: NoteService = Depends(get_note_service)
-)-> BaseResponse[List[NoteRead]]:
-    response = await service.list_notes(current_user.id)
+    request: Request,
+    http_response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    current_user: TokenPrincipal = Depends(any_principal),
+    service: NoteService = Depends(get_read_note_service)
+)-> BaseResponse[CursorPage[NoteSummary]]:
+    cached = await not_modified(
+        request, http_response, service.db, Note, Note.user_id == current_user.id,
+        related=note_tag_validators(current_user.id),
+    )
+    if cached:
+        return cached
+    response = await service.list_notes(current_user.id, cursor, limit)
     return BaseResponse(message="Notes fetched successfully", data=response)
 
+@router.get("/search")
+async def search_notes(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    current_user: TokenPrincipal = Depends(any_principal),
+    service: NoteService = Depends(get_read_note_service)
+) -> BaseResponse[List[NoteSearchResult]]:
+    results = await service.search_notes(current_user.id, q, limit, offset)
+    return BaseResponse(message="Notes searched successfully", data=results)
+
 @router.post("/", response_model=NoteRead)
 async def create_note(
     note_data: NoteCreate,
-    current_user: User = Depends(any_user_role),
+    current_user: TokenPrincipal = Depends(any_principal),
     service: NoteService = Depends(get_note_service)
 ):
     return await service.create_note(note_data, current_user.id)
@@ -33,19 +87,50 @@ async def create_note(
 @router.get("/{note_id}", response_model=NoteRead)
 async def get_note(
     note_id: int,
-    current_user: User = Depends(any_user_role),
+    request: Request,
+    http_response: Response,
+    current_user: TokenPrincipal = Depends(any_principal),
     service: NoteService = Depends(get_note_service)
 ):
+    cached = await not_modified(
+        request, http_response, service.db, Note,
+        Note.id == note_id, Note.user_id == current_user.id,
+        related=user_validators([current_user.id]),
+        check_modified_since=True,
+    )
+    if cached:
+        return cached
     note = await service.get_note(note_id, current_user.id)
     if not note:
         raise HTTPException(status_code=404, detail="Note not found")
     return note
 
+@router.get("/{note_id}/revisions")
+async def list_note_revisions(
+    note_id: int,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    current_user: TokenPrincipal = Depends(any_principal),
+    service: NoteService = Depends(get_read_note_service)
+) -> BaseResponse[CursorPage[NoteRevisionSummary]]:
+    page = await service.list_revisions(note_id, current_user.id, cursor, limit)
+    return BaseResponse(message="Note revisions fetched successfully", data=page)
+
+@router.get("/{note_id}/revisions/{version}")
+async def get_note_revision(
+    note_id: int,
+    version: int,
+    current_user: TokenPrincipal = Depends(any_principal),
+    service: NoteService = Depends(get_read_note_service)
+) -> BaseResponse[NoteRevisionRead]:
+    revision = await service.get_revision(note_id, current_user.id, version)
+    return BaseResponse(message="Note revision fetched successfully", data=revision)
+
 @router.put("/{note_id}", response_model=NoteRead)
 async def update_note(
     note_id: int,
     note_data: NoteUpdate,
-    current_user: User = Depends(any_user_role),
+    current_user: TokenPrincipal = Depends(any_principal),
     service: NoteService = Depends(get_note_service)
 ):
     updated = await service.update_note(note_id, current_user.id, note_data)
@@ -56,7 +141,7 @@ async def update_note(
 @router.delete("/{note_id}")
 async def delete_note(
     note_id: int,
-    current_user: User = Depends(any_user_role),
+    current_user: TokenPrincipal = Depends(any_principal),
     service: NoteService = Depends(get_note_service)
 ):
     success = await service.delete_note(note_id, current_user.id)
@@ -2,8 +2,9 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.db_config import get_db
-from app.core.permissions import any_user_role
-from app.models.user import User
+from app.core.db_routing import get_read_db
+from app.core.permissions import any_principal
+from app.core.security import TokenPrincipal
 from app.services.interface import INotificationService
 from app.services.notification_service import NotificationService
 from app.schemas.common_schema import BaseResponse
@@ -12,16 +13,20 @@ from app.schemas.notification_schema import  NotificationRead
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
 
-def get_notification_service(db: AsyncSession = Depends(get_db)) -> INotificationService:
+def get_notification_service(db: AsyncSession = Depends(get_db, scope="function")) -> INotificationService:
+    return NotificationService(db)
+
+
+def get_read_notification_service(db: AsyncSession = Depends(get_read_db)) -> INotificationService:
     return NotificationService(db)
 
 
 @router.get("/", response_model=BaseResponse[list[NotificationRead]])
 async def get_all_notifications(
     notification_service: Annotated[
-        NotificationService, Depends(get_notification_service)
+        NotificationService, Depends(get_read_notification_service)
     ],
-    user: Annotated[User, Depends(any_user_role)],
+    user: Annotated[TokenPrincipal, Depends(any_principal)],
 ):
     notifications = await notification_service.get_all_notifications(user.id)
     return BaseResponse(
@@ -34,7 +39,7 @@ async def get_unread_notifications(
     notification_service: Annotated[
         NotificationService, Depends(get_notification_service)
     ],
-    user: Annotated[User, Depends(any_user_role)],
+    user: Annotated[TokenPrincipal, Depends(any_principal)],
 ):
     notifications = await notification_service.get_unread_notifications(user.id)
     return BaseResponse(
@@ -48,7 +53,7 @@ async def read_notification(
     notification_service: Annotated[
         NotificationService, Depends(get_notification_service)
     ],
-    user: Annotated[User, Depends(any_user_role)],
+    user: Annotated[TokenPrincipal, Depends(any_principal)],
 ):
     notification = await notification_service.mark_as_read(notification_id)
     return BaseResponse(message="Notification marked as read", data=notification)
@@ -59,7 +64,7 @@ async def clear_notifications(
     notification_service: Annotated[
         NotificationService, Depends(get_notification_service)
     ],
-    user: Annotated[User, Depends(any_user_role)],
+    user: Annotated[TokenPrincipal, Depends(any_principal)],
 ):
     await notification_service.clear_all(user.id)
     return BaseResponse(message="Notifications cleared", data=None)
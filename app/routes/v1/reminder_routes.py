@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from app.core.db_config import get_db
-from app.core.permissions import any_user_role
-from app.models.user import User
+from app.core.conditional import not_modified
+from app.core.db_routing import get_read_db
+from app.core.permissions import any_principal
+from app.core.security import TokenPrincipal
+from app.models.reminder import Reminder
 from app.repositories.reminder_repository import ReminderRepository
 from app.schemas.common_schema import BaseResponse
 from app.schemas.reminder import (
@@ -18,37 +21,56 @@ router = APIRouter(
     prefix="/reminder",
     tags=["Reminder"]
 )
-def get_reminder_service(db: AsyncSession = Depends(get_db)) -> ReminderService:
+def get_reminder_service(db: AsyncSession = Depends(get_db, scope="function")) -> ReminderService:
     return ReminderService(repository=ReminderRepository(db))    
 
-@router.post("/", response_model=ReminderOut, status_code=status.HTTP_201_CREATED)
+
+def get_read_reminder_service(db: AsyncSession = Depends(get_read_db)) -> ReminderService:
+    return ReminderService(repository=ReminderRepository(db))
+
+@router.post("/", response_model=BaseResponse[ReminderOut], status_code=status.HTTP_201_CREATED)
 async def create_reminder(
     data: ReminderCreate,
-    user: User = Depends(any_user_role),
+    user: TokenPrincipal = Depends(any_principal),
     reminder_service: ReminderService = Depends(get_reminder_service)
 ) -> BaseResponse[ReminderOut]:
     reminder = await reminder_service.create_reminder(user.id, data)
     return BaseResponse(message="Reminder created successfully", data=reminder)
 
 
-@router.get("/{reminder_id}", response_model=ReminderOut)
+@router.get("/{reminder_id}", response_model=BaseResponse[ReminderOut])
 async def get_reminder(
     reminder_id: int,
+    request: Request,
+    response: Response,
     reminder_service: ReminderService = Depends(get_reminder_service)
 ) -> BaseResponse[ReminderOut]:
+    cached = await not_modified(
+        request, response, reminder_service.repository.db, Reminder, Reminder.id == reminder_id,
+        check_modified_since=True,
+    )
+    if cached:
+        return cached
     reminder = await reminder_service.get_reminder_by_id(reminder_id)
     return BaseResponse(message="Reminder fetched successfully", data=reminder)
 
 @router.get("/", response_model=BaseResponse[List[ReminderOut]])
 async def get_user_reminders(
-    user: User = Depends(any_user_role),    
-    reminder_service: ReminderService = Depends(get_reminder_service)
+    request: Request,
+    response: Response,
+    user: TokenPrincipal = Depends(any_principal),    
+    reminder_service: ReminderService = Depends(get_read_reminder_service)
 ) -> BaseResponse[List[ReminderOut]]:
+    cached = await not_modified(
+        request, response, reminder_service.repository.db, Reminder, Reminder.user_id == user.id
+    )
+    if cached:
+        return cached
     reminders = await reminder_service.get_user_reminders(user.id)
     return BaseResponse(message="Reminders fetched successfully", data=reminders)
 
 
-@router.patch("/{reminder_id}", response_model=ReminderOut)
+@router.patch("/{reminder_id}", response_model=BaseResponse[ReminderOut])
 async def update_reminder(
     reminder_id: int,
     data: ReminderUpdate,
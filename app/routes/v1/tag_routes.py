@@ -0,0 +1,25 @@
+from typing import List
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.db_routing import get_read_db
+from app.core.permissions import any_principal
+from app.core.security import TokenPrincipal
+from app.schemas.common_schema import BaseResponse
+from app.schemas.tag_schema import TagSuggestion
+from app.services.tag_service import TagService
+
+
+def get_read_tag_service(db: AsyncSession = Depends(get_read_db)) -> TagService:
+    return TagService(db)
+
+router = APIRouter(prefix="/tags", tags=["Tags"])
+
+@router.get("/suggest")
+async def suggest_tags(
+    prefix: str = Query("", max_length=50),
+    limit: int = Query(10, ge=1, le=50),
+    current_user: TokenPrincipal = Depends(any_principal),
+    service: TagService = Depends(get_read_tag_service)
+) -> BaseResponse[List[TagSuggestion]]:
+    suggestions = await service.suggest_tags(current_user.id, prefix, limit)
+    return BaseResponse(message="Tags suggested successfully", data=suggestions)
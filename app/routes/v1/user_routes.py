@@ -1,7 +1,8 @@
 from typing import Annotated
 from fastapi import APIRouter, Depends, status
 from app.core.db_config import get_db
-from app.core.permissions import any_user_role
+from app.core.permissions import any_principal, any_user_role
+from app.core.security import TokenPrincipal
 from app.models import User
 from app.schemas.common_schema import BaseResponse
 from app.schemas.user_schema import ProfileUpdateSchema, ProfileUpdateForm, UserBasicSchema
@@ -17,7 +18,7 @@ def get_email_service() -> EmailService:
 
 
 def get_user_service(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     email_service: EmailService = Depends(get_email_service)
 ) -> UserService:
     return UserService(email_service=email_service, db=db)
@@ -42,7 +43,7 @@ async def get_user_profile(user: Annotated[User, Depends(any_user_role)]) -> Use
 )
 async def update_profile(
     data: ProfileUpdateSchema,
-    current_user: Annotated[User, Depends(any_user_role)],
+    current_user: Annotated[TokenPrincipal, Depends(any_principal)],
     service: Annotated[UserService, Depends(get_user_service)]
 ) -> BaseResponse[None]:
     await service.update_profile(current_user.id, data)
@@ -58,7 +59,7 @@ async def update_profile(
 )
 async def update_profile_with_form(
     form_data: Annotated[ProfileUpdateForm, Depends()],
-    current_user: Annotated[User, Depends(any_user_role)],
+    current_user: Annotated[TokenPrincipal, Depends(any_principal)],
     service: Annotated[UserService, Depends(get_user_service)]
 ) -> BaseResponse[None]:
     await service.update_profile_form(current_user.id, form_data)
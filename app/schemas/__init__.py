@@ -1,4 +1,4 @@
-from app.schemas.common_schema import BaseResponse, TokenResponse
+from app.schemas.common_schema import BaseResponse, CursorPage, TokenResponse
 from app.schemas.user_schema import (
     ProfileUpdateSchema,
     ProfileUpdateForm,
@@ -14,16 +14,23 @@ from app.schemas.habit_schema import (
     HabitRequestSchema,
     HabitModelSchema,
     HabitResponseSchema,
-    HabitPartialRequestSchema
+    HabitPartialRequestSchema,
+    HabitProgressSchema,
+    HabitDashboardSchema,
 )
 from app.schemas.habit_log_schema import (
     HabitLogCreate,
-    HabitLogClear
-
+    HabitLogClear,
+    HabitLogMultipleCreate,
+    HabitLogBulkResult,
+    HabitLogResponse,
+    HabitHeatmap,
+    HabitLogClearResult,
 )
 
 __all__ = [
     "BaseResponse",
+    "CursorPage",
     "TokenResponse",
     "ProfileUpdateSchema",
     "ProfileUpdateForm",
@@ -36,6 +43,13 @@ __all__ = [
     "HabitModelSchema",
     "HabitResponseSchema",
     "HabitPartialRequestSchema",
+    "HabitProgressSchema",
+    "HabitDashboardSchema",
     "HabitLogCreate",
-    "HabitLogClear"
+    "HabitLogClear",
+    "HabitLogMultipleCreate",
+    "HabitLogBulkResult",
+    "HabitLogResponse",
+    "HabitHeatmap",
+    "HabitLogClearResult",
 ]
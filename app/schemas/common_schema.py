@@ -1,4 +1,4 @@
-from typing import TypeVar, Generic, Optional
+from typing import TypeVar, Generic, List, Optional
 from pydantic import BaseModel
 from app.models.enums import UserRole
 
@@ -9,6 +9,11 @@ class BaseResponse(BaseModel, Generic[T]):
     message: str
     data: Optional[T] = None
 
+class CursorPage(BaseModel, Generic[T]):
+    items: List[T]
+    # Opaque, pass back as ``cursor`` to get the next page; None on the last page
+    next_cursor: Optional[str] = None
+
 class TokenResponse(BaseModel):
     access_token: str
     refresh_token: Optional[str] = None
@@ -15,6 +15,10 @@ class HabitCategoryResponseSchema(HabitCategoryRequestSchema):
     user_id: int
     user: UserBasicSchema
 
+    class Config:
+        from_attributes = True
+        populate_by_name = True
+
 class HabitCategoryPartialRequestSchema(BaseModel):  # for PATCH
     name: Optional[str] = Field(None, max_length=50)
     icon_name: Optional[str] = Field(None, max_length=50, alias="iconName")
\ No newline at end of file
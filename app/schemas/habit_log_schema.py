@@ -1,7 +1,7 @@
 # schemas/habit_log.py
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 from datetime import date
-from typing import List
+from typing import List, Literal, Optional, Tuple
 
 class HabitLogBase(BaseModel):
     habit_id: int
@@ -11,12 +11,57 @@ class HabitLogCreate(HabitLogBase):
     pass
 
 class HabitLogMultipleCreate(BaseModel):
-    habit_ids: List[int]
-    completed_date: date
+    """Logs every habit in ``habit_ids`` on every day in ``completed_dates``."""
+    habit_ids: List[int] = Field(..., min_length=1, max_length=100)
+    completed_dates: List[date] = Field(..., min_length=1, max_length=366)
 
-class HabitLogClear(BaseModel):
+class HabitLogBulkResult(BaseModel):
+    requested: int
+    inserted: int
+
+HeatmapEncoding = Literal["bitmap", "ranges"]
+
+class HabitHeatmap(BaseModel):
+    """One habit's year of completions.
+
+    ``bitmap`` is a base64 bitset, bit ``i`` = day-of-year ``i`` (0 = Jan 1),
+    least significant bit first. ``ranges`` holds ``(first_day, length)`` runs.
+    """
     habit_id: int
-    completed_date: date
+    year: int
+    days: int
+    completed: int
+    bitmap: Optional[str] = None
+    ranges: Optional[List[Tuple[int, int]]] = None
+
+class HabitLogClear(BaseModel):
+    """Clears ``habit_ids`` between ``date_from`` and ``date_to`` inclusive.
+
+    ``habit_id`` and ``completed_date`` are still accepted for a single habit or day.
+    """
+    habit_ids: List[int] = Field(default_factory=list, max_length=100)
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    habit_id: Optional[int] = None
+    completed_date: Optional[date] = None
+
+    @model_validator(mode="after")
+    def normalize(self):
+        if self.habit_id is not None and self.habit_id not in self.habit_ids:
+            self.habit_ids.append(self.habit_id)
+        if self.completed_date is not None:
+            self.date_from = self.date_from or self.completed_date
+            self.date_to = self.date_to or self.completed_date
+        if not self.habit_ids:
+            raise ValueError("habit_ids or habit_id is required")
+        if self.date_from is None or self.date_to is None:
+            raise ValueError("date_from and date_to (or completed_date) are required")
+        if self.date_from > self.date_to:
+            raise ValueError("date_from must not be after date_to")
+        return self
+
+class HabitLogClearResult(BaseModel):
+    deleted: int
 
 class HabitLogResponse(HabitLogBase):
     id: int
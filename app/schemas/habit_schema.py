@@ -1,3 +1,4 @@
+from datetime import date
 from pydantic import BaseModel, Field
 from typing import Optional
 from app.schemas.user_schema import UserBasicSchema
@@ -31,6 +32,43 @@ class HabitResponseSchema(HabitRequestSchema):
     user_id: int
     user: UserBasicSchema
     category: HabitCategoryResponseSchema
+    current_streak: int = 0
+    longest_streak: int = 0
 
     class Config:
         from_attributes = True
+
+
+class PeriodProgressSchema(BaseModel):
+    period_type: FrequencyType
+    period_start: date
+    completed: int
+    target: int
+    done: bool
+
+
+class HabitProgressSchema(PeriodProgressSchema):
+    habit_id: int
+    title: str
+
+
+class HabitCategoryBriefSchema(BaseModel):
+    id: int
+    name: str
+    icon_name: str
+
+    class Config:
+        from_attributes = True
+
+
+class HabitDashboardSchema(BaseModel):
+    id: int
+    title: str
+    description: Optional[str] = None
+    frequency_type: FrequencyType
+    frequency_count: int
+    category: HabitCategoryBriefSchema
+    current_streak: int
+    longest_streak: int
+    done_today: bool
+    progress: PeriodProgressSchema
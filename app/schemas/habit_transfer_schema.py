@@ -0,0 +1,46 @@
+from datetime import date
+from typing import Literal, Optional
+from pydantic import BaseModel, Field
+from app.models.enums import FrequencyType
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# Column order of CSV exports; NDJSON records use the same keys
+EXPORT_FIELDS = [
+    "type",
+    "id",
+    "title",
+    "description",
+    "category_id",
+    "frequency_type",
+    "frequency_count",
+    "habit_id",
+    "completed_date",
+]
+
+
+class HabitRecord(BaseModel):
+    type: Literal["habit"] = "habit"
+    id: int
+    title: str = Field(..., max_length=255)
+    description: Optional[str] = None
+    category_id: int
+    frequency_type: FrequencyType
+    frequency_count: int
+
+
+class HabitLogRecord(BaseModel):
+    """``habit_id`` is the id of a habit record earlier in the file or, in a
+    file without habit records, of an existing habit of the importing user."""
+    type: Literal["log"] = "log"
+    habit_id: int
+    completed_date: date
+
+
+class HabitImportResult(BaseModel):
+    habits_created: int = 0
+    logs_inserted: int = 0
+    # Logs already present for that habit and day
+    logs_skipped: int = 0
@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, Field, StringConstraints
+from datetime import datetime
+from typing import Annotated, List, Optional
 
 from app.schemas.user_schema import UserBasicSchema
 
@@ -8,19 +9,66 @@ class NoteBase(BaseModel):
     description: Optional[str] = None
     tag_ids: Optional[List[int]] = []
 
-class NoteCreate(NoteBase):
+TagName = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=50)]
+
+class NoteWrite(NoteBase):
+    # Tags by name, created if they do not exist yet; combined with tag_ids
+    tag_names: Optional[List[TagName]] = Field(None, max_length=50)
+
+class NoteCreate(NoteWrite):
     pass
 
-class NoteUpdate(NoteBase):
+class NoteUpdate(NoteWrite):
     pass
 
+class NoteSearchResult(BaseModel):
+    id: int
+    title: str
+    # Matching excerpt with hits wrapped in [ ]
+    snippet: Optional[str] = None
+    # Higher is more relevant
+    rank: float
+    updated_at: datetime
+
+class NoteTagSchema(BaseModel):
+    id: int
+    name: str
+
+    class Config:
+        from_attributes = True
+
+class NoteSummary(BaseModel):
+    """List item: no user and only the head of the description."""
+    id: int
+    title: str
+    # First NOTE_EXCERPT_LENGTH characters of the description
+    excerpt: Optional[str] = None
+    tags: List[NoteTagSchema] = []
+    created_at: datetime
+    updated_at: datetime
+
+class NoteRevisionSummary(BaseModel):
+    version: int
+    # Full copy, otherwise a delta against the previous version
+    is_snapshot: bool
+    # Stored (compressed) bytes
+    size: int
+    created_at: datetime
+
+class NoteRevisionRead(BaseModel):
+    version: int
+    title: str
+    description: Optional[str] = None
+    created_at: datetime
+
 class NoteRead(NoteBase):
     id: int
     user_id: int
     tag_ids: List[int]
     user: UserBasicSchema
-    created_at :str = Field(alias="createdAt")
-    updated_at :str = Field(alias="updatedAt")
+    created_at :datetime = Field(alias="createdAt")
+    updated_at :datetime = Field(alias="updatedAt")
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+        populate_by_name = True
\ No newline at end of file
@@ -1,3 +1,4 @@
+from datetime import datetime
 from pydantic import BaseModel, Field
 from typing import Optional, List
 
@@ -11,8 +12,9 @@ class NotificationRead(NotificationCreate):
     id: int = Field(..., description="Unique identifier of the notification")
     is_read: bool = Field(False, description="Indicates if the notification has been read", alias="read")
     sent: bool = Field(False, description="Indicates if the notification has been sent")
-    created_at: str = Field(..., description="Timestamp when the notification was created", alias="createdAt")
-    updated_at: str = Field(..., description="Timestamp when the notification was last updated", alias="updatedAt")
+    created_at: datetime = Field(..., description="Timestamp when the notification was created", alias="createdAt")
+    updated_at: datetime = Field(..., description="Timestamp when the notification was last updated", alias="updatedAt")
 
     class Config:
         from_attributes = True
+        populate_by_name = True
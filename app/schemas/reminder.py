@@ -1,25 +1,38 @@
-from datetime import datetime
-from pydantic import BaseModel, Field
+from datetime import datetime, timezone
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional
 
 
+def to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Reminder dates are stored as naive UTC; offsets are converted, naive values taken as UTC."""
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
 class ReminderCreate(BaseModel):
     title: str
     description: Optional[str] = None
     reminder_date: datetime
 
+    _normalize_reminder_date = field_validator("reminder_date")(to_naive_utc)
+
 
 class ReminderUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     reminder_date: Optional[datetime] = None
 
+    _normalize_reminder_date = field_validator("reminder_date")(to_naive_utc)
+
 
 class ReminderOut(BaseModel):
     id: int
     title: str
     description: Optional[str]
     reminder_date: datetime
+    # When the reminder fired, None while it is pending
+    notified_at: Optional[datetime] = None
     user_id: int
     created_at: datetime
     updated_at: datetime
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class TagSuggestion(BaseModel):
+    id: int
+    name: str
+    # Notes of the caller carrying this tag
+    use_count: int = 0
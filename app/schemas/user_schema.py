@@ -57,10 +57,16 @@ class ProfileBasicSchema(BaseModel):
     bio: str | None
     profile_picture_url: str | None
 
+    class Config:
+        from_attributes = True
+
 class UserBasicSchema(BaseModel):
     id: int
     email: str
     first_name: str
     last_name: str
     role: UserRole
-    profile:ProfileBasicSchema|None
\ No newline at end of file
+    profile:ProfileBasicSchema|None
+
+    class Config:
+        from_attributes = True
@@ -3,6 +3,7 @@ from app.services.email_service import EmailService
 from app.services.common_service import CommonService
 from app.services.habit_category_service import HabitCategoryService
 from app.services.reminder_service import ReminderService
+from app.services.habit_log_service import HabitLogService
 
 __all__ = [
     "UserService",
@@ -10,4 +11,5 @@ __all__ = [
     "CommonService",
     "HabitCategoryService",
     "ReminderService",
+    "HabitLogService",
 ]
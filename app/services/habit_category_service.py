@@ -1,5 +1,5 @@
 from app.core.logger_config import logger as default_logger
-from app.models.user import User
+from app.core.security import TokenPrincipal
 from app.schemas import (
     HabitCategoryRequestSchema,
     HabitCategoryModelSchema,
@@ -30,7 +30,7 @@ class HabitCategoryService:
     async def create_habit_category(
         self,
         category_data: HabitCategoryRequestSchema,
-        current_user: User,
+        current_user: TokenPrincipal,
     ) -> HabitCategoryResponseSchema:
         habit_category_data = HabitCategoryModelSchema(
             **category_data.model_dump(), user_id=current_user.id
@@ -1,26 +1,155 @@
 # services/habit_log.py
-from app.schemas.habit_log_schema import HabitLogCreate, HabitLogMultipleCreate, HabitLogClear
+from datetime import date
+from typing import Iterable, List, Optional
+from app.schemas.habit_log_schema import (
+    HabitHeatmap,
+    HabitLogBulkResult,
+    HabitLogClearResult,
+    HeatmapEncoding,
+    HabitLogClear,
+    HabitLogCreate,
+    HabitLogMultipleCreate,
+    HabitLogResponse,
+)
+from app.schemas.common_schema import CursorPage
 from app.repositories.interface import IHabitLogRepository
-from app.models import HabitLog
 from app.services.interface import IHabitLogService
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.logger_config import logger as default_logger
-from app.repositories import HabitLogRepository
+from app.models import Habit
+from app.repositories import HabitLogRepository, HabitProgressRepository
+from app.repositories.habit_progress_repository import period_deltas
+from app.services.streak_service import StreakService
+from app.utils.common import CustomException
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.heatmap import day_ranges, encode_bitmap, pack_days, year_length
 
 class HabitLogService(IHabitLogService):
-    def __init__(self, db: AsyncSession, repository: HabitLogRepository = None, logger=None):
+    def __init__(self, db: AsyncSession, repository: IHabitLogRepository = None, logger=None):
         self.db = db
         self.logger = logger or default_logger
         self.repository = repository or HabitLogRepository(db, self.logger)
+        self.progress_repository = HabitProgressRepository(db, self.logger)
+        self.streaks = StreakService(db, self.repository, self.progress_repository, self.logger)
+
+    async def _get_owned_habits(
+        self, user_id: int, habit_ids: Iterable[int], for_update: bool = False
+    ) -> dict[int, Habit]:
+        habit_ids = set(habit_ids)
+        habits = await self.repository.get_owned_habits(user_id, habit_ids, for_update=for_update)
+        if habits.keys() != habit_ids:
+            raise CustomException("Habit does not found", status_code=404)
+        return habits
 
     async def create_log(self, user_id: int, data: HabitLogCreate):
         self.logger.info(f"Creating log for user_id={user_id}")
-        return await self.repository.create(data.habit_id, data.completed_date)
+        # Locked before anything is read: the streaks are updated from the habit row
+        habits = await self._get_owned_habits(user_id, [data.habit_id], for_update=True)
+        log, created = await self.repository.add(data.habit_id, data.completed_date)
+        if created:
+            await self.progress_repository.apply(period_deltas([(log.habit_id, log.completed_date)]))
+            await self.streaks.log_added(habits[data.habit_id], data.completed_date)
+        return log
 
-    async def delete_log(self, log_id: int):
+    async def delete_log(self, user_id: int, log_id: int):
         self.logger.info(f"Deleting habit log id={log_id}")
-        return await self.repository.delete_by_id(log_id)
+        habit = await self.repository.get_log_habit(user_id, log_id, for_update=True)
+        deleted = await self.repository.delete_by_id(log_id, user_id) if habit else None
+        if deleted is None:
+            raise CustomException("Habit log not found", status_code=404)
+        await self.progress_repository.apply(period_deltas([deleted], sign=-1))
+        await self.streaks.log_removed(habit, deleted.completed_date)
+
+    async def add_multiple_logs(self, user_id: int, data: HabitLogMultipleCreate) -> HabitLogBulkResult:
+        habit_ids = list(dict.fromkeys(data.habit_ids))
+        completed_dates = list(dict.fromkeys(data.completed_dates))
+        self.logger.info(
+            f"Bulk logging {len(habit_ids)} habit(s) x {len(completed_dates)} day(s) for user_id={user_id}"
+        )
+        habits = await self._get_owned_habits(user_id, habit_ids, for_update=True)
+        rows = [
+            {"habit_id": habit_id, "completed_date": completed_date}
+            for habit_id in habit_ids
+            for completed_date in completed_dates
+        ]
+        inserted = await self.repository.add_many(rows)
+        await self.progress_repository.apply(
+            period_deltas((log.habit_id, log.completed_date) for log in inserted)
+        )
+
+        inserted_dates: dict[int, list[date]] = {}
+        for log in inserted:
+            inserted_dates.setdefault(log.habit_id, []).append(log.completed_date)
+        for habit_id, days in inserted_dates.items():
+            await self.streaks.logs_added(habits[habit_id], days)
+        return HabitLogBulkResult(requested=len(rows), inserted=len(inserted))
+
+    async def list_logs(
+        self,
+        user_id: int,
+        habit_ids: Optional[List[int]] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> CursorPage[HabitLogResponse]:
+        if habit_ids:
+            await self._get_owned_habits(user_id, habit_ids)
+        after = None
+        if cursor:
+            after_habit_id, after_date = decode_cursor(cursor, 2)
+            try:
+                after = (int(after_habit_id), date.fromisoformat(after_date))
+            except (TypeError, ValueError):
+                raise CustomException("Invalid cursor", status_code=400)
+
+        logs = await self.repository.list_for_user(
+            user_id, habit_ids or None, date_from, date_to, after, limit + 1
+        )
+        next_cursor = None
+        if len(logs) > limit:
+            logs = logs[:limit]
+            next_cursor = encode_cursor(logs[-1].habit_id, logs[-1].completed_date.isoformat())
+        return CursorPage[HabitLogResponse](
+            items=[HabitLogResponse.model_validate(log) for log in logs], next_cursor=next_cursor
+        )
+
+    async def get_heatmap(
+        self, user_id: int, year: int, habit_id: Optional[int] = None, encoding: HeatmapEncoding = "bitmap"
+    ) -> List[HabitHeatmap]:
+        start = date(year, 1, 1)
+        rows = await self.repository.completed_dates_for_user(user_id, start, date(year, 12, 31), habit_id)
+        if habit_id is not None and not rows:
+            raise CustomException("Habit does not found", status_code=404)
+
+        days = year_length(year)
+        by_habit: dict[int, list[int]] = {}
+        for row_habit_id, completed_date in rows:
+            indexes = by_habit.setdefault(row_habit_id, [])
+            if completed_date is not None:
+                indexes.append((completed_date - start).days)
+
+        heatmaps = []
+        for row_habit_id, indexes in by_habit.items():
+            heatmap = HabitHeatmap(habit_id=row_habit_id, year=year, days=days, completed=len(indexes))
+            if encoding == "ranges":
+                heatmap.ranges = day_ranges(indexes)
+            else:
+                heatmap.bitmap = encode_bitmap(pack_days(indexes, days))
+            heatmaps.append(heatmap)
+        return heatmaps
 
-    async def clear_logs(self, data: HabitLogClear):
-        self.logger.info("Clearing habit logs")
-        return await self.repository.clear_by_date(data.habit_id, data.completed_date)
\ No newline at end of file
+    async def clear_logs(self, user_id: int, data: HabitLogClear) -> HabitLogClearResult:
+        self.logger.info(
+            f"Clearing logs of {len(data.habit_ids)} habit(s) from {data.date_from} to {data.date_to}"
+        )
+        habits = await self.repository.get_owned_habits(user_id, data.habit_ids, for_update=True)
+        cleared = await self.repository.clear_range(user_id, habits, data.date_from, data.date_to)
+        if cleared:
+            await self.progress_repository.apply(period_deltas(cleared, sign=-1))
+            cleared_dates: dict[int, list[date]] = {}
+            for habit_id, completed_date in cleared:
+                cleared_dates.setdefault(habit_id, []).append(completed_date)
+            for habit_id, days in cleared_dates.items():
+                await self.streaks.logs_removed(habits[habit_id], days)
+        return HabitLogClearResult(deleted=len(cleared))
@@ -1,28 +1,83 @@
 # app/services/habit_service.py
+from datetime import date
 
 from app.schemas import (
     HabitRequestSchema,
     HabitModelSchema,
     HabitPartialRequestSchema,
+    HabitProgressSchema,
+    HabitDashboardSchema,
 )
-from app.models import User
+from app.schemas.habit_schema import PeriodProgressSchema
+from app.core.security import TokenPrincipal
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.repositories import HabitRepository
+from app.repositories import HabitProgressRepository, HabitRepository
+from app.services.streak_service import StreakService
+from app.utils.habit_periods import period_start, period_target
 
 
 class HabitService:
-    async def create_habit(self, data: HabitRequestSchema, db: AsyncSession, user: User):
+    async def create_habit(self, data: HabitRequestSchema, db: AsyncSession, user: TokenPrincipal):
         habit_data = HabitModelSchema(**data.model_dump(), user_id=user.id)
         return await HabitRepository(db).create_habit(habit_data)
 
     async def get_habit_by_id(self, habit_id: int, db: AsyncSession):
         return await HabitRepository(db).get_habit_by_id(habit_id)
 
-    async def get_all_habits(self, db: AsyncSession, user: User):
+    async def get_all_habits(self, db: AsyncSession, user: TokenPrincipal):
         return await HabitRepository(db).get_all_habits(user.id)
 
+    async def get_progress(self, db: AsyncSession, user: TokenPrincipal, on_date: date):
+        rows = await HabitProgressRepository(db).get_current_progress(user.id, on_date)
+        progress = []
+        for habit, completed in rows:
+            target = period_target(habit.frequency_type, habit.frequency_count)
+            progress.append(
+                HabitProgressSchema(
+                    habit_id=habit.id,
+                    title=habit.title,
+                    period_type=habit.frequency_type,
+                    period_start=period_start(on_date, habit.frequency_type),
+                    completed=completed,
+                    target=target,
+                    done=completed >= target,
+                )
+            )
+        return progress
+
+    async def get_dashboard(self, db: AsyncSession, user: TokenPrincipal, on_date: date):
+        rows = await HabitRepository(db).get_dashboard(user.id, on_date)
+        dashboard = []
+        for habit, completed, done_today in rows:
+            target = period_target(habit.frequency_type, habit.frequency_count)
+            dashboard.append(
+                HabitDashboardSchema(
+                    id=habit.id,
+                    title=habit.title,
+                    description=habit.description,
+                    frequency_type=habit.frequency_type,
+                    frequency_count=habit.frequency_count,
+                    category=habit.category,
+                    current_streak=habit.streak_on(on_date),
+                    longest_streak=habit.longest_streak,
+                    done_today=done_today,
+                    progress=PeriodProgressSchema(
+                        period_type=habit.frequency_type,
+                        period_start=period_start(on_date, habit.frequency_type),
+                        completed=completed,
+                        target=target,
+                        done=completed >= target,
+                    ),
+                )
+            )
+        return dashboard
+
     async def update_habit_by_id(self, habit_id: int, data: HabitPartialRequestSchema, db: AsyncSession):
-        return await HabitRepository(db).update_habit_by_id(habit_id, data)
+        habit = await HabitRepository(db).update_habit_by_id(habit_id, data)
+        if data.model_fields_set & {"frequency_type", "frequency_count"}:
+            # Period boundaries or targets changed, streaks are no longer comparable
+            await StreakService(db).recompute(habit)
+        return habit
 
     async def delete_habit_by_id(self, habit_id: int, db: AsyncSession):
         return await HabitRepository(db).delete_habit_by_id(habit_id)
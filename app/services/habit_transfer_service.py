@@ -0,0 +1,197 @@
+from datetime import date
+from typing import AsyncIterable, AsyncIterator, Optional
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.logger_config import logger as default_logger
+from app.core.settings import setting
+from app.models import Habit, HabitCategory
+from app.repositories import HabitLogRepository, HabitProgressRepository, HabitRepository
+from app.repositories.habit_progress_repository import period_deltas
+from app.schemas.habit_transfer_schema import (
+    EXPORT_FIELDS,
+    ExportFormat,
+    HabitImportResult,
+    HabitLogRecord,
+    HabitRecord,
+)
+from app.services.streak_service import StreakService
+from app.utils.common import CustomException
+from app.utils.streaming import csv_line, iter_csv, iter_lines, iter_ndjson, ndjson_line
+
+
+class HabitTransferService:
+    """Streaming export and batched import of a user's habits and habit logs.
+
+    Both directions use one record shape (see EXPORT_FIELDS), so an export
+    can be imported again as is, in either format.
+    """
+
+    def __init__(self, db: AsyncSession, logger=None):
+        self.db = db
+        self.logger = logger or default_logger
+        self.habit_repository = HabitRepository(db)
+        self.log_repository = HabitLogRepository(db, self.logger)
+        self.progress_repository = HabitProgressRepository(db, self.logger)
+
+    async def _records(
+        self,
+        user_id: int,
+        include_habits: bool,
+        include_logs: bool,
+        habit_id: Optional[int],
+        date_from: Optional[date],
+        date_to: Optional[date],
+    ) -> AsyncIterator[dict]:
+        yield_per = setting.HABIT_EXPORT_YIELD_PER
+        if include_habits:
+            habits = await self.habit_repository.stream_for_user(user_id, habit_id, yield_per)
+            async for habit in habits:
+                yield HabitRecord.model_validate(habit, from_attributes=True).model_dump(mode="json")
+                # Rows are not needed once serialized, keep the identity map flat
+                self.db.expunge(habit)
+        if include_logs:
+            logs = await self.log_repository.stream_for_user(user_id, habit_id, date_from, date_to, yield_per)
+            async for log_habit_id, completed_date in logs:
+                yield {"type": "log", "habit_id": log_habit_id, "completed_date": completed_date.isoformat()}
+
+    async def export(
+        self,
+        user_id: int,
+        fmt: ExportFormat = "ndjson",
+        include_habits: bool = True,
+        include_logs: bool = True,
+        habit_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> AsyncIterator[str]:
+        records = self._records(user_id, include_habits, include_logs, habit_id, date_from, date_to)
+        if fmt == "csv":
+            yield csv_line(EXPORT_FIELDS)
+            async for record in records:
+                yield csv_line(record.get(field) for field in EXPORT_FIELDS)
+        else:
+            async for record in records:
+                yield ndjson_line(record)
+
+    async def import_records(
+        self,
+        user_id: int,
+        chunks: AsyncIterable[bytes],
+        fmt: ExportFormat = "ndjson",
+        batch_size: int = 1000,
+    ) -> HabitImportResult:
+        """Parse ``chunks`` incrementally and insert habits and logs ``batch_size`` at a time.
+
+        When the file has habit records, log ``habit_id``s refer to those
+        (declared before the log) and are mapped to the created habits; a
+        logs-only file refers to the user's existing habits instead.
+        """
+        result = HabitImportResult()
+        id_map: dict[int, int] = {}
+        file_ids: set[int] = set()
+        # None until the first record decides whether log ids refer to the file's habits
+        logs_from_file: Optional[bool] = None
+        owned: set[int] = set()
+        touched: set[int] = set()
+        pending_habits: list[tuple[int, Habit]] = []
+        pending_logs: list[tuple[int, int, date]] = []
+
+        async def flush_habits():
+            if not pending_habits:
+                return
+            category_ids = {habit.category_id for _, habit in pending_habits}
+            found = await self.db.execute(select(HabitCategory.id).where(HabitCategory.id.in_(category_ids)))
+            missing = category_ids - set(found.scalars().all())
+            if missing:
+                raise CustomException(f"Habit category not found: {sorted(missing)}", status_code=400)
+
+            self.db.add_all([habit for _, habit in pending_habits])
+            await self.db.flush()
+            for old_id, habit in pending_habits:
+                id_map[old_id] = habit.id
+                # Nothing else reads them during the import
+                self.db.expunge(habit)
+            result.habits_created += len(pending_habits)
+            pending_habits.clear()
+
+        async def flush_logs():
+            await flush_habits()
+            if not pending_logs:
+                return
+            if logs_from_file:
+                rows = {(id_map[habit_id], completed_date) for _, habit_id, completed_date in pending_logs}
+            else:
+                unknown = {habit_id for _, habit_id, _ in pending_logs if habit_id not in owned}
+                if unknown:
+                    owned.update(await self.log_repository.get_owned_habits(user_id, unknown))
+                    for line, habit_id, _ in pending_logs:
+                        if habit_id not in owned:
+                            raise CustomException(f"Habit does not found (line {line})", status_code=404)
+                rows = {(habit_id, completed_date) for _, habit_id, completed_date in pending_logs}
+            inserted = await self.log_repository.add_many(
+                [{"habit_id": habit_id, "completed_date": completed_date} for habit_id, completed_date in rows]
+            )
+            await self.progress_repository.apply(
+                period_deltas((log.habit_id, log.completed_date) for log in inserted)
+            )
+            for log in inserted:
+                touched.add(log.habit_id)
+                self.db.expunge(log)
+            result.logs_inserted += len(inserted)
+            result.logs_skipped += len(pending_logs) - len(inserted)
+            pending_logs.clear()
+
+        lines = iter_lines(chunks)
+        records = iter_csv(lines) if fmt == "csv" else iter_ndjson(lines)
+        line = 0
+        try:
+            async for line, record in records:
+                record_type = record.get("type")
+                if record_type == "habit":
+                    habit = HabitRecord.model_validate(record)
+                    if logs_from_file is False:
+                        raise CustomException(
+                            f"Habit records must come before log records (line {line})", status_code=400
+                        )
+                    if habit.id in file_ids:
+                        raise CustomException(f"Duplicate habit id {habit.id} (line {line})", status_code=400)
+                    logs_from_file = True
+                    file_ids.add(habit.id)
+                    pending_habits.append(
+                        (habit.id, Habit(user_id=user_id, **habit.model_dump(exclude={"id", "type"})))
+                    )
+                    if len(pending_habits) >= batch_size:
+                        await flush_habits()
+                elif record_type == "log":
+                    log = HabitLogRecord.model_validate(record)
+                    if logs_from_file is None:
+                        logs_from_file = False
+                    elif logs_from_file and log.habit_id not in file_ids:
+                        raise CustomException(
+                            f"Habit {log.habit_id} is not in the import file (line {line})", status_code=400
+                        )
+                    pending_logs.append((line, log.habit_id, log.completed_date))
+                    if len(pending_logs) >= batch_size:
+                        await flush_logs()
+                else:
+                    raise CustomException(f"Unknown record type at line {line}", status_code=400)
+        except ValidationError as exc:
+            raise CustomException(
+                f"Invalid record at line {line}", status_code=400, data={"errors": exc.errors(include_url=False, include_context=False)}
+            )
+        except ValueError as exc:
+            # Malformed JSON, CSV or UTF-8, the message carries the line number
+            raise CustomException(f"Invalid import data: {exc}", status_code=400)
+        await flush_logs()
+
+        if touched:
+            streaks = StreakService(self.db, self.log_repository, self.progress_repository, self.logger)
+            habits = await self.log_repository.get_owned_habits(user_id, touched, for_update=True)
+            for habit in habits.values():
+                await streaks.recompute(habit)
+
+        self.logger.info(
+            f"Imported {result.habits_created} habit(s) and {result.logs_inserted} log(s) for user_id={user_id}"
+        )
+        return result
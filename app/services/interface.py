@@ -1,6 +1,7 @@
 from typing import Optional, Protocol, List
 from app.models.reminder import Reminder
-from app.schemas.note_schema import NoteCreate, NoteRead, NoteUpdate
+from app.schemas.common_schema import CursorPage
+from app.schemas.note_schema import NoteCreate, NoteRead, NoteSummary, NoteUpdate
 from app.schemas.reminder import ReminderCreate, ReminderUpdate
 from app.schemas.habit_log_schema import (
     HabitLogCreate,
@@ -9,6 +10,7 @@ from app.schemas.habit_log_schema import (
 )
 from app.schemas.notification_schema import NotificationCreate, NotificationRead
 from abc import ABC, abstractmethod
+from datetime import date
 
 
 class IReminderService(Protocol):
@@ -26,13 +28,29 @@ class IHabitLogService(ABC):
     async def create_log(self, user_id: int, data: HabitLogCreate): ...
 
     @abstractmethod
-    async def delete_log(self, log_id: int): ...
+    async def delete_log(self, user_id: int, log_id: int): ...
 
     @abstractmethod
-    async def add_multiple_logs(self, data: HabitLogMultipleCreate): ...
+    async def add_multiple_logs(self, user_id: int, data: HabitLogMultipleCreate): ...
 
     @abstractmethod
-    async def clear_logs(self, data: HabitLogClear): ...
+    async def list_logs(
+        self,
+        user_id: int,
+        habit_ids: Optional[List[int]] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ): ...
+
+    @abstractmethod
+    async def get_heatmap(
+        self, user_id: int, year: int, habit_id: Optional[int] = None, encoding: str = "bitmap"
+    ): ...
+
+    @abstractmethod
+    async def clear_logs(self, user_id: int, data: HabitLogClear): ...
 
 
 class INotificationService(ABC):
@@ -76,14 +94,16 @@ class INoteService(ABC):
     """Interface for note service operations."""
     
     @abstractmethod
-    async def list_notes(self, user_id: int) -> List[NoteRead]:
-        """Get all notes for a user.
+    async def list_notes(self, user_id: int, cursor: Optional[str] = None, limit: int = 20) -> CursorPage[NoteSummary]:
+        """Get one page of a user's notes, most recently updated first.
         
         Args:
             user_id: The ID of the user
+            cursor: ``next_cursor`` of the previous page, None for the first page
+            limit: Maximum number of notes on the page
             
         Returns:
-            List of notes belonging to the user
+            Note summaries and the cursor of the next page
         """
         pass
     
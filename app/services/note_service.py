@@ -1,7 +1,20 @@
+from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.schemas.note_schema import NoteCreate, NoteUpdate, NoteRead
+from app.core.settings import setting
+from app.schemas.common_schema import CursorPage
+from app.schemas.note_schema import (
+    NoteCreate,
+    NoteRevisionRead,
+    NoteRevisionSummary,
+    NoteSearchResult,
+    NoteSummary,
+    NoteUpdate,
+)
 from app.repositories.note_repositories import NoteRepository
-from typing import List
+from app.repositories.note_revision_repository import NoteRevisionRepository
+from app.utils.common import CustomException
+from app.utils.pagination import decode_cursor, encode_cursor
+from typing import List, Optional
 
 from app.services.interface import INoteService
 
@@ -10,8 +23,62 @@ class NoteService(INoteService):
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def list_notes(self, user_id: int) -> List[NoteRead]:
-        return await NoteRepository.get_all(self.db, user_id)
+    async def list_notes(self, user_id: int, cursor: Optional[str] = None, limit: int = 20) -> CursorPage[NoteSummary]:
+        after = None
+        if cursor:
+            after_updated_at, after_id = decode_cursor(cursor, 2)
+            try:
+                after = (datetime.fromisoformat(after_updated_at), int(after_id))
+            except (TypeError, ValueError):
+                raise CustomException("Invalid cursor", status_code=400)
+
+        rows = await NoteRepository.list_summaries(
+            self.db, user_id, after, limit + 1, setting.NOTE_EXCERPT_LENGTH
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["updated_at"].isoformat(), rows[-1]["id"])
+        tags = await NoteRepository.get_tags_for_notes(self.db, (row["id"] for row in rows))
+        return CursorPage[NoteSummary](
+            items=[NoteSummary.model_validate({**row, "tags": tags.get(row["id"], [])}) for row in rows],
+            next_cursor=next_cursor,
+        )
+
+    async def search_notes(self, user_id: int, query: str, limit: int = 20, offset: int = 0) -> List[NoteSearchResult]:
+        rows = await NoteRepository.search(self.db, user_id, query, limit, offset)
+        return [NoteSearchResult.model_validate(dict(row)) for row in rows]
+
+    async def _ensure_note(self, note_id: int, user_id: int) -> None:
+        if not await NoteRepository.exists(self.db, note_id, user_id):
+            raise CustomException("Note not found", status_code=404)
+
+    async def list_revisions(
+        self, note_id: int, user_id: int, cursor: Optional[str] = None, limit: int = 20
+    ) -> CursorPage[NoteRevisionSummary]:
+        await self._ensure_note(note_id, user_id)
+        before = None
+        if cursor:
+            (before,) = decode_cursor(cursor, 1)
+            if not isinstance(before, int):
+                raise CustomException("Invalid cursor", status_code=400)
+
+        rows = await NoteRevisionRepository.list_for_note(self.db, note_id, before, limit + 1)
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["version"])
+        return CursorPage[NoteRevisionSummary](
+            items=[NoteRevisionSummary.model_validate(dict(row)) for row in rows], next_cursor=next_cursor
+        )
+
+    async def get_revision(self, note_id: int, user_id: int, version: int) -> NoteRevisionRead:
+        await self._ensure_note(note_id, user_id)
+        revision = await NoteRevisionRepository.reconstruct(self.db, note_id, version)
+        if revision is None:
+            raise CustomException("Note revision not found", status_code=404)
+        content, created_at = revision
+        return NoteRevisionRead(version=version, created_at=created_at, **content)
 
     async def get_note(self, note_id: int, user_id: int):
         return await NoteRepository.get(self.db, note_id, user_id)
@@ -20,7 +87,8 @@ class NoteService(INoteService):
         return await NoteRepository.create(self.db, note_data, user_id)
 
     async def update_note(self, note_id: int, user_id: int, note_data: NoteUpdate):
-        note = await self.get_note(note_id, user_id)
+        # Locked: the revision delta is computed against the content read here
+        note = await NoteRepository.get(self.db, note_id, user_id, for_update=True)
         if not note:
             return None
         return await NoteRepository.update(self.db, note, note_data)
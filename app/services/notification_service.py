@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterable, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.notification import Notification
 from app.repositories.notification_repository import NotificationRepository
@@ -14,10 +14,17 @@ class NotificationService:
             user_id=user_id,
             title=data.title,
             message=data.message,
+            type=data.type,
             channel=data.channel,
         )
         return await NotificationRepository.create(self.db, notification)
 
+    async def create_notifications(self, notifications: Iterable[Tuple[int, NotificationCreate]]) -> int:
+        """Create one notification per (user_id, data) pair in a single batch."""
+        rows = [{"user_id": user_id, **data.model_dump()} for user_id, data in notifications]
+        await NotificationRepository.create_many(self.db, rows)
+        return len(rows)
+
     async def get_all_notifications(self, user_id: int)->List[NotificationRead]:
         return await NotificationRepository.get_by_user(self.db, user_id)
 
@@ -0,0 +1,179 @@
+import asyncio
+import heapq
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db_config import AsyncSessionLocal
+from app.core.logger_config import logger as default_logger
+from app.core.settings import setting
+from app.repositories.reminder_repository import ReminderRepository
+from app.schemas.notification_schema import NotificationCreate
+from app.services.notification_service import NotificationService
+
+# Pause after an unexpected error before the loop tries again
+RETRY_SECONDS = 5
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class ReminderScheduler:
+    """Fires due reminders as in-app notifications from a background task.
+
+    Pending reminders due within the look-ahead window are held in a
+    min-heap, loaded with one range scan of ix_reminders_pending_reminder_date
+    and reloaded every half window. ReminderService keeps it current through
+    ``schedule``/``cancel`` instead of forcing a rescan.
+
+    Several workers can each run one: a due batch is claimed with an
+    ``UPDATE .. WHERE notified_at IS NULL`` in the same transaction as its
+    notifications, so every reminder fires exactly once. Changes made
+    through another worker reach this one with its next reload.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        lookahead_seconds: int = setting.REMINDER_LOOKAHEAD_SECONDS,
+        max_loaded: int = setting.REMINDER_MAX_LOADED,
+        batch_size: int = setting.REMINDER_BATCH_SIZE,
+        max_delay_seconds: int = setting.REMINDER_MAX_DELAY_SECONDS,
+        logger=None,
+    ):
+        self.session_factory = session_factory
+        self.lookahead = timedelta(seconds=lookahead_seconds)
+        self.max_loaded = max_loaded
+        self.batch_size = batch_size
+        self.max_delay = timedelta(seconds=max_delay_seconds)
+        self.logger = logger or default_logger
+
+        self._task: Optional[asyncio.Task] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._heap: List[Tuple[datetime, int]] = []
+        # Current due time per reminder; heap entries that disagree are stale and skipped
+        self._due_at: Dict[int, datetime] = {}
+        # Every pending reminder due up to here is in the heap
+        self._horizon: Optional[datetime] = None
+        self._next_load: Optional[datetime] = None
+        # schedule/cancel calls made while a load is in flight, replayed on its result
+        self._missed: Optional[List[Tuple[int, Optional[datetime]]]] = None
+        # Created in start(), an Event is bound to the loop it is first used on
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            # Nothing carries over from a previous run, possibly on another event loop
+            self._reset()
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), name="reminder-scheduler")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._reset()
+
+    def schedule(self, reminder_id: int, due: datetime) -> None:
+        """(Re)schedule a pending reminder, call once its write has committed."""
+        if self._missed is not None:
+            self._missed.append((reminder_id, due))
+        if self._horizon is None or due > self._horizon:
+            # Beyond the window, a later load picks it up
+            self._due_at.pop(reminder_id, None)
+            return
+        self._due_at[reminder_id] = due
+        heapq.heappush(self._heap, (due, reminder_id))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def cancel(self, reminder_id: int) -> None:
+        if self._missed is not None:
+            self._missed.append((reminder_id, None))
+        self._due_at.pop(reminder_id, None)
+
+    async def _load(self, now: datetime) -> None:
+        horizon = now + self.lookahead
+        self._missed = []
+        try:
+            async with self.session_factory() as session:
+                rows = await ReminderRepository(session, self.logger).get_pending(horizon, self.max_loaded)
+        finally:
+            missed, self._missed = self._missed, None
+
+        if len(rows) == self.max_loaded:
+            # Capped, only trust the window up to the last reminder loaded
+            horizon = rows[-1].reminder_date
+        self._heap = [(row.reminder_date, row.id) for row in rows]
+        heapq.heapify(self._heap)
+        self._due_at = {row.id: row.reminder_date for row in rows}
+        self._horizon = horizon
+        self._next_load = now + self.lookahead / 2
+        for reminder_id, due in missed:
+            if due is None:
+                self.cancel(reminder_id)
+            else:
+                self.schedule(reminder_id, due)
+
+    def _pop_due(self, now: datetime) -> List[int]:
+        due: List[int] = []
+        while self._heap and self._heap[0][0] <= now and len(due) < self.batch_size:
+            when, reminder_id = heapq.heappop(self._heap)
+            if self._due_at.get(reminder_id) == when:
+                del self._due_at[reminder_id]
+                due.append(reminder_id)
+        return due
+
+    async def _fire(self, reminder_ids: List[int], now: datetime) -> None:
+        async with self.session_factory() as session:
+            async with session.begin():
+                claimed = await ReminderRepository(session, self.logger).claim_due(reminder_ids, now)
+                late = [row for row in claimed if now - row.reminder_date > self.max_delay]
+                sent = await NotificationService(session).create_notifications(
+                    (
+                        row.user_id,
+                        NotificationCreate(
+                            title=row.title, message=row.description or "", type="reminder", channel="in_app"
+                        ),
+                    )
+                    for row in claimed
+                    if now - row.reminder_date <= self.max_delay
+                )
+        if late:
+            self.logger.warning(f"Skipped {len(late)} reminder(s) overdue by more than {self.max_delay}")
+        self.logger.info(f"Reminder scheduler sent {sent} notification(s) for {len(reminder_ids)} due reminder(s)")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                self._wakeup.clear()
+                now = utcnow()
+                if self._next_load is None or now >= self._next_load:
+                    await self._load(now)
+                due = self._pop_due(now)
+                if due:
+                    await self._fire(due, now)
+                    continue
+
+                wake_at = self._next_load
+                if self._heap:
+                    wake_at = min(wake_at, self._heap[0][0])
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), max((wake_at - utcnow()).total_seconds(), 0))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger.exception("Reminder scheduler iteration failed")
+                # Reload, the heap may be out of step with the table now
+                self._next_load = None
+                await asyncio.sleep(RETRY_SECONDS)
+
+
+reminder_scheduler = ReminderScheduler()
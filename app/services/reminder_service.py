@@ -3,8 +3,10 @@ from fastapi import HTTPException, status
 from app.models.reminder import Reminder
 from app.schemas.reminder import ReminderCreate, ReminderUpdate, ReminderOut
 from app.repositories import ReminderRepository
+from app.core.db_config import on_commit
 from app.core.logger_config import logger as default_logger
 from app.services.interface import IReminderService
+from app.services.reminder_scheduler import reminder_scheduler
 from app.utils.common import CustomException
 
 
@@ -21,6 +23,14 @@ class ReminderService(IReminderService):
         self.repository = repository
         self.logger = logger or default_logger
 
+    def _schedule_on_commit(self, reminder: Reminder) -> None:
+        """Keep the in-memory schedule in step once the write is committed."""
+        reminder_id, due, pending = reminder.id, reminder.reminder_date, reminder.notified_at is None
+        if pending:
+            on_commit(self.repository.db, lambda: reminder_scheduler.schedule(reminder_id, due))
+        else:
+            on_commit(self.repository.db, lambda: reminder_scheduler.cancel(reminder_id))
+
     async def create_reminder(self, user_id: int, data: ReminderCreate) -> Reminder:
         """Create a new reminder.
         
@@ -36,7 +46,9 @@ class ReminderService(IReminderService):
         """
         try:
             self.logger.info(f"Creating reminder for user_id={user_id}")
-            return await self.repository.create(user_id, data)
+            reminder = await self.repository.create(user_id, data)
+            self._schedule_on_commit(reminder)
+            return reminder
         except Exception as e:
             self.logger.error(f"Error creating reminder: {str(e)}")
             raise CustomException(
@@ -60,9 +72,12 @@ class ReminderService(IReminderService):
     async def update_reminder(self, reminder_id: int, data: ReminderUpdate)-> ReminderOut:
         reminder = await self.get_reminder_by_id(reminder_id)
         self.logger.info(f"Updating reminder id={reminder_id}")
-        return await self.repository.update_remainder(reminder, data)
+        reminder = await self.repository.update_remainder(reminder, data)
+        self._schedule_on_commit(reminder)
+        return reminder
 
     async def delete_reminder(self, reminder_id: int)-> None:
         reminder = await self.get_reminder_by_id(reminder_id)
         self.logger.info(f"Deleting reminder id={reminder_id}")
         await self.repository.delete_remainder(reminder)
+        on_commit(self.repository.db, lambda: reminder_scheduler.cancel(reminder_id))
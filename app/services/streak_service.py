@@ -0,0 +1,92 @@
+from datetime import date
+from typing import Iterable
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.logger_config import logger as default_logger
+from app.models import Habit
+from app.repositories import HabitLogRepository, HabitProgressRepository
+from app.repositories.interface import IHabitLogRepository
+from app.utils.habit_periods import compute_streaks, next_period, period_start, period_target
+
+
+class StreakService:
+    """Keeps Habit.streak_* in step with habit log writes.
+
+    Writes to the latest period are applied incrementally with one indexed
+    rollup lookup; backfills and removals that break a completed period fall back to
+    a recompute of that habit only.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        repository: IHabitLogRepository = None,
+        progress_repository: HabitProgressRepository = None,
+        logger=None,
+    ):
+        self.db = db
+        self.logger = logger or default_logger
+        self.repository = repository or HabitLogRepository(db, self.logger)
+        self.progress_repository = progress_repository or HabitProgressRepository(db, self.logger)
+
+    async def _period_count(self, habit: Habit, start: date) -> int:
+        # Rollups are applied before the streaks, see HabitLogService
+        return await self.progress_repository.get_count(habit.id, habit.frequency_type, start)
+
+    async def recompute(self, habit: Habit) -> None:
+        dates = await self.repository.completed_dates(habit.id)
+        current, longest, last_period = compute_streaks(dates, habit.frequency_type, habit.frequency_count)
+        habit.streak_current = current
+        habit.streak_longest = longest
+        habit.streak_last_period = last_period
+
+    async def log_added(self, habit: Habit, day: date, added: int = 1) -> None:
+        """``added`` new logs landed in the period containing ``day``."""
+        start = period_start(day, habit.frequency_type)
+        last = habit.streak_last_period
+        if start == last:
+            return
+
+        # Only a period that just reached its target can change the streaks
+        target = period_target(habit.frequency_type, habit.frequency_count)
+        count = await self._period_count(habit, start)
+        if not count - added < target <= count:
+            return
+        if last is not None and start < last:
+            # Backfill, may join two runs
+            await self.recompute(habit)
+            return
+        if last is not None and start == next_period(last, habit.frequency_type):
+            habit.streak_current += 1
+        else:
+            habit.streak_current = 1
+        habit.streak_longest = max(habit.streak_longest, habit.streak_current)
+        habit.streak_last_period = start
+
+    async def logs_added(self, habit: Habit, days: Iterable[date]) -> None:
+        days = list(days)
+        periods = {period_start(day, habit.frequency_type) for day in days}
+        if len(periods) == 1:
+            await self.log_added(habit, days[0], added=len(days))
+        elif periods:
+            await self.recompute(habit)
+
+    async def log_removed(self, habit: Habit, day: date, removed: int = 1) -> None:
+        """``removed`` logs left the period containing ``day``."""
+        start = period_start(day, habit.frequency_type)
+        last = habit.streak_last_period
+        if last is None or start > last:
+            return
+
+        # Only a period that just dropped below its target can change the streaks
+        target = period_target(habit.frequency_type, habit.frequency_count)
+        count = await self._period_count(habit, start)
+        if count < target <= count + removed:
+            await self.recompute(habit)
+
+    async def logs_removed(self, habit: Habit, days: Iterable[date]) -> None:
+        days = list(days)
+        periods = {period_start(day, habit.frequency_type) for day in days}
+        if len(periods) == 1:
+            await self.log_removed(habit, days[0], removed=len(days))
+        elif periods:
+            await self.recompute(habit)
@@ -0,0 +1,13 @@
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.repositories.tag_repository import TagRepository
+from app.schemas.tag_schema import TagSuggestion
+
+
+class TagService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def suggest_tags(self, user_id: int, prefix: str, limit: int = 10) -> List[TagSuggestion]:
+        rows = await TagRepository.suggest(self.db, user_id, prefix.strip(), limit)
+        return [TagSuggestion.model_validate(dict(row)) for row in rows]
@@ -8,12 +8,15 @@ from app.core.security import (
     create_access_token,
     create_refresh_token,
     hash_password,
+    user_token_claims,
     verify_password,
     verify_refresh_token,
 )
 from app.services.common_service import CommonService
 from app.services.email_service import EmailService
 from app.repositories import UserRepository
+from app.core.cache import invalidate_on_commit, user_cache
+from app.core.db_config import commit_early
 from app.core.logger_config import logger as default_logger
 from starlette import status
 
@@ -51,19 +54,18 @@ class UserService:
             user = User(**user_dict)
             try:
                 self.db.add(user)
-                await self.db.commit()
-                await self.db.refresh(user)
+                await self.db.flush()
+                invalidate_on_commit(self.db, user_cache, user.id)
                 return user
             except Exception as e:
                 self.logger.error(f"Error registering user: {e}")
-                await self.db.rollback()
                 raise CustomException("Failed to register user", 500)
 
         elif not existing_user.is_active and existing_user.email == user_data.email:
             existing_user.password = hashed_password
             existing_user.role = user_data.role
-            await self.db.commit()
-            await self.db.refresh(existing_user)
+            await self.db.flush()
+            invalidate_on_commit(self.db, user_cache, existing_user.id)
             return existing_user
 
         raise CustomException(
@@ -99,7 +101,7 @@ class UserService:
                 "Invalid credentials", status_code=status.HTTP_401_UNAUTHORIZED
             )
 
-        access_token = await create_access_token({"user_id": existing_user.id})
+        access_token = await create_access_token(user_token_claims(existing_user))
         refresh_token = await create_refresh_token({"user_id": existing_user.id})
 
         return TokenResponse(
@@ -156,7 +158,7 @@ class UserService:
                 "User not found or inactive", status_code=status.HTTP_401_UNAUTHORIZED
             )
 
-        access_token = await create_access_token({"user_id": user.id})
+        access_token = await create_access_token(user_token_claims(user))
         refresh_token = await create_refresh_token({"user_id": user.id})
 
         return TokenResponse(
@@ -181,6 +183,8 @@ class UserService:
         )
         if created_at < datetime.now(timezone.utc) - timedelta(minutes=5):
             await self.delete_user_otp(email)
+            # The request fails below, the expired OTP must stay deleted
+            await commit_early(self.db)
             raise CustomException(
                 "OTP expired", status_code=status.HTTP_400_BAD_REQUEST
             )
@@ -191,7 +195,7 @@ class UserService:
         otp = await UserRepository.get_otp_by_email(email, self.db)
         if otp:
             await self.db.delete(otp)
-            await self.db.commit()
+            await self.db.flush()
 
     async def update_profile(
         self, user_id: int, data: user_schema.ProfileUpdateSchema
@@ -0,0 +1,62 @@
+from datetime import date, timedelta
+from typing import Iterable, Optional
+
+from app.models.enums import FrequencyType
+
+# Logs are unique per habit and day, so a period can hold at most this many
+MAX_PER_PERIOD = {
+    FrequencyType.DAILY: 1,
+    FrequencyType.WEEKLY: 7,
+    FrequencyType.MONTHLY: 28,
+}
+
+
+def period_start(day: date, frequency_type: FrequencyType) -> date:
+    """First day of the period containing ``day`` (weeks start on Monday)."""
+    if frequency_type == FrequencyType.WEEKLY:
+        return day - timedelta(days=day.weekday())
+    if frequency_type == FrequencyType.MONTHLY:
+        return day.replace(day=1)
+    return day
+
+
+def next_period(start: date, frequency_type: FrequencyType) -> date:
+    if frequency_type == FrequencyType.WEEKLY:
+        return start + timedelta(days=7)
+    if frequency_type == FrequencyType.MONTHLY:
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def previous_period(start: date, frequency_type: FrequencyType) -> date:
+    return period_start(start - timedelta(days=1), frequency_type)
+
+
+def period_target(frequency_type: FrequencyType, frequency_count: int) -> int:
+    """Logs needed in one period for it to count as done."""
+    return min(max(frequency_count or 1, 1), MAX_PER_PERIOD[frequency_type])
+
+
+def compute_streaks(
+    completed_dates: Iterable[date], frequency_type: FrequencyType, frequency_count: int
+) -> tuple[int, int, Optional[date]]:
+    """Full recompute from a habit's log dates.
+
+    Returns ``(current, longest, last_period)`` where ``current`` is the run
+    ending at ``last_period``, the latest period that met its target.
+    """
+    target = period_target(frequency_type, frequency_count)
+    counts: dict[date, int] = {}
+    for day in completed_dates:
+        start = period_start(day, frequency_type)
+        counts[start] = counts.get(start, 0) + 1
+
+    current, longest, last_period = 0, 0, None
+    for start in sorted(p for p, n in counts.items() if n >= target):
+        if last_period is not None and start == next_period(last_period, frequency_type):
+            current += 1
+        else:
+            current = 1
+        longest = max(longest, current)
+        last_period = start
+    return current, longest, last_period
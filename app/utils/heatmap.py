@@ -0,0 +1,33 @@
+import base64
+import calendar
+from typing import Iterable
+
+
+def year_length(year: int) -> int:
+    return 366 if calendar.isleap(year) else 365
+
+
+def pack_days(day_indexes: Iterable[int], days: int) -> bytes:
+    """Bitset with bit ``i`` set when day-of-year ``i`` (0 = Jan 1) is done.
+
+    Bit ``i`` lives in byte ``i // 8`` at mask ``1 << (i % 8)``, so a leap year fits in 46 bytes.
+    """
+    bitmap = bytearray((days + 7) // 8)
+    for index in day_indexes:
+        bitmap[index >> 3] |= 1 << (index & 7)
+    return bytes(bitmap)
+
+
+def encode_bitmap(bitmap: bytes) -> str:
+    return base64.b64encode(bitmap).decode("ascii")
+
+
+def day_ranges(day_indexes: Iterable[int]) -> list[tuple[int, int]]:
+    """Run-length encode sorted day indexes as ``(first_day, length)`` pairs."""
+    ranges: list[list[int]] = []
+    for index in day_indexes:
+        if ranges and ranges[-1][0] + ranges[-1][1] == index:
+            ranges[-1][1] += 1
+        else:
+            ranges.append([index, 1])
+    return [(first, length) for first, length in ranges]
@@ -0,0 +1,97 @@
+"""Payloads of note revisions.
+
+A revision is zlib-compressed JSON holding either a full snapshot of a
+note's content (``{"title": ..., "description": ...}``) or a delta against
+the previous revision. Description deltas are word-level edit scripts:
+a positive int copies that many tokens of the old text, a negative int
+skips them and a string is inserted as is.
+"""
+import difflib
+import json
+import re
+import zlib
+from typing import List, Optional, TypedDict, Union
+
+
+class NoteContent(TypedDict):
+    title: str
+    description: Optional[str]
+
+
+EditOp = Union[int, str]
+
+# Words with their trailing whitespace, joined back they give the original text
+TOKEN_RE = re.compile(r"\S+\s*|\s+")
+
+
+def encode(value) -> bytes:
+    return zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode())
+
+
+def decode(payload: bytes):
+    return json.loads(zlib.decompress(payload))
+
+
+def _tokens(text: str) -> List[str]:
+    return TOKEN_RE.findall(text)
+
+
+def text_ops(old: str, new: str) -> List[EditOp]:
+    a, b = _tokens(old), _tokens(new)
+    # Edits are usually local, only diff what lies between the common head and tail
+    head = 0
+    while head < min(len(a), len(b)) and a[head] == b[head]:
+        head += 1
+    tail = 0
+    while tail < min(len(a), len(b)) - head and a[-1 - tail] == b[-1 - tail]:
+        tail += 1
+
+    ops: List[EditOp] = [head] if head else []
+    matcher = difflib.SequenceMatcher(None, a[head:len(a) - tail], b[head:len(b) - tail], autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(i2 - i1)
+            continue
+        if i2 > i1:
+            ops.append(i1 - i2)
+        if j2 > j1:
+            ops.append("".join(b[head + j1:head + j2]))
+    if tail:
+        ops.append(tail)
+    return ops
+
+
+def apply_text_ops(old: str, ops: List[EditOp]) -> str:
+    tokens = _tokens(old)
+    out, pos = [], 0
+    for op in ops:
+        if isinstance(op, str):
+            out.append(op)
+        elif op > 0:
+            out.extend(tokens[pos:pos + op])
+            pos += op
+        else:
+            pos -= op
+    return "".join(out)
+
+
+def diff(old: NoteContent, new: NoteContent) -> dict:
+    """Delta turning ``old`` into ``new``, only changed fields are present."""
+    delta = {}
+    if new["title"] != old["title"]:
+        delta["title"] = new["title"]
+    if new["description"] != old["description"]:
+        if old["description"] is None or new["description"] is None:
+            delta["description"] = new["description"]
+        else:
+            delta["description_ops"] = text_ops(old["description"], new["description"])
+    return delta
+
+
+def apply(content: NoteContent, delta: dict) -> NoteContent:
+    content = NoteContent(title=delta.get("title", content["title"]), description=content["description"])
+    if "description" in delta:
+        content["description"] = delta["description"]
+    elif "description_ops" in delta:
+        content["description"] = apply_text_ops(content["description"], delta["description_ops"])
+    return content
@@ -0,0 +1,77 @@
+import csv
+import io
+import json
+from typing import AsyncIterable, AsyncIterator, Iterable, List
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Decode a byte stream into lines without buffering more than one line."""
+    buffer = b""
+    number = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            number += 1
+            yield _decode(line, number)
+    if buffer:
+        yield _decode(buffer, number + 1)
+
+
+def _decode(line: bytes, number: int) -> str:
+    try:
+        return line.decode("utf-8").rstrip("\r")
+    except UnicodeDecodeError:
+        raise ValueError(f"invalid UTF-8 at line {number}")
+
+
+async def iter_ndjson(lines: AsyncIterable[str]) -> AsyncIterator[tuple[int, dict]]:
+    """(line number, object) for every non-blank NDJSON line."""
+    number = 0
+    async for line in lines:
+        number += 1
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            raise ValueError(f"invalid JSON at line {number}")
+        if not isinstance(record, dict):
+            raise ValueError(f"expected a JSON object at line {number}")
+        yield number, record
+
+
+async def iter_csv(lines: AsyncIterable[str]) -> AsyncIterator[tuple[int, dict]]:
+    """(line number, row) for every CSV row; empty cells become None.
+
+    Quoted cells may span lines, a record is complete once its quotes balance.
+    """
+    header: List[str] = []
+    pending: List[str] = []
+    number = 0
+    async for line in lines:
+        number += 1
+        pending.append(line)
+        record = "\n".join(pending)
+        if record.count('"') % 2:
+            continue
+        pending = []
+        if not record.strip():
+            continue
+        values = next(csv.reader([record]))
+        if not header:
+            header = values
+            continue
+        yield number, {key: value or None for key, value in zip(header, values)}
+    if pending:
+        raise ValueError(f"unterminated quoted field at line {number}")
+
+
+def ndjson_line(record: dict) -> str:
+    return json.dumps(record, default=str, separators=(",", ":")) + "\n"
+
+
+def csv_line(values: Iterable) -> str:
+    out = io.StringIO()
+    csv.writer(out, lineterminator="\n").writerow(values)
+    return out.getvalue()
@@ -1,11 +1,17 @@
 import typer
-from app.commands import create_superadmin, runserver, initial_data, initial_setup
+from app.commands import create_superadmin, runserver, initial_data, initial_setup, benchmark_jwt, benchmark_sqlite, recompute_streaks, backfill_rollups, rebuild_note_search, rebuild_tag_usage
 app = typer.Typer()
 
 app.command('createsuperuser')(create_superadmin.run)
 app.command('runserver')(runserver.run)
 app.command('initialdata')(initial_data.run)
 app.command('initial-setup')(initial_setup.run)
+app.command('bench-jwt')(benchmark_jwt.run)
+app.command('bench-sqlite')(benchmark_sqlite.run)
+app.command('recompute-streaks')(recompute_streaks.run)
+app.command('backfill-rollups')(backfill_rollups.run)
+app.command('rebuild-note-search')(rebuild_note_search.run)
+app.command('rebuild-tag-usage')(rebuild_tag_usage.run)
 
 if __name__ == "__main__":
     app()
@@ -0,0 +1,71 @@
+import os
+import tempfile
+from pathlib import Path
+
+# Point the settings at a throwaway SQLite database before the app is imported
+_DB_PATH = Path(tempfile.mkdtemp(prefix="app-tests-")) / "test.db"
+os.environ["ENV"] = "development"
+os.environ["SQLITE_PATH"] = str(_DB_PATH)
+os.environ["REMINDER_SCHEDULER_ENABLED"] = "false"
+
+import pytest
+from sqlalchemy import create_engine, event
+
+import app.models  # noqa: F401  registers every table on Base.metadata
+from app.core.db_config import AsyncSessionLocal, Base, engine
+
+
+@pytest.fixture(scope="session", autouse=True)
+def schema():
+    sync_engine = create_engine(f"sqlite:///{_DB_PATH}")
+    Base.metadata.create_all(sync_engine)
+    sync_engine.dispose()
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def db():
+    async with AsyncSessionLocal() as session:
+        yield session
+        await session.rollback()
+    # Pooled connections belong to this test's event loop
+    await engine.dispose()
+
+
+@pytest.fixture
+def statements():
+    """SQL statements sent to the primary engine while the test runs."""
+    executed = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield executed
+    event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+async def client(db):
+    from httpx import ASGITransport, AsyncClient
+    from app.main import app
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http_client:
+        yield http_client
+
+
+@pytest.fixture
+def auth_headers():
+    from app.core.security import create_access_token
+
+    async def make(user_id: int) -> dict:
+        token = await create_access_token(
+            {"user_id": user_id, "role": "user", "is_superuser": False, "is_active": True}
+        )
+        return {"Authorization": f"Bearer {token}"}
+
+    return make
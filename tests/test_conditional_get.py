@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete, update
+
+from app.core.db_config import AsyncSessionLocal
+from app.models import Habit, HabitCategory, Note, Profile, Tag, User
+from app.models.association import note_tag_table
+from app.models.enums import FrequencyType
+
+pytestmark = pytest.mark.anyio
+
+# Older than conditional.SETTLE_TIME, so validators are issued right away
+LONG_AGO = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+async def owner():
+    suffix = uuid4().hex[:8]
+    async with AsyncSessionLocal() as session:
+        user = User(
+            email=f"etag-{suffix}@example.com", password="x", first_name="Etag", last_name="Owner",
+            updated_at=LONG_AGO,
+        )
+        session.add(user)
+        await session.flush()
+        session.add(Profile(user_id=user.id, bio="bio", updated_at=LONG_AGO))
+        category = HabitCategory(name=f"etag-{suffix}", icon_name="icon", user_id=user.id, updated_at=LONG_AGO)
+        session.add(category)
+        await session.flush()
+        habit = Habit(
+            title="read", category_id=category.id, user_id=user.id,
+            frequency_type=FrequencyType.DAILY, frequency_count=1, updated_at=LONG_AGO,
+        )
+        note = Note(title="note", description="text", user_id=user.id, updated_at=LONG_AGO)
+        session.add_all([habit, note])
+        await session.commit()
+        return {"user": user.id, "category": category.id, "habit": habit.id, "note": note.id}
+
+
+async def touch(statement):
+    async with AsyncSessionLocal() as session:
+        await session.execute(statement.values(updated_at=LONG_AGO + timedelta(hours=1)))
+        await session.commit()
+
+
+async def revalidate(client, url, headers):
+    first = await client.get(url, headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    again = await client.get(url, headers={**headers, "If-None-Match": etag})
+    assert again.status_code == 304
+    return etag
+
+
+async def test_embedded_category_and_profile_changes_invalidate_the_habit_etag(client, auth_headers, owner):
+    headers = await auth_headers(owner["user"])
+    url = f"/api/v1/habits/{owner['habit']}"
+
+    etag = await revalidate(client, url, headers)
+    await touch(update(HabitCategory).where(HabitCategory.id == owner["category"]))
+    assert (await client.get(url, headers={**headers, "If-None-Match": etag})).status_code == 200
+
+    etag = await revalidate(client, url, headers)
+    await touch(update(Profile).where(Profile.user_id == owner["user"]))
+    assert (await client.get(url, headers={**headers, "If-None-Match": etag})).status_code == 200
+
+    listing = await revalidate(client, "/api/v1/habits/", headers)
+    await touch(update(User).where(User.id == owner["user"]))
+    response = await client.get("/api/v1/habits/", headers={**headers, "If-None-Match": listing})
+    assert response.status_code == 200
+
+
+async def test_profile_changes_invalidate_the_note_etag(client, auth_headers, owner):
+    headers = await auth_headers(owner["user"])
+    url = f"/api/v1/notes/{owner['note']}"
+
+    etag = await revalidate(client, url, headers)
+    await touch(update(Profile).where(Profile.user_id == owner["user"]))
+    assert (await client.get(url, headers={**headers, "If-None-Match": etag})).status_code == 200
+
+
+async def test_if_none_match_star_does_not_hide_a_missing_note(client, auth_headers, owner):
+    headers = {**await auth_headers(owner["user"]), "If-None-Match": "*"}
+    assert (await client.get(f"/api/v1/notes/{owner['note']}", headers=headers)).status_code == 304
+    assert (await client.get(f"/api/v1/notes/{owner['note'] + 10_000}", headers=headers)).status_code == 404
+
+
+async def test_tag_renames_invalidate_the_note_list_etag(client, auth_headers, owner):
+    async with AsyncSessionLocal() as session:
+        tag = Tag(name=f"etag-{uuid4().hex[:8]}", updated_at=LONG_AGO)
+        session.add(tag)
+        await session.flush()
+        await session.execute(note_tag_table.insert().values(note_id=owner["note"], tag_id=tag.id))
+        await session.commit()
+    headers = await auth_headers(owner["user"])
+    url = "/api/v1/notes/"
+
+    etag = await revalidate(client, url, headers)
+    await touch(update(Tag).where(Tag.id == tag.id).values(name=f"{tag.name}-renamed"))
+    response = await client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["data"]["items"][0]["tags"][0]["name"] == f"{tag.name}-renamed"
+
+    etag = await revalidate(client, url, headers)
+    async with AsyncSessionLocal() as session:
+        await session.execute(delete(Tag).where(Tag.id == tag.id))
+        await session.execute(note_tag_table.delete().where(note_tag_table.c.tag_id == tag.id))
+        await session.commit()
+    assert (await client.get(url, headers={**headers, "If-None-Match": etag})).status_code == 200
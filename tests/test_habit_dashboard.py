@@ -0,0 +1,57 @@
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from app.core.security import TokenPrincipal
+from app.models import Habit, HabitCategory
+from app.models.enums import FrequencyType, UserRole
+from app.services.habit_service import HabitService
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def make_user_habits(db):
+    async def make(user_id: int, count: int, **streak) -> TokenPrincipal:
+        category = HabitCategory(name=f"dashboard-{uuid4().hex[:8]}", icon_name="icon", user_id=user_id)
+        db.add(category)
+        await db.flush()
+        db.add_all(
+            Habit(
+                title=f"habit {i}", category_id=category.id, user_id=user_id,
+                frequency_type=FrequencyType.DAILY, frequency_count=1, **streak,
+            )
+            for i in range(count)
+        )
+        await db.flush()
+        db.expunge_all()
+        return TokenPrincipal(user_id, UserRole.USER, False, True)
+
+    return make
+
+
+async def test_dashboard_streak_is_relative_to_the_requested_date(db, make_user_habits):
+    user = await make_user_habits(9161, 1, streak_current=3, streak_longest=5, streak_last_period=date(2024, 3, 9))
+    service = HabitService()
+
+    [habit] = await service.get_dashboard(db, user, date(2024, 3, 10))
+    assert (habit.current_streak, habit.longest_streak) == (3, 5)
+
+    # A whole day went by without a log
+    [habit] = await service.get_dashboard(db, user, date(2024, 3, 11))
+    assert (habit.current_streak, habit.longest_streak) == (0, 5)
+
+
+async def test_dashboard_statements_do_not_grow_with_the_habit_count(db, statements, make_user_habits):
+    one = await make_user_habits(9162, 1)
+    many = await make_user_habits(9163, 5)
+    service = HabitService()
+
+    statements.clear()
+    assert len(await service.get_dashboard(db, one, date(2024, 3, 10))) == 1
+    single = len(statements)
+
+    statements.clear()
+    assert len(await service.get_dashboard(db, many, date(2024, 3, 10))) == 5
+    assert len(statements) == single == 1
@@ -0,0 +1,68 @@
+import base64
+from datetime import date
+
+import pytest
+
+from app.core.db_config import AsyncSessionLocal
+from app.models import Habit, HabitLog
+from app.models.enums import FrequencyType
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("year", [1970, 9999])
+async def test_heatmap_accepts_the_edge_years(client, auth_headers, year):
+    response = await client.get(
+        "/api/v1/habit-logs/heatmap", params={"year": year}, headers=await auth_headers(9001)
+    )
+    assert response.status_code == 200
+    assert response.json()["data"] == []
+
+
+async def log_habit(user_id: int, days: list[date]) -> int:
+    async with AsyncSessionLocal() as session:
+        habit = Habit(
+            title="heatmap", category_id=1, user_id=user_id,
+            frequency_type=FrequencyType.DAILY, frequency_count=1,
+        )
+        session.add(habit)
+        await session.flush()
+        session.add_all(HabitLog(habit_id=habit.id, completed_date=day) for day in days)
+        await session.commit()
+        return habit.id
+
+
+def bitmap_days(bitmap: str, days: int) -> list[int]:
+    packed = base64.b64decode(bitmap)
+    assert len(packed) == (days + 7) // 8
+    return [i for i in range(len(packed) * 8) if packed[i >> 3] >> (i & 7) & 1]
+
+
+@pytest.mark.parametrize(
+    ("user_id", "year", "days", "ranges"),
+    [
+        (9002, 2024, 366, [[0, 2], [8, 1], [365, 1]]),
+        (9003, 2023, 365, [[0, 2], [8, 1], [364, 1]]),
+    ],
+)
+async def test_heatmap_encodings(client, auth_headers, user_id, year, days, ranges):
+    habit_id = await log_habit(
+        user_id, [date(year, 1, 1), date(year, 1, 2), date(year, 1, 9), date(year, 12, 31)]
+    )
+    headers = await auth_headers(user_id)
+    day_indexes = [first + offset for first, length in ranges for offset in range(length)]
+
+    response = await client.get(
+        "/api/v1/habit-logs/heatmap", params={"year": year, "encoding": "ranges"}, headers=headers
+    )
+    assert response.status_code == 200
+    [heatmap] = response.json()["data"]
+    assert heatmap == {"habit_id": habit_id, "year": year, "days": days, "completed": 4, "ranges": ranges}
+
+    response = await client.get("/api/v1/habit-logs/heatmap", params={"year": year}, headers=headers)
+    assert response.status_code == 200
+    [heatmap] = response.json()["data"]
+    assert heatmap["days"] == days
+    assert "ranges" not in heatmap
+    # Bit i is day-of-year i, least significant bit first
+    assert bitmap_days(heatmap["bitmap"], days) == day_indexes
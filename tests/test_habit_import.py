@@ -0,0 +1,79 @@
+import json
+
+import pytest
+from sqlalchemy import select
+
+from app.models import Habit, HabitCategory, HabitLog
+from app.services.habit_transfer_service import HabitTransferService
+from app.utils.common import CustomException
+
+pytestmark = pytest.mark.anyio
+
+USER_ID = 8001
+
+
+async def body(*records):
+    yield "".join(json.dumps(record) + "\n" for record in records).encode()
+
+
+def habit_record(habit_id, category_id):
+    return {
+        "type": "habit",
+        "id": habit_id,
+        "title": f"imported {habit_id}",
+        "category_id": category_id,
+        "frequency_type": "daily",
+        "frequency_count": 1,
+    }
+
+
+def log_record(habit_id, day):
+    return {"type": "log", "habit_id": habit_id, "completed_date": f"2024-02-{day:02d}"}
+
+
+@pytest.fixture
+async def category(db):
+    category = HabitCategory(name="import", icon_name="icon", user_id=USER_ID)
+    db.add(category)
+    await db.flush()
+    return category
+
+
+async def logged_days(db, habit_id):
+    result = await db.execute(select(HabitLog.completed_date).where(HabitLog.habit_id == habit_id))
+    return sorted(day.day for day in result.scalars())
+
+
+async def test_logs_follow_the_habits_of_the_file(db, category):
+    service = HabitTransferService(db)
+    result = await service.import_records(
+        USER_ID, body(habit_record(900001, category.id), log_record(900001, 1), log_record(900001, 2))
+    )
+    assert (result.habits_created, result.logs_inserted) == (1, 2)
+    created = (await db.execute(select(Habit.id).where(Habit.user_id == USER_ID))).scalar_one()
+    assert await logged_days(db, created) == [1, 2]
+
+
+async def test_log_with_the_new_id_of_an_imported_habit_is_rejected(db, category):
+    service = HabitTransferService(db)
+    # The next habit id, which the habit below is going to get
+    next_id = ((await db.execute(select(Habit.id).order_by(Habit.id.desc()).limit(1))).scalar() or 0) + 1
+    with pytest.raises(CustomException) as exc:
+        await service.import_records(
+            USER_ID, body(habit_record(next_id + 500, category.id), log_record(next_id, 1))
+        )
+    assert exc.value.status_code == 400
+
+
+async def test_logs_only_file_uses_existing_habits(db, category):
+    habit = Habit(title="existing", category_id=category.id, user_id=USER_ID, frequency_type="daily", frequency_count=1)
+    db.add(habit)
+    await db.flush()
+
+    result = await HabitTransferService(db).import_records(USER_ID, body(log_record(habit.id, 3)))
+    assert result.logs_inserted == 1
+    assert await logged_days(db, habit.id) == [3]
+
+    with pytest.raises(CustomException) as exc:
+        await HabitTransferService(db).import_records(USER_ID, body(log_record(habit.id, 4), habit_record(1, category.id)))
+    assert exc.value.status_code == 400
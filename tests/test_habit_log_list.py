@@ -0,0 +1,88 @@
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.core.db_config import engine
+from app.models import Habit, HabitLog
+from app.models.enums import FrequencyType
+from app.repositories.habit_log_repository import HabitLogRepository
+from app.services.habit_log_service import HabitLogService
+
+pytestmark = pytest.mark.anyio
+
+USER_ID = 7001
+
+
+async def add_habits(db, user_id, days):
+    habits = [
+        Habit(title=f"habit {i}", category_id=1, user_id=user_id, frequency_type=FrequencyType.DAILY, frequency_count=1)
+        for i in range(3)
+    ]
+    db.add_all(habits)
+    await db.flush()
+    start = date(2024, 1, 1)
+    db.add_all(
+        HabitLog(habit_id=habit.id, completed_date=start + timedelta(days=day))
+        for habit in habits
+        for day in range(days)
+    )
+    await db.flush()
+    return habits
+
+
+async def test_pages_follow_the_habit_day_order_without_gaps(db):
+    habits = await add_habits(db, USER_ID, days=10)
+    await add_habits(db, USER_ID + 1, days=2)
+    service = HabitLogService(db)
+
+    seen, cursor = [], None
+    while True:
+        page = await service.list_logs(USER_ID, cursor=cursor, limit=7)
+        seen.extend((log.habit_id, log.completed_date) for log in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    expected = sorted(
+        ((habit.id, date(2024, 1, 1) + timedelta(days=day)) for habit in habits for day in range(10)),
+        reverse=True,
+    )
+    assert seen == expected
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"habit_ids": "many"},
+        {"date_from": date(2024, 1, 3), "date_to": date(2024, 1, 8)},
+        {"after": "cursor"},
+    ],
+)
+async def test_query_plan_reads_the_composite_index_without_sorting(db, filters):
+    habits = await add_habits(db, USER_ID + 2, days=3)
+    if filters.get("habit_ids") == "many":
+        filters["habit_ids"] = [habit.id for habit in habits[:2]]
+    if filters.get("after") == "cursor":
+        filters["after"] = (habits[1].id, date(2024, 1, 2))
+
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        await HabitLogRepository(db).list_for_user(USER_ID + 2, **filters)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    statement, parameters = captured[-1]
+    connection = await db.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    plan = [row[3] for row in result]
+    # SQLite names the index of the (habit_id, completed_date) unique constraint sqlite_autoindex_habit_logs_N
+    assert any(step.startswith("SEARCH habit_logs USING INDEX") and "(habit_id=?" in step for step in plan), plan
+    assert not any("TEMP B-TREE" in step for step in plan), plan
+    assert not any(step.startswith("SCAN habit_logs") for step in plan), plan
@@ -0,0 +1,39 @@
+import pytest
+from sqlalchemy import text, update
+
+from app.models import Note
+from app.services.note_service import NoteService
+
+pytestmark = pytest.mark.anyio
+
+USER_ID = 9201
+
+
+async def test_pages_of_notes_updated_in_the_same_second(db, statements):
+    notes = [Note(title=f"note {i}", user_id=USER_ID) for i in range(5)]
+    db.add_all(notes)
+    await db.flush()
+    # The layout func.now() stores on SQLite, which the cursor has to compare against
+    same_second = {notes[0].id: "2024-05-01 10:00:01", **{note.id: "2024-05-01 10:00:00" for note in notes[1:]}}
+    for note_id, updated_at in same_second.items():
+        await db.execute(
+            update(Note).where(Note.id == note_id).values(updated_at=text(f"'{updated_at}'"))
+            .execution_options(synchronize_session=False)
+        )
+    expected = sorted(same_second, key=lambda note_id: (same_second[note_id], note_id), reverse=True)
+
+    service = NoteService(db)
+    seen, cursor = [], None
+    # A cursor that repeats a page would never end
+    for _ in range(len(expected)):
+        statements.clear()
+        page = await service.list_notes(USER_ID, cursor, limit=2)
+        # The summary select and one batched tag select
+        assert len(statements) == 2
+        seen.extend(item.id for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert cursor is None
+    assert seen == expected
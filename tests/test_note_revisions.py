@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from app.core.db_config import AsyncSessionLocal
+from app.repositories.note_revision_repository import NoteRevisionRepository
+from app.schemas.note_schema import NoteCreate, NoteUpdate
+from app.services.note_service import NoteService
+
+pytestmark = pytest.mark.anyio
+
+USER_ID = 9101
+
+
+async def test_concurrent_updates_record_consecutive_versions(db):
+    async with AsyncSessionLocal() as session:
+        note = await NoteService(session).create_note(NoteCreate(title="draft", description="one two three"), USER_ID)
+        await session.commit()
+
+    first_locked = asyncio.Event()
+
+    async def update(description, hold):
+        async with AsyncSessionLocal() as session:
+            service = NoteService(session)
+            if hold:
+                # Take the lock, then let the other update start while it is held
+                await service.update_note(note.id, USER_ID, NoteUpdate(title="draft", description=description))
+                first_locked.set()
+                await asyncio.sleep(0.2)
+            else:
+                await first_locked.wait()
+                await service.update_note(note.id, USER_ID, NoteUpdate(title="draft", description=description))
+            await session.commit()
+
+    await asyncio.gather(update("one two three four", hold=True), update("zero one two three", hold=False))
+
+    versions = await NoteRevisionRepository.list_for_note(db, note.id)
+    assert [row["version"] for row in versions] == [3, 2, 1]
+    contents = [(await NoteRevisionRepository.reconstruct(db, note.id, version))[0] for version in (1, 2, 3)]
+    assert [content["description"] for content in contents] == [
+        "one two three",
+        "one two three four",
+        "zero one two three",
+    ]
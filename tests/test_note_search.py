@@ -0,0 +1,120 @@
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, delete, text, update
+
+from app.core.db_config import Base
+from app.core.settings import setting
+from app.models import Note
+from app.models.note_search import SQLITE_FTS_TABLE, ensure_note_search, is_note_search_object, postgres_ddl
+from app.repositories.note_repositories import NoteRepository
+
+
+@pytest.fixture
+def migrated_engine(tmp_path):
+    """A database shaped like an alembic upgrade: tables only, no note search objects."""
+    sync_engine = create_engine(f"sqlite:///{tmp_path / 'migrated.db'}")
+    with sync_engine.begin() as conn:
+        Base.metadata.create_all(conn)
+        conn.execute(text(f"DROP TABLE {SQLITE_FTS_TABLE}"))
+        for trigger in ("notes_fts_ai", "notes_fts_ad", "notes_fts_au"):
+            conn.execute(text(f"DROP TRIGGER {trigger}"))
+        conn.execute(Note.__table__.insert().values(title="Grocery list", description="apples", user_id=1))
+    yield sync_engine
+    sync_engine.dispose()
+
+
+def search(conn, term):
+    return conn.execute(
+        text(f"SELECT rowid FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH :term"), {"term": term}
+    ).all()
+
+
+def test_ensure_creates_and_fills_the_index_of_a_migrated_database(migrated_engine):
+    with migrated_engine.begin() as conn:
+        ensure_note_search(conn)
+        assert len(search(conn, "grocery")) == 1
+        # Idempotent, and the triggers keep it in sync from now on
+        ensure_note_search(conn)
+        conn.execute(Note.__table__.insert().values(title="Grocery run", user_id=1))
+        assert len(search(conn, "grocery")) == 2
+
+
+def test_autogenerate_leaves_the_search_objects_alone(migrated_engine):
+    with migrated_engine.begin() as conn:
+        ensure_note_search(conn)
+        context = MigrationContext.configure(
+            conn,
+            opts={"include_object": lambda obj, name, type_, reflected, compare_to: not is_note_search_object(name, type_)},
+        )
+        diff = compare_metadata(context, Base.metadata)
+    assert [op for op in diff if op[0] == "remove_table"] == []
+
+
+def test_search_language_is_validated(monkeypatch):
+    monkeypatch.setattr(setting, "NOTE_SEARCH_LANGUAGE", "english'); DROP TABLE notes; --")
+    with pytest.raises(ValueError):
+        postgres_ddl()
+    monkeypatch.setattr(setting, "NOTE_SEARCH_LANGUAGE", "simple")
+    assert "to_tsvector('simple'" in postgres_ddl()[0]
+
+
+USER_ID = 9191
+
+
+@pytest.fixture
+async def notes(db):
+    async def make(*rows, user_id=USER_ID):
+        created = [Note(title=title, description=description, user_id=user_id) for title, description in rows]
+        db.add_all(created)
+        await db.flush()
+        return [note.id for note in created]
+
+    return make
+
+
+async def hits(db, query, user_id=USER_ID):
+    return [row["id"] for row in await NoteRepository.search(db, user_id, query)]
+
+
+@pytest.mark.anyio
+async def test_search_matches_every_term_as_a_prefix(db, notes):
+    grocery, hardware = await notes(("Grocery list", "apples and pears"), ("Hardware store", "screws and apples"))
+    assert await hits(db, "groc") == [grocery]
+    assert sorted(await hits(db, "appl")) == sorted([grocery, hardware])
+    assert await hits(db, "apples screw") == [hardware]
+    assert await hits(db, "grocery screws") == []
+
+
+@pytest.mark.anyio
+async def test_punctuation_only_queries_find_nothing(db, client, auth_headers, notes):
+    await notes(("Grocery list", "apples"))
+    assert await hits(db, '"*-:()') == []
+    response = await client.get("/api/v1/notes/search", params={"q": "?!"}, headers=await auth_headers(USER_ID))
+    assert response.status_code == 200
+    assert response.json()["data"] == []
+
+
+@pytest.mark.anyio
+async def test_search_is_scoped_to_the_user(db, notes):
+    [mine] = await notes(("Grocery list", None))
+    await notes(("Grocery run", None), user_id=USER_ID + 1)
+    assert await hits(db, "grocery") == [mine]
+
+
+@pytest.mark.anyio
+async def test_title_hits_rank_above_description_hits(db, notes):
+    # The description-only hit is inserted last, so the id tiebreak alone would put it first
+    in_title, in_description = await notes(("Grocery list", "weekly"), ("Weekend", "grocery grocery list"))
+    assert await hits(db, "grocery") == [in_title, in_description]
+
+
+@pytest.mark.anyio
+async def test_index_follows_note_updates_and_deletes(db, notes):
+    [note_id] = await notes(("Grocery list", "apples"))
+    await db.execute(update(Note).where(Note.id == note_id).values(title="Hardware store", description="screws"))
+    assert await hits(db, "grocery") == []
+    assert await hits(db, "hardware screws") == [note_id]
+
+    await db.execute(delete(Note).where(Note.id == note_id))
+    assert await hits(db, "hardware") == []
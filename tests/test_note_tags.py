@@ -0,0 +1,42 @@
+import pytest
+from sqlalchemy import delete, update
+
+from app.core.cache import tag_cache
+from app.models import Tag
+from app.repositories.note_repositories import NoteRepository
+from app.schemas.note_schema import NoteCreate, NoteUpdate
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_cached_id_of_a_deleted_tag_is_resolved_again(db):
+    first = await NoteRepository.create(db, NoteCreate(title="one", tag_names=["stale-tag"]), user_id=1)
+    old_id = first.tag_ids[0]
+    tag_cache.set("stale-tag", old_id)
+
+    # Deleted through another worker, whose invalidation never reaches this cache
+    await db.execute(delete(Tag).where(Tag.id == old_id))
+
+    second = await NoteRepository.create(db, NoteCreate(title="two", tag_names=["stale-tag"]), user_id=1)
+    assert [tag.name for tag in second.tags] == ["stale-tag"]
+    assert await db.get(Tag, second.tag_ids[0]) is not None
+
+
+async def test_cached_id_of_a_renamed_tag_is_resolved_again(db):
+    note = await NoteRepository.create(db, NoteCreate(title="one", tag_names=["old-name"]), user_id=1)
+    old_id = note.tag_ids[0]
+    tag_cache.set("old-name", old_id)
+
+    # Renamed through another worker, whose cache still maps the old name to this id
+    await db.execute(update(Tag).where(Tag.id == old_id).values(name="new-name"))
+
+    second = await NoteRepository.create(db, NoteCreate(title="two", tag_names=["old-name"]), user_id=1)
+    assert [tag.name for tag in second.tags] == ["old-name"]
+    assert second.tag_ids[0] != old_id
+
+    # Replacing the tags of the first note also drops the renamed tag it still carries
+    tag_cache.set("old-name", old_id)
+    updated = await NoteRepository.update(
+        db, note, NoteUpdate(title="one", description=None, tag_names=["old-name"])
+    )
+    assert updated.tag_ids == second.tag_ids
@@ -0,0 +1,46 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.core.db_config import AsyncSessionLocal, engine
+from app.models import Notification, Reminder
+from app.services.reminder_scheduler import ReminderScheduler, utcnow
+
+USER_ID = 9301
+
+
+async def fire_one(scheduler: ReminderScheduler, title: str) -> list[str]:
+    async with AsyncSessionLocal() as session:
+        reminder = Reminder(title=title, reminder_date=utcnow() + timedelta(seconds=0.3), user_id=USER_ID)
+        session.add(reminder)
+        await session.commit()
+    scheduler.start()
+    try:
+        await asyncio.sleep(1.5)
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(select(Notification.title).where(Notification.title == title))
+            return result.scalars().all()
+    finally:
+        await scheduler.stop()
+        await engine.dispose()
+
+
+def test_scheduler_restarts_on_a_new_event_loop():
+    # Like a second lifespan (another TestClient, or a restart in the same process)
+    scheduler = ReminderScheduler(lookahead_seconds=60)
+    assert asyncio.run(fire_one(scheduler, "first loop")) == ["first loop"]
+    assert asyncio.run(fire_one(scheduler, "second loop")) == ["second loop"]
+
+
+@pytest.mark.anyio
+async def test_fired_reminders_can_be_read_back(client, auth_headers, db):
+    db.add(Notification(user_id=USER_ID, title="Water plants", message="", type="reminder", channel="in_app"))
+    await db.commit()
+
+    response = await client.get("/api/v1/notifications/", headers=await auth_headers(USER_ID))
+    assert response.status_code == 200
+    notification = response.json()["data"][0]
+    assert notification["type"] == "reminder"
+    assert notification["createdAt"]
@@ -0,0 +1,160 @@
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+
+from app.core.db_config import AsyncSessionLocal
+from app.models import Habit
+from app.models.enums import FrequencyType
+from app.schemas.habit_log_schema import HabitLogClear, HabitLogCreate, HabitLogMultipleCreate
+from app.services.habit_log_service import HabitLogService
+from app.utils.habit_periods import compute_streaks
+
+USER_ID = 9401
+DAILY, WEEKLY, MONTHLY = FrequencyType.DAILY, FrequencyType.WEEKLY, FrequencyType.MONTHLY
+# A Monday
+START = date(2024, 1, 1)
+
+
+def days(*offsets):
+    return [START + timedelta(days=offset) for offset in offsets]
+
+
+class TestComputeStreaks:
+    def test_no_logs(self):
+        assert compute_streaks([], DAILY, 1) == (0, 0, None)
+
+    def test_gap_starts_a_new_run(self):
+        assert compute_streaks(days(0, 1, 2, 4, 5), DAILY, 1) == (2, 3, START + timedelta(days=5))
+
+    def test_weekly_target_counts_only_complete_weeks(self):
+        # Weeks 1 and 2 have three logs, week 3 only two
+        logs = days(0, 2, 4, 7, 8, 9, 14, 15)
+        assert compute_streaks(logs, WEEKLY, 3) == (2, 2, START + timedelta(days=7))
+
+    def test_monthly_runs_cross_the_year(self):
+        logs = [date(2023, 12, 5), date(2024, 1, 20), date(2024, 2, 1), date(2024, 4, 1)]
+        assert compute_streaks(logs, MONTHLY, 1) == (1, 3, date(2024, 4, 1))
+
+    def test_target_is_capped_by_the_period_length(self):
+        # A daily habit can only be logged once a day
+        assert compute_streaks(days(0, 1), DAILY, 5) == (2, 2, START + timedelta(days=1))
+
+
+@pytest.fixture
+async def make_habit(db):
+    async def make(frequency_type=DAILY, frequency_count=1):
+        habit = Habit(
+            title="streak", category_id=1, user_id=USER_ID,
+            frequency_type=frequency_type, frequency_count=frequency_count,
+        )
+        db.add(habit)
+        await db.flush()
+        return habit
+
+    return make
+
+
+def streaks(habit):
+    return habit.streak_current, habit.streak_longest, habit.streak_last_period
+
+
+async def assert_matches_recompute(service, habit):
+    logged = await service.repository.completed_dates(habit.id)
+    assert streaks(habit) == compute_streaks(logged, habit.frequency_type, habit.frequency_count)
+
+
+@pytest.mark.anyio
+async def test_incremental_adds_and_gaps(db, make_habit):
+    habit = await make_habit()
+    service = HabitLogService(db)
+    for day in days(0, 1, 2, 4):
+        await service.create_log(USER_ID, HabitLogCreate(habit_id=habit.id, completed_date=day))
+        await assert_matches_recompute(service, habit)
+    assert streaks(habit) == (1, 3, START + timedelta(days=4))
+
+
+@pytest.mark.anyio
+async def test_backfill_merges_two_runs(db, make_habit):
+    habit = await make_habit()
+    service = HabitLogService(db)
+    await service.add_multiple_logs(USER_ID, HabitLogMultipleCreate(habit_ids=[habit.id], completed_dates=days(0, 1, 3, 4)))
+    assert streaks(habit) == (2, 2, START + timedelta(days=4))
+
+    await service.create_log(USER_ID, HabitLogCreate(habit_id=habit.id, completed_date=START + timedelta(days=2)))
+    assert streaks(habit) == (5, 5, START + timedelta(days=4))
+    await assert_matches_recompute(service, habit)
+
+
+@pytest.mark.anyio
+async def test_weekly_target_is_reached_by_the_last_log_of_the_week(db, make_habit):
+    habit = await make_habit(WEEKLY, 2)
+    service = HabitLogService(db)
+    await service.create_log(USER_ID, HabitLogCreate(habit_id=habit.id, completed_date=START))
+    assert streaks(habit) == (0, 0, None)
+    await service.create_log(USER_ID, HabitLogCreate(habit_id=habit.id, completed_date=START + timedelta(days=3)))
+    assert streaks(habit) == (1, 1, START)
+    await service.add_multiple_logs(USER_ID, HabitLogMultipleCreate(habit_ids=[habit.id], completed_dates=days(7, 8)))
+    assert streaks(habit) == (2, 2, START + timedelta(days=7))
+    await assert_matches_recompute(service, habit)
+
+
+@pytest.mark.anyio
+async def test_monthly_target(db, make_habit):
+    habit = await make_habit(MONTHLY, 2)
+    service = HabitLogService(db)
+    for day in (date(2024, 1, 3), date(2024, 1, 20), date(2024, 2, 2), date(2024, 2, 28)):
+        await service.create_log(USER_ID, HabitLogCreate(habit_id=habit.id, completed_date=day))
+    assert streaks(habit) == (2, 2, date(2024, 2, 1))
+    await assert_matches_recompute(service, habit)
+
+
+@pytest.mark.anyio
+async def test_removal_that_breaks_a_completed_period(db, make_habit):
+    habit = await make_habit(WEEKLY, 2)
+    service = HabitLogService(db)
+    await service.add_multiple_logs(
+        USER_ID, HabitLogMultipleCreate(habit_ids=[habit.id], completed_dates=days(0, 1, 7, 8, 14, 15))
+    )
+    assert streaks(habit) == (3, 3, START + timedelta(days=14))
+
+    # Week 2 drops below its target and splits the run
+    week_two = await service.list_logs(USER_ID, [habit.id], START + timedelta(days=7), START + timedelta(days=7))
+    await service.delete_log(USER_ID, week_two.items[0].id)
+    assert streaks(habit) == (1, 1, START + timedelta(days=14))
+    await assert_matches_recompute(service, habit)
+
+    # Clearing week 3 leaves week 1 as the only completed period
+    await service.clear_logs(
+        USER_ID, HabitLogClear(habit_ids=[habit.id], date_from=START + timedelta(days=14), date_to=START + timedelta(days=20))
+    )
+    assert streaks(habit) == (1, 1, START)
+    await assert_matches_recompute(service, habit)
+
+
+@pytest.mark.anyio
+async def test_concurrent_log_writes_of_a_habit_both_count(db):
+    async with AsyncSessionLocal() as session:
+        habit = Habit(title="race", category_id=1, user_id=USER_ID, frequency_type=DAILY, frequency_count=1)
+        session.add(habit)
+        await session.commit()
+
+    first_locked = asyncio.Event()
+
+    async def log(day, hold):
+        async with AsyncSessionLocal() as session:
+            service = HabitLogService(session)
+            if not hold:
+                await first_locked.wait()
+            await service.create_log(USER_ID, HabitLogCreate(habit_id=habit.id, completed_date=day))
+            if hold:
+                # Keep the transaction open while the other write starts
+                first_locked.set()
+                await asyncio.sleep(0.2)
+            await session.commit()
+
+    await asyncio.gather(log(START, hold=True), log(START + timedelta(days=1), hold=False))
+
+    async with AsyncSessionLocal() as session:
+        stored = await session.get(Habit, habit.id)
+        assert streaks(stored) == (2, 2, START + timedelta(days=1))
@@ -0,0 +1,26 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core.db_config import Base
+from app.models.tag import TAG_NAME_LOWER_INDEX, ensure_tag_name_index
+
+
+@pytest.fixture
+def migrated_engine(tmp_path):
+    """A database built without the expression index, as alembic does on SQLite."""
+    sync_engine = create_engine(f"sqlite:///{tmp_path / 'migrated.db'}")
+    with sync_engine.begin() as conn:
+        Base.metadata.create_all(conn)
+        conn.execute(text(f"DROP INDEX {TAG_NAME_LOWER_INDEX.name}"))
+    yield sync_engine
+    sync_engine.dispose()
+
+
+def test_ensure_creates_the_prefix_index_used_by_suggestions(migrated_engine):
+    with migrated_engine.begin() as conn:
+        ensure_tag_name_index(conn)
+        ensure_tag_name_index(conn)
+        plan = conn.execute(
+            text("EXPLAIN QUERY PLAN SELECT id FROM tags WHERE lower(name) >= 'ab' AND lower(name) < 'ac'")
+        ).all()
+    assert any(TAG_NAME_LOWER_INDEX.name in row[3] for row in plan), plan
@@ -0,0 +1,45 @@
+import pytest
+
+from app.repositories.habit_category_repository import HabitCategoryRepository
+from app.repositories.user_repository import UserRepository
+from app.schemas.habit_category_schema import HabitCategoryModelSchema, HabitCategoryPartialRequestSchema
+from app.schemas.notification_schema import NotificationCreate
+from app.services.notification_service import NotificationService
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_habit_category_create_and_update_are_one_statement_each(db, statements):
+    repository = HabitCategoryRepository(db)
+
+    category = await repository.create_habit_category(
+        HabitCategoryModelSchema(name="returning-create", iconName="icon", user_id=1)
+    )
+    assert len(statements) == 1
+    assert category.id is not None and category.created_at is not None
+
+    statements.clear()
+    updated = await repository.update_habit_category_by_id(
+        category.id, HabitCategoryPartialRequestSchema(name="returning-update")
+    )
+    assert len(statements) == 1
+    assert updated.name == "returning-update"
+
+
+async def test_notification_create_is_one_statement(db, statements):
+    notification = await NotificationService(db).create_notification(
+        1, NotificationCreate(title="Hi", message="There", type="reminder")
+    )
+    assert len(statements) == 1
+    assert notification.created_at is not None and notification.updated_at is not None
+
+
+async def test_profile_update_is_one_statement(db, statements):
+    profile = await UserRepository.update_profile(1, "bio", None, db)
+    assert len(statements) == 1
+    assert profile.bio == "bio"
+
+    statements.clear()
+    profile = await UserRepository.update_profile(1, "new bio", None, db)
+    assert len(statements) == 1
+    assert profile.bio == "new bio"